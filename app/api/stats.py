@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Response, status
+
+from core.metrics import render_metrics
+from database.pool import pool_stats
+from service.registry import registry
+
+stats_router = APIRouter(include_in_schema=False)
+
+
+@stats_router.get("/cache-stats", status_code=status.HTTP_200_OK)
+async def cache_stats():
+    return registry.cache_stats()
+
+
+@stats_router.get("/pool-stats", status_code=status.HTTP_200_OK)
+async def database_pool_stats():
+    return pool_stats()
+
+
+@stats_router.get("/metrics")
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
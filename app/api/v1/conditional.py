@@ -0,0 +1,98 @@
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from fastapi import Request, Response
+
+from api.v1.fast_json import FastJSONResponse, page_body, row_body
+from api.v1.preconditions import is_conditional, is_not_modified, not_modified, validator_headers
+from database.replicas import read_replicas
+from database.versions import RowVersion
+from models.paginated_params import PaginatedParams
+from service.services import BaseService
+from service.single_flight import read_flights
+
+# Version and serialized body shared by the concurrent identical reads.
+Flight = tuple[RowVersion, bytes]
+
+
+async def single_row(request: Request, service: BaseService, row_id: UUID) -> Response:
+    """
+    Serve a single record with validators.
+
+    A conditional request is first answered from the record version alone, the
+    record is only read when the client copy is outdated. Concurrent reads of the
+    same record share one read and its serialized body.
+
+    Args:
+        request (Request): The incoming request.
+        service (BaseService): The service of the entity.
+        row_id (UUID): The unique identifier of the record.
+
+    Returns:
+        Response: The serialized record, or a 304 response.
+    """
+    if is_conditional(request):
+        version: RowVersion = await service.get_version(row_id)
+        if is_not_modified(request, version):
+            return not_modified(version)
+
+    key: tuple = (row_id, read_replicas.reads_primary())
+    read = partial(_read_single, service, row_id)
+    version, body = await read_flights.run(service.table_name, "single", key, read)
+    return FastJSONResponse(body, headers=validator_headers(version))
+
+
+async def row_list(
+    request: Request,
+    service: BaseService,
+    query_params: PaginatedParams,
+    filters: dict[str, Any] | None = None,
+) -> Response:
+    """
+    Serve a page of records with validators of the whole table.
+
+    The table version is read before the page, so a write racing with the request
+    can only make the validator older than the body, never newer. The page's own
+    count goes into the validator, the rows are not counted a second time. Concurrent
+    reads of the same page share one read of both and the serialized body. A
+    conditional request is first answered from the version alone.
+
+    Args:
+        request (Request): The incoming request.
+        service (BaseService): The service of the entity.
+        query_params (PaginatedParams): The pagination parameters.
+        filters (dict[str, Any] | None): ORM lookups the records must match.
+
+    Returns:
+        Response: The serialized page, or a 304 response.
+    """
+    if is_conditional(request):
+        version: RowVersion = await service.get_list_version(query_params, filters)
+        if is_not_modified(request, version):
+            return not_modified(version)
+
+    key: tuple = (
+        query_params.page,
+        query_params.size,
+        query_params.cursor,
+        query_params.count,
+        frozenset((filters or {}).items()),
+        read_replicas.reads_primary(),
+    )
+    read = partial(_read_page, service, query_params, filters)
+    version, body = await read_flights.run(service.table_name, "list", key, read)
+    return FastJSONResponse(body, headers=validator_headers(version))
+
+
+async def _read_single(service: BaseService, row_id: UUID) -> Flight:
+    row = await service.get_single(row_id)
+    return service.version_of(row), row_body(row, service.return_model)
+
+
+async def _read_page(service: BaseService, query_params: PaginatedParams, filters: dict[str, Any] | None) -> Flight:
+    # The table version is read first, a write racing with the page can only make it older.
+    table_version: RowVersion = await service.get_table_version()
+    page: dict = await service.get_all(query_params, filters)
+    page_version: RowVersion = service.list_version(table_version, page["total_result"], query_params, filters)
+    return page_version, page_body(page, service.return_model)
@@ -0,0 +1,130 @@
+from fastapi import APIRouter, Body, Query, Request, Response, status, Depends
+from fastapi.responses import StreamingResponse
+from api.v1.export import EXPORT_CHUNK_SIZE, FileFormat, export_response
+from api.v1.fast_json import batch_response
+from api.v1.dog.models import DogReturnModel
+from models.batch import BatchIdsParams, BatchRequest, BatchResponse
+from models.bulk import MAX_BULK_ITEMS, BulkResponse, ImportReport
+from service.importer import import_records, read_records
+from service.service import get_dog_service
+
+# Routes over many dogs at once, included by ``dogs_router`` ahead of ``/{dog_id}/``.
+dogs_batch_router = APIRouter()
+DOG_SERVICE = Depends(get_dog_service)
+
+
+@dogs_batch_router.get(
+    "/export/",
+    status_code=status.HTTP_200_OK,
+    description="Stream all dogs as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_dogs(
+    export_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    service=DOG_SERVICE,
+) -> StreamingResponse:
+    """
+    Stream every dog as a file, read from the database in fixed-size chunks.
+
+    Args:
+        export_format (FileFormat): NDJSON or CSV.
+        service (DogService): Dependency for dog-related operations.
+
+    Returns:
+        StreamingResponse: The streamed file.
+    """
+    return export_response(service.export(EXPORT_CHUNK_SIZE), export_format, "dogs")
+
+
+@dogs_batch_router.get(
+    "/batch/",
+    response_model=BatchResponse[DogReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many dogs by id, missing ones are reported",
+)
+async def get_dogs_batch(
+    batch_ids: BatchIdsParams = Depends(),
+    service=DOG_SERVICE,
+) -> Response:
+    """
+    Read many dogs by id with a single query.
+
+    Args:
+        batch_ids (BatchIdsParams): The ids, comma separated or repeated.
+        service (DogService): Dependency for dog-related operations.
+
+    Returns:
+        Response: Found and missing counters and, keyed by id, every dog or its 404.
+    """
+    return batch_response(await service.get_many(batch_ids.ids), service.return_model)
+
+
+@dogs_batch_router.post(
+    "/bulk/",
+    response_model=BulkResponse,
+    status_code=status.HTTP_200_OK,
+    description="Create many dogs at once",
+)
+async def create_dogs(
+    dogs: list[dict] = Body(..., max_length=MAX_BULK_ITEMS),
+    service=DOG_SERVICE,
+) -> dict:
+    """
+    Create many dogs in one request.
+
+    Args:
+        dogs (list[dict]): The data for the new dogs.
+        service (DogService): Dependency for dog-related operations.
+
+    Returns:
+        dict: The identifier or the error of every dog, in request order.
+    """
+    return await service.create_many(dogs)
+
+
+@dogs_batch_router.post(
+    "/batch/",
+    response_model=BatchResponse[DogReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many dogs by the ids of the request body, missing ones are reported",
+)
+async def post_dogs_batch(
+    batch: BatchRequest,
+    service=DOG_SERVICE,
+) -> Response:
+    """
+    Read many dogs by id with a single query, for lists too long for a URL.
+
+    Args:
+        batch (BatchRequest): The ids.
+        service (DogService): Dependency for dog-related operations.
+
+    Returns:
+        Response: Found and missing counters and, keyed by id, every dog or its 404.
+    """
+    return batch_response(await service.get_many(batch.ids), service.return_model)
+
+
+@dogs_batch_router.post(
+    "/import/",
+    response_model=ImportReport,
+    status_code=status.HTTP_200_OK,
+    description="Import dogs from an NDJSON or CSV request body",
+)
+async def import_dogs(
+    request: Request,
+    import_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    service=DOG_SERVICE,
+) -> ImportReport:
+    """
+    Import dogs streamed in the request body, validated and committed in batches.
+
+    Args:
+        request (Request): The request whose body is the file.
+        import_format (FileFormat): NDJSON or CSV.
+        service (DogService): Dependency for dog-related operations.
+
+    Returns:
+        ImportReport: Counters, throughput and the rejected lines.
+    """
+    return await import_records(service, read_records(request.stream(), import_format))
@@ -1,11 +1,12 @@
 import uuid
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Request, Response, status, Depends
+from api.v1.conditional import row_list, single_row
+from api.v1.dog.dog_batch import dogs_batch_router
 from api.v1.dog.models import (
     DogReturnModel,
     DogModel,
     IDModel,
 )
-from database.models import DogTable
 from models.paginated_params import (
     PaginatedParams,
     PaginationResponse,
@@ -13,29 +14,34 @@ from models.paginated_params import (
 from service.service import get_dog_service
 
 dogs_router = APIRouter(prefix="/api/v1/dogs", tags=["dogs"])
+dogs_router.include_router(dogs_batch_router)
+DOG_SERVICE = Depends(get_dog_service)
 
 
 @dogs_router.get(
     "/",
-    response_model=PaginationResponse,
+    response_model=PaginationResponse[DogReturnModel],
     status_code=status.HTTP_200_OK,
     description="List of all dogs",
 )
 async def get_all_dogs(
-    service=Depends(get_dog_service),
+    request: Request,
+    service=DOG_SERVICE,
     query_params: PaginatedParams = Depends(),
-) -> dict:
+) -> Response:
     """
     Retrieve a paginated list of all dogs.
 
     Args:
+        request (Request): The request, its ``If-None-Match``/``If-Modified-Since`` are honored.
         query_params (PaginatedParams): Pagination parameters including page number and page size.
         service (DogService): Dependency for dog-related operations.
 
     Returns:
-        PaginateResponse: A response model containing the list of dogs and pagination information.
+        Response: The page of dogs and pagination information serialized with the ``ETag``/``Last-Modified``
+        headers, or an empty 304 response when the client copy is current.
     """
-    return await service.get_all(query_params)
+    return await row_list(request, service, query_params)
 
 
 @dogs_router.get(
@@ -46,19 +52,22 @@ async def get_all_dogs(
 )
 async def get_single_dog(
     dog_id: uuid.UUID,
-    service=Depends(get_dog_service),
-) -> DogTable:
+    request: Request,
+    service=DOG_SERVICE,
+) -> Response:
     """
     Retrieve a single dog's details by its ID.
 
     Args:
         dog_id (uuid.UUID): The unique identifier of the dog.
+        request (Request): The request, its ``If-None-Match``/``If-Modified-Since`` are honored.
         service (DogService): Dependency for dog-related operations.
 
     Returns:
-        DogTable: The details of the requested dog.
+        Response: The details of the requested dog with the ``ETag``/``Last-Modified`` headers,
+        or an empty 304 response when the client copy is current.
     """
-    return await service.get_single(dog_id)
+    return await single_row(request, service, dog_id)
 
 
 @dogs_router.post(
@@ -69,7 +78,7 @@ async def get_single_dog(
 )
 async def create_dog(
     dog: DogModel,
-    service=Depends(get_dog_service),
+    service=DOG_SERVICE,
 ) -> dict:
     """
     Create a new dog entry in the database.
@@ -92,7 +101,7 @@ async def create_dog(
 async def update_dog(
     dog_id: uuid.UUID,
     dog: DogModel,
-    service=Depends(get_dog_service),
+    service=DOG_SERVICE,
 ):
     """
     Update the details of an existing dog.
@@ -115,7 +124,7 @@ async def update_dog(
 )
 async def delete_dog(
     dog_id: uuid.UUID,
-    service=Depends(get_dog_service),
+    service=DOG_SERVICE,
 ):
     """
     Delete a dog entry from the database.
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import date
+from enum import Enum
+from functools import partial
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping
+from uuid import UUID
+
+from fastapi.responses import StreamingResponse
+
+from core.encoders import json_default
+
+EXPORT_CHUNK_SIZE = 1000
+NDJSON_LINE = "{0}\n"
+CONTENT_DISPOSITION = 'attachment; filename="{0}.{1}"'
+TO_JSON = partial(json.dumps, default=json_default, ensure_ascii=False)
+
+
+class FileFormat(Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES: Mapping[FileFormat, str] = MappingProxyType({
+    FileFormat.ndjson: "application/x-ndjson",
+    FileFormat.csv: "text/csv; charset=utf-8",
+})
+
+
+async def _ndjson_lines(chunks: AsyncIterator[list[dict]]) -> AsyncIterator[str]:
+    async for rows in chunks:
+        yield "".join(map(NDJSON_LINE.format, map(TO_JSON, rows)))
+
+
+def _csv_value(cell: Any) -> Any:
+    if cell is None:
+        return ""
+    if isinstance(cell, (UUID, date, Enum)):
+        return json_default(cell)
+    return cell
+
+
+def _csv_row(row: dict) -> dict:
+    return {column: _csv_value(cell) for column, cell in row.items()}
+
+
+async def _csv_lines(chunks: AsyncIterator[list[dict]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer: csv.DictWriter | None = None
+    async for rows in chunks:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+            writer.writeheader()
+        writer.writerows(map(_csv_row, rows))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_response(chunks: AsyncIterator[list[dict]], export_format: FileFormat, name: str) -> StreamingResponse:
+    """
+    Stream rows as an NDJSON or CSV download.
+
+    Every chunk read from the database is encoded and sent before the next one is
+    read, so memory stays flat whatever the number of rows.
+
+    Args:
+        chunks (AsyncIterator[list[dict]]): Chunks of plain column values.
+        export_format (FileFormat): The file format.
+        name (str): The file name without extension.
+
+    Returns:
+        StreamingResponse: The streamed file.
+    """
+    lines = _csv_lines(chunks) if export_format == FileFormat.csv else _ndjson_lines(chunks)
+    return StreamingResponse(
+        lines,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": CONTENT_DISPOSITION.format(name, export_format.value)},
+    )
@@ -44,7 +44,7 @@ class OrderUpdateModel(BaseModel):
 
 
 class NewOrder(WalkTime, OrderUpdateModel):
-    pass
+    walker: UUID | None = None  # type: ignore[assignment]
 
 
 class OrderReturnModel(IDModel):
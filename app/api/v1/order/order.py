@@ -1,11 +1,14 @@
 import uuid
 
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Request, status, Depends
+from api.v1.conditional import row_list, single_row
+from api.v1.order.order_batch import order_batch_router
 from api.v1.order.models import (
     OrderReturnModel,
     OrderUpdateModel,
     NewOrder,
 )
+from models.filters import OrderFilterParams
 from models.paginated_params import (
     PaginatedParams,
     PaginationResponse,
@@ -13,19 +16,23 @@ from models.paginated_params import (
 from service.service import get_order_service
 
 order_router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
+order_router.include_router(order_batch_router)
+ORDER_SERVICE = Depends(get_order_service)
 
 
 @order_router.get(
     "/",
-    response_model=PaginationResponse,
+    response_model=PaginationResponse[OrderReturnModel],
     status_code=status.HTTP_200_OK,
     description="List of all orders",
 )
 async def get_orders(
-    service=Depends(get_order_service),
+    request: Request,
+    service=ORDER_SERVICE,
     query_params: PaginatedParams = Depends(),
+    filter_params: OrderFilterParams = Depends(),
 ):
-    return await service.get_all(query_params)
+    return await row_list(request, service, query_params, service.filters(filter_params))
 
 
 @order_router.get(
@@ -36,9 +43,10 @@ async def get_orders(
 )
 async def get_order(
     order_id: uuid.UUID,
-    service=Depends(get_order_service),
+    request: Request,
+    service=ORDER_SERVICE,
 ):
-    return await service.get_single(order_id)
+    return await single_row(request, service, order_id)
 
 
 @order_router.post(
@@ -48,7 +56,7 @@ async def get_order(
 )
 async def create_order(
     order: NewOrder,
-    service=Depends(get_order_service),
+    service=ORDER_SERVICE,
 ):
     return await service.create(order)
 
@@ -61,7 +69,7 @@ async def create_order(
 async def update_order(
     order_id: uuid.UUID,
     new_order: OrderUpdateModel,
-    service=Depends(get_order_service),
+    service=ORDER_SERVICE,
 ):
     return await service.update(row_id=order_id, new_instance=new_order)
 
@@ -73,6 +81,6 @@ async def update_order(
 )
 async def delete_order(
     order_id: uuid.UUID,
-    service=Depends(get_order_service),
+    service=ORDER_SERVICE,
 ):
     return await service.delete(row_id=order_id)
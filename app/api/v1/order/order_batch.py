@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Body, Query, Request, Response, status, Depends
+from fastapi.responses import StreamingResponse
+from api.v1.export import EXPORT_CHUNK_SIZE, FileFormat, export_response
+from api.v1.fast_json import batch_response
+from api.v1.order.models import OrderReturnModel
+from models.batch import BatchIdsParams, BatchRequest, BatchResponse
+from models.bulk import MAX_BULK_ITEMS, BulkResponse, ImportReport
+from models.filters import OrderFilterParams
+from service.importer import import_records, read_records
+from service.service import get_order_service
+
+# Routes over many orders at once, included by ``order_router`` ahead of ``/{order_id}/``.
+order_batch_router = APIRouter()
+ORDER_SERVICE = Depends(get_order_service)
+
+
+@order_batch_router.get(
+    "/export/",
+    status_code=status.HTTP_200_OK,
+    description="Stream orders as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_orders(
+    export_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    filter_params: OrderFilterParams = Depends(),
+    service=ORDER_SERVICE,
+) -> StreamingResponse:
+    chunks = service.export(EXPORT_CHUNK_SIZE, service.filters(filter_params))
+    return export_response(chunks, export_format, "orders")
+
+
+@order_batch_router.get(
+    "/batch/",
+    response_model=BatchResponse[OrderReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many orders by id, missing ones are reported",
+)
+async def get_orders_batch(
+    batch_ids: BatchIdsParams = Depends(),
+    service=ORDER_SERVICE,
+) -> Response:
+    return batch_response(await service.get_many(batch_ids.ids), service.return_model)
+
+
+@order_batch_router.post(
+    "/bulk/",
+    response_model=BulkResponse,
+    status_code=status.HTTP_200_OK,
+    description="Create many orders at once",
+)
+async def create_orders(
+    orders: list[dict] = Body(..., max_length=MAX_BULK_ITEMS),
+    service=ORDER_SERVICE,
+) -> dict:
+    return await service.create_many(orders)
+
+
+@order_batch_router.post(
+    "/batch/",
+    response_model=BatchResponse[OrderReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many orders by the ids of the request body, missing ones are reported",
+)
+async def post_orders_batch(
+    batch: BatchRequest,
+    service=ORDER_SERVICE,
+) -> Response:
+    return batch_response(await service.get_many(batch.ids), service.return_model)
+
+
+@order_batch_router.post(
+    "/import/",
+    response_model=ImportReport,
+    status_code=status.HTTP_200_OK,
+    description="Import orders from an NDJSON or CSV request body",
+)
+async def import_orders(
+    request: Request,
+    import_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    service=ORDER_SERVICE,
+) -> ImportReport:
+    return await import_records(service, read_records(request.stream(), import_format))
@@ -0,0 +1,78 @@
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from database.versions import RowVersion
+
+
+def validator_headers(version: RowVersion) -> dict[str, str]:
+    """
+    Build the ``ETag`` and ``Last-Modified`` headers of a version.
+
+    Args:
+        version (RowVersion): The version of the response.
+
+    Returns:
+        dict[str, str]: The response headers.
+    """
+    headers: dict[str, str] = {"ETag": version.etag}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(version.last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def is_conditional(request: Request) -> bool:
+    """
+    Whether the request carries a validator to compare against.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        bool: True when ``If-None-Match`` or ``If-Modified-Since`` is present.
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, version: RowVersion) -> bool:
+    """
+    Evaluate the request preconditions against the current version.
+
+    ``If-None-Match`` takes precedence, ``If-Modified-Since`` is only used without it.
+
+    Args:
+        request (Request): The incoming request.
+        version (RowVersion): The current version of the response.
+
+    Returns:
+        bool: True when the client copy is still current and a 304 can be sent.
+    """
+    if_none_match: str | None = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags: list[str] = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or version.etag in tags
+    if_modified_since: str | None = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have a one second resolution.
+    return version.last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(version: RowVersion) -> Response:
+    """
+    Build an empty 304 response carrying the validators.
+
+    Args:
+        version (RowVersion): The current version of the response.
+
+    Returns:
+        Response: The 304 response.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(version))
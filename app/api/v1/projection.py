@@ -0,0 +1,83 @@
+import types
+from typing import Any, NamedTuple, Optional, Type, Union, get_args, get_origin
+
+from fastapi.exceptions import ResponseValidationError
+from pydantic import BaseModel
+
+UNIONS = (Union, types.UnionType)
+
+
+class Nested(NamedTuple):
+    """
+    Shape of a field holding a nested model.
+
+    Attributes:
+        shape (Shape): The shape of the nested model.
+        nullable (bool): Whether the field accepts None.
+    """
+
+    shape: "Shape"
+    nullable: bool
+
+
+# Field name to the shape of a nested model, None for plain values.
+Shape = dict[str, Optional[Nested]]
+
+_shapes: dict[Type[BaseModel], Shape] = {}
+
+
+def _nested(annotation: Any) -> Nested | None:
+    members: tuple = get_args(annotation) if get_origin(annotation) in UNIONS else (annotation,)
+    for member in members:
+        if isinstance(member, type) and issubclass(member, BaseModel):
+            return Nested(model_shape(member), types.NoneType in members)
+    return None
+
+
+def model_shape(model: Type[BaseModel]) -> Shape:
+    """
+    Describe the fields of a response model, nested models included.
+
+    Args:
+        model (Type[BaseModel]): The response model.
+
+    Returns:
+        Shape: Field names to the shape of their nested model, None for plain values.
+    """
+    if model not in _shapes:
+        shape: Shape = {}
+        for name, field in model.model_fields.items():
+            shape[name] = _nested(field.annotation)
+        _shapes[model] = shape
+    return _shapes[model]
+
+
+def project(row: dict, shape: Shape) -> dict:
+    """
+    Keep only the fields of a response model, the way ``response_model`` filters a row.
+
+    Args:
+        row (dict): A row read from the database.
+        shape (Shape): The shape of the response model.
+
+    Returns:
+        dict: The row restricted to the model fields.
+
+    Raises:
+        ResponseValidationError: If a nested model that is not nullable is missing,
+            e.g. the dog of an order, as ``response_model`` validation would.
+    """
+    return {name: _project_field(row, name, nested) for name, nested in shape.items()}
+
+
+def _project_field(row: dict, name: str, nested: Nested | None) -> Any:
+    cell: Any = row[name]
+    if nested is None:
+        return cell
+    if cell is not None:
+        return project(cell, nested.shape)
+    if nested.nullable:
+        return None
+    raise ResponseValidationError([
+        {"type": "model_type", "loc": ("response", name), "msg": "Input should be an object", "input": None},
+    ])
@@ -1,6 +1,10 @@
+from datetime import date, datetime
 from uuid import UUID
 from pydantic import BaseModel
 
+from api.v1.dog.models import DogReturnModel
+from database.models import OrderStatus
+
 
 class IDModel(BaseModel):
     id: UUID
@@ -14,3 +18,17 @@ class DogWalkerModel(BaseModel):
 
 class DogWalkerReturnModel(IDModel, DogWalkerModel):
     pass
+
+
+class ScheduleSlotModel(BaseModel):
+    walk_at: datetime
+    order_id: UUID | None = None
+    status: OrderStatus | None = None
+    dog: DogReturnModel | None = None
+
+
+class WalkerScheduleModel(BaseModel):
+    walker_id: UUID
+    date: date
+    booked: int
+    slots: list[ScheduleSlotModel]
@@ -1,10 +1,18 @@
 import uuid
+from datetime import date, datetime
 
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Query, Request, status, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from api.v1.conditional import row_list, single_row
+from api.v1.fast_json import FastJSONResponse
+from api.v1.order.models import WalkTime
+from api.v1.walker.walker_batch import walker_batch_router
 from api.v1.walker.models import (
     DogWalkerReturnModel,
     DogWalkerModel,
     IDModel,
+    WalkerScheduleModel,
 )
 from models.paginated_params import (
     PaginatedParams,
@@ -17,19 +25,44 @@ walker_router = APIRouter(
     prefix="/api/v1/dogs-walkers",
     tags=["dogs_walkers"],
 )
+walker_router.include_router(walker_batch_router)
+DOG_WALKER_SERVICE = Depends(get_dog_walker_service)
 
 
 @walker_router.get(
     "/",
-    response_model=PaginationResponse,
+    response_model=PaginationResponse[DogWalkerReturnModel],
     status_code=status.HTTP_200_OK,
     description="List of all dogs walkers",
 )
 async def get_dog_walkers(
-    service=Depends(get_dog_walker_service),
+    request: Request,
+    service=DOG_WALKER_SERVICE,
     query_params: PaginatedParams = Depends(),
 ):
-    return await service.get_all(query_params)
+    return await row_list(request, service, query_params)
+
+
+@walker_router.get(
+    "/available/",
+    response_model=list[DogWalkerReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Active dogs walkers free at the given time",
+)
+async def get_available_dog_walkers(
+    walk_at: datetime = Query(..., description="Walk start on the half-hour grid"),
+    service=DOG_WALKER_SERVICE,
+):
+    try:
+        slot = WalkTime(walk_at=walk_at)
+    except ValidationError as error:
+        raise RequestValidationError(
+            [
+                {**detail, "loc": ("query", *detail["loc"])}
+                for detail in error.errors(include_url=False, include_context=False)
+            ],
+        )
+    return await service.get_available(slot.walk_at)
 
 
 @walker_router.get(
@@ -40,9 +73,25 @@ async def get_dog_walkers(
 )
 async def get_dog_walker(
     dog_walker_id: uuid.UUID,
-    service=Depends(get_dog_walker_service),
+    request: Request,
+    service=DOG_WALKER_SERVICE,
+):
+    return await single_row(request, service, dog_walker_id)
+
+
+@walker_router.get(
+    "/{dog_walker_id}/schedule/",
+    response_model=WalkerScheduleModel,
+    status_code=status.HTTP_200_OK,
+    description="Slots of a dog walker for one day with the booked dogs",
+)
+async def get_dog_walker_schedule(
+    dog_walker_id: uuid.UUID,
+    day: date = Query(..., alias="date", description="The day of the schedule"),
+    service=DOG_WALKER_SERVICE,
 ):
-    return await service.get_single(dog_walker_id)
+    # Sent as orjson builds it, the aware slot times end in Z like the walk times of the list responses.
+    return FastJSONResponse(await service.get_schedule(dog_walker_id, day))
 
 
 @walker_router.post(
@@ -53,7 +102,7 @@ async def get_dog_walker(
 )
 async def create_dog_walker(
     dog_walker: DogWalkerModel,
-    service=Depends(get_dog_walker_service),
+    service=DOG_WALKER_SERVICE,
 ) -> dict:
     return await service.create(dog_walker)
 
@@ -66,9 +115,8 @@ async def create_dog_walker(
 async def update_dog_walker(
     dog_walker_id: uuid.UUID,
     dog_walker: DogWalkerModel,
-    service=Depends(get_dog_walker_service),
+    service=DOG_WALKER_SERVICE,
 ):
-    print(dog_walker)
     return await service.update(
         row_id=dog_walker_id,
         new_instance=dog_walker,
@@ -82,6 +130,6 @@ async def update_dog_walker(
 )
 async def delete_dog_walker(
     dog_walker_id: uuid.UUID,
-    service=Depends(get_dog_walker_service),
+    service=DOG_WALKER_SERVICE,
 ):
     return await service.delete(row_id=dog_walker_id)
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Body, Query, Request, Response, status, Depends
+from fastapi.responses import StreamingResponse
+from api.v1.export import EXPORT_CHUNK_SIZE, FileFormat, export_response
+from api.v1.fast_json import batch_response
+from api.v1.walker.models import DogWalkerReturnModel
+from models.batch import BatchIdsParams, BatchRequest, BatchResponse
+from models.bulk import MAX_BULK_ITEMS, BulkResponse, ImportReport
+from service.importer import import_records, read_records
+from service.service import get_dog_walker_service
+
+# Routes over many dog walkers at once, included by ``walker_router`` ahead of ``/{dog_walker_id}/``.
+walker_batch_router = APIRouter()
+DOG_WALKER_SERVICE = Depends(get_dog_walker_service)
+
+
+@walker_batch_router.get(
+    "/export/",
+    status_code=status.HTTP_200_OK,
+    description="Stream all dogs walkers as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_dog_walkers(
+    export_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    service=DOG_WALKER_SERVICE,
+) -> StreamingResponse:
+    return export_response(service.export(EXPORT_CHUNK_SIZE), export_format, "dogs_walkers")
+
+
+@walker_batch_router.get(
+    "/batch/",
+    response_model=BatchResponse[DogWalkerReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many dog walkers by id, missing ones are reported",
+)
+async def get_dog_walkers_batch(
+    batch_ids: BatchIdsParams = Depends(),
+    service=DOG_WALKER_SERVICE,
+) -> Response:
+    return batch_response(await service.get_many(batch_ids.ids), service.return_model)
+
+
+@walker_batch_router.post(
+    "/bulk/",
+    response_model=BulkResponse,
+    status_code=status.HTTP_200_OK,
+    description="Create many dog walkers at once",
+)
+async def create_dog_walkers(
+    dog_walkers: list[dict] = Body(..., max_length=MAX_BULK_ITEMS),
+    service=DOG_WALKER_SERVICE,
+) -> dict:
+    return await service.create_many(dog_walkers)
+
+
+@walker_batch_router.post(
+    "/batch/",
+    response_model=BatchResponse[DogWalkerReturnModel],
+    status_code=status.HTTP_200_OK,
+    description="Read many dog walkers by the ids of the request body, missing ones are reported",
+)
+async def post_dog_walkers_batch(
+    batch: BatchRequest,
+    service=DOG_WALKER_SERVICE,
+) -> Response:
+    return batch_response(await service.get_many(batch.ids), service.return_model)
+
+
+@walker_batch_router.post(
+    "/import/",
+    response_model=ImportReport,
+    status_code=status.HTTP_200_OK,
+    description="Import dogs walkers from an NDJSON or CSV request body",
+)
+async def import_dog_walkers(
+    request: Request,
+    import_format: FileFormat = Query(FileFormat.ndjson, alias="format"),
+    service=DOG_WALKER_SERVICE,
+) -> ImportReport:
+    return await import_records(service, read_records(request.stream(), import_format))
@@ -0,0 +1,83 @@
+"""
+Micro-benchmark of per-request dependency resolution for the list/detail routers.
+
+Compares building a repository and service on every request (the behaviour before
+the process-wide registry) with fetching the shared instances from the registry.
+
+Usage:
+    python -m benchmarks.dependency_resolution [--rounds 500]
+"""
+import argparse
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+from tortoise import Tortoise
+
+from database.tortoise_db import DogDatabase, DogWalkerDatabase, OrderDatabase
+from service.registry import registry
+from service.service import (
+    get_dog_service,
+    get_dog_walker_service,
+    get_order_service,
+)
+from service.order_service import OrderService
+from service.services import DogService
+from service.walker_service import DogWalkerService
+
+MICROSECONDS = 1e6
+DEFAULT_ROUNDS = 500
+
+PER_REQUEST: Mapping[str, Callable] = MappingProxyType({
+    "dogs": lambda: DogService(DogDatabase(DogService.table)),
+    "dogs-walkers": lambda: DogWalkerService(DogWalkerDatabase(DogWalkerService.table)),
+    "orders": lambda: OrderService(OrderDatabase(OrderService.table)),
+})
+
+REGISTRY: Mapping[str, Callable] = MappingProxyType({
+    "dogs": get_dog_service,
+    "dogs-walkers": get_dog_walker_service,
+    "orders": get_order_service,
+})
+
+HEADER = "{0:<14}{1:>18}{2:>16}{3:>12}"
+ROW = "{0:<14}{1:>18.1f}{2:>16.3f}{3:>11.0f}x"
+
+
+def measure(factory: Callable, rounds: int) -> float:
+    """
+    Measure the mean cost of one call to a dependency factory.
+
+    Args:
+        factory (Callable): The dependency provider to call.
+        rounds (int): Number of calls to average over.
+
+    Returns:
+        float: Mean time per call in microseconds.
+    """
+    started = time.perf_counter()
+    for _ in range(rounds):
+        factory()
+    return (time.perf_counter() - started) / rounds * MICROSECONDS
+
+
+async def main(rounds: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["database.models"]},
+    )
+    registry.build()
+    print(HEADER.format("entity", "per-request, us", "registry, us", "speed-up"))
+    for entity, factory in PER_REQUEST.items():
+        before = measure(factory, rounds)
+        after = measure(REGISTRY[entity], rounds)
+        print(ROW.format(entity, before, after, before / after))
+    registry.clear()
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    asyncio.run(main(parser.parse_args().rounds))
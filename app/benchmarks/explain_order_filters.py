@@ -0,0 +1,142 @@
+"""
+Query plans of the filtered order lists.
+
+Fills a database with orders and prints the plan of the page query behind every
+filter of ``GET /api/v1/orders/``, to check that each one is served by an index
+instead of a full scan of ``orders``.
+
+Usage:
+    python -m benchmarks.explain_order_filters [--rows 20000] [--db-url sqlite://:memory:]
+"""
+import argparse
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from tortoise import Tortoise, timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from database.models import DogTable, DogWalkerTable, OrderStatus, OrderTable
+
+DEFAULT_ROWS = 20000
+# Orders per dog and walker, and per batch of inserts.
+BATCH_SIZE = 1000
+FIRST_WALK = timedelta(hours=7)
+WALK_MINUTES = 30
+RANGE = timedelta(hours=2)
+PAGE_SIZE = 10
+SQLITE_EXPLAIN = "EXPLAIN QUERY PLAN {0}"
+EXPLAIN = "EXPLAIN {0}"
+QUERY = "-- {0}\n{1}"
+PLAN_LINE = "    {0}"
+STATUSES = tuple(OrderStatus)
+
+
+def _first_walk() -> datetime:
+    tomorrow: date = date.today() + timedelta(days=1)
+    midnight: datetime = datetime.combine(tomorrow, datetime.min.time())
+    return timezone.make_aware(midnight + FIRST_WALK)
+
+
+def _order(first_walk: datetime, index: int, dogs: list[DogTable], walkers: list[DogWalkerTable]) -> OrderTable:
+    walk_at: datetime = first_walk + timedelta(minutes=WALK_MINUTES * (index % BATCH_SIZE))
+    dog: DogTable = dogs[index // BATCH_SIZE]
+    walker: DogWalkerTable = walkers[index // BATCH_SIZE]
+    order_status: OrderStatus = STATUSES[index % len(STATUSES)]
+    return OrderTable(walk_at=walk_at, dog_id=dog.id, walker_id=walker.id, status=order_status)
+
+
+async def fill(rows: int, first_walk: datetime) -> tuple[uuid.UUID, uuid.UUID]:
+    """
+    Create the orders, one dog and one walker per thousand of them.
+
+    Args:
+        rows (int): Number of orders.
+        first_walk (datetime): Walk time of the first order of every dog and walker.
+
+    Returns:
+        tuple[uuid.UUID, uuid.UUID]: The first dog and the first walker.
+    """
+    groups: range = range(rows // BATCH_SIZE + 1)
+    dogs: list[DogTable] = [DogTable(apartment=index, name="Explain", breed="Mutt") for index in groups]
+    walkers: list[DogWalkerTable] = [DogWalkerTable(name="Explain", surname=str(index)) for index in groups]
+    await DogTable.bulk_create(dogs)
+    await DogWalkerTable.bulk_create(walkers)
+    orders: list[OrderTable] = [_order(first_walk, index, dogs, walkers) for index in range(rows)]
+    await OrderTable.bulk_create(orders, batch_size=BATCH_SIZE)
+    return dogs[0].id, walkers[0].id
+
+
+def filters(
+    dog_id: uuid.UUID,
+    walker_id: uuid.UUID,
+    first_walk: datetime,
+) -> dict[str, dict[str, Any]]:
+    """
+    Return the lookups of every order filter.
+
+    Args:
+        dog_id (uuid.UUID): The dog of the dog filter.
+        walker_id (uuid.UUID): The walker of the walker filter.
+        first_walk (datetime): Start of the walk time range.
+
+    Returns:
+        dict[str, dict[str, Any]]: The lookups keyed by filter name.
+    """
+    last_walk: datetime = first_walk + RANGE
+    return {
+        "walker": {"walker_id": walker_id},
+        "dog": {"dog_id": dog_id},
+        "status": {"status": OrderStatus.success},
+        "walk_at range": {"walk_at__gte": first_walk, "walk_at__lte": last_walk},
+        "walker + range": {"walker_id": walker_id, "walk_at__gte": last_walk},
+    }
+
+
+async def explain(name: str, lookups: dict[str, Any]) -> None:
+    """
+    Print the page query of a filter and its plan.
+
+    Args:
+        name (str): The filter.
+        lookups (dict[str, Any]): Its ORM lookups.
+    """
+    sql: str = OrderTable.filter(**lookups).limit(PAGE_SIZE).sql()
+    print(QUERY.format(name, sql))
+    connection: BaseDBAsyncClient = Tortoise.get_connection("default")
+    statement: str = SQLITE_EXPLAIN if connection.capabilities.dialect == "sqlite" else EXPLAIN
+    _, plan = await connection.execute_query(statement.format(sql))
+    for line in plan:
+        print(PLAN_LINE.format(tuple(line)[-1]))
+
+
+async def explain_all(rows: int) -> None:
+    """
+    Fill the database and print the plan of every order filter.
+
+    Args:
+        rows (int): Number of orders.
+    """
+    first_walk: datetime = _first_walk()
+    dog_id, walker_id = await fill(rows, first_walk)
+    await Tortoise.get_connection("default").execute_script('ANALYZE "orders"')
+    for name, lookups in filters(dog_id, walker_id, first_walk).items():
+        await explain(name, lookups)
+
+
+async def main(rows: int, db_url: str) -> None:
+    await Tortoise.init(db_url=db_url, modules={"models": ["database.models"]})
+    await Tortoise.generate_schemas()
+    try:  # noqa: WPS501
+        await explain_all(rows)
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.db_url))
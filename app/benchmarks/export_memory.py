@@ -0,0 +1,118 @@
+"""
+Benchmark of peak memory of the orders export against one huge list page.
+
+Fills an in-memory SQLite database with orders and compares the peak traced
+allocation of ``GET /api/v1/orders/export/`` with ``GET /api/v1/orders/?size=N``.
+
+Usage:
+    python -m benchmarks.export_memory [--rows 20000 50000]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient
+from tortoise import Tortoise, timezone
+
+from database.models import DogTable, DogWalkerTable, OrderTable
+from main import app
+from service.registry import registry
+
+EXPORT_URL = "/api/v1/orders/export/"
+LIST_URL = "/api/v1/orders/"
+DEFAULT_ROWS = (20000, 50000)
+# Orders per dog and walker, and per batch of inserts.
+BATCH_SIZE = 1000
+FIRST_WALK = timedelta(hours=7)
+WALK_MINUTES = 30
+MEBIBYTE = 1024 * 1024
+HEADER = "{0:>8}{1:>14}{2:>12}{3:>10}{4:>10}"
+ROW = "{0:>8}{1:>14}{2:>12.1f}{3:>10.2f}{4:>10.1f}"
+
+
+def _first_walk() -> datetime:
+    tomorrow: date = date.today() + timedelta(days=1)
+    midnight: datetime = datetime.combine(tomorrow, datetime.min.time())
+    return timezone.make_aware(midnight + FIRST_WALK)
+
+
+def _order(first_walk: datetime, index: int, dogs: list[DogTable], walkers: list[DogWalkerTable]) -> OrderTable:
+    walk_at: datetime = first_walk + timedelta(minutes=WALK_MINUTES * (index % BATCH_SIZE))
+    dog: DogTable = dogs[index // BATCH_SIZE]
+    walker: DogWalkerTable = walkers[index // BATCH_SIZE]
+    return OrderTable(walk_at=walk_at, dog_id=dog.id, walker_id=walker.id)
+
+
+async def fill(rows: int) -> None:
+    """
+    Create the orders, one dog and one walker per thousand of them.
+
+    Args:
+        rows (int): Number of orders.
+    """
+    groups: range = range(rows // BATCH_SIZE + 1)
+    dogs: list[DogTable] = [DogTable(apartment=index, name="Export", breed="Mutt") for index in groups]
+    walkers: list[DogWalkerTable] = [DogWalkerTable(name="Export", surname=str(index)) for index in groups]
+    await DogTable.bulk_create(dogs)
+    await DogWalkerTable.bulk_create(walkers)
+    first_walk: datetime = _first_walk()
+    orders: list[OrderTable] = [_order(first_walk, index, dogs, walkers) for index in range(rows)]
+    await OrderTable.bulk_create(orders, batch_size=BATCH_SIZE)
+
+
+async def peak(client: AsyncClient, url: str, query: dict) -> tuple[float, float, float]:
+    """
+    Stream a response while tracing the allocations.
+
+    Args:
+        client (AsyncClient): The client bound to the ASGI app.
+        url (str): The endpoint.
+        query (dict): The query parameters.
+
+    Returns:
+        tuple[float, float, float]: Peak traced MiB, seconds and MiB received.
+    """
+    tracemalloc.start()
+    started: float = time.perf_counter()
+    async with client.stream("GET", url, params=query) as response:
+        received: int = sum([len(chunk) async for chunk in response.aiter_bytes()])
+    elapsed: float = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_bytes / MEBIBYTE, elapsed, received / MEBIBYTE
+
+
+async def measure(rows: int) -> None:
+    """
+    Print the peak memory of the export and of a list page of every order.
+
+    Args:
+        rows (int): Number of orders.
+    """
+    await fill(rows)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:  # type: ignore
+        exported: tuple = await peak(client, EXPORT_URL, {})
+        print(ROW.format(rows, "export", *exported))
+        listed: tuple = await peak(client, LIST_URL, {"size": rows})
+        print(ROW.format(rows, "list", *listed))
+
+
+async def main(sizes: list[int]) -> None:
+    print(HEADER.format("rows", "endpoint", "peak MiB", "seconds", "MiB sent"))
+    for rows in sizes:
+        await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["database.models"]})
+        await Tortoise.generate_schemas()
+        registry.build()
+        try:  # noqa: WPS501
+            await measure(rows)
+        finally:
+            registry.clear()
+            await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    asyncio.run(main(parser.parse_args().rows))
@@ -0,0 +1,116 @@
+"""
+Throughput of the list endpoints for several page sizes.
+
+Fills an in-memory SQLite database and requests the same page of every entity
+repeatedly through the ASGI app, reporting requests and rows per second.
+
+Usage:
+    python -m benchmarks.list_throughput [--sizes 10 100 1000] [--seconds 3]
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient, Response
+from tortoise import Tortoise, timezone
+
+from database.models import DogTable, DogWalkerTable, OrderTable
+from main import app
+from service.registry import registry
+
+ENDPOINTS: tuple[str, ...] = ("/api/v1/dogs/", "/api/v1/dogs-walkers/", "/api/v1/orders/")
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_SECONDS = 3.0
+BATCH_SIZE = 1000
+FIRST_WALK_HOUR = 7
+HEADER = "{0:<24}{1:>6}{2:>10}{3:>12}"
+ROW = "{0:<24}{1:>6}{2:>10.1f}{3:>12.0f}"
+
+
+def _dog(index: int) -> DogTable:
+    return DogTable(apartment=index, name="Dog {0}".format(index), breed="Mutt")
+
+
+def _walker(index: int) -> DogWalkerTable:
+    return DogWalkerTable(name="Walker", surname=str(index))
+
+
+def _order(dog: DogTable, walker: DogWalkerTable) -> OrderTable:
+    today: datetime = datetime.combine(date.today(), datetime.min.time())
+    walk_at: datetime = timezone.make_aware(today + timedelta(days=1, hours=FIRST_WALK_HOUR))
+    return OrderTable(walk_at=walk_at, dog_id=dog.id, walker_id=walker.id)
+
+
+async def fill(rows: int) -> None:
+    """
+    Create as many dogs, walkers and orders, one order per dog and walker.
+
+    Args:
+        rows (int): Number of rows of every table.
+    """
+    dogs: list[DogTable] = [_dog(index) for index in range(rows)]
+    walkers: list[DogWalkerTable] = [_walker(index) for index in range(rows)]
+    await DogTable.bulk_create(dogs, batch_size=BATCH_SIZE)
+    await DogWalkerTable.bulk_create(walkers, batch_size=BATCH_SIZE)
+    await OrderTable.bulk_create(list(map(_order, dogs, walkers)), batch_size=BATCH_SIZE)
+
+
+async def throughput(client: AsyncClient, url: str, size: int, seconds: float) -> float:
+    """
+    Request the first page of a list endpoint for a while, after one warm-up request.
+
+    Args:
+        client (AsyncClient): The client bound to the ASGI app.
+        url (str): The list endpoint.
+        size (int): The page size.
+        seconds (float): How long to request the page.
+
+    Returns:
+        float: Requests per second.
+    """
+    query: dict = {"size": size, "count": "approximate"}
+    await client.get(url, params=query)
+    requests: int = 0
+    started: float = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        response: Response = await client.get(url, params=query)
+        assert response.is_success, response.text
+        requests += 1
+    return requests / (time.perf_counter() - started)
+
+
+async def measure(sizes: list[int], seconds: float) -> None:
+    """
+    Print the throughput of every list endpoint for every page size.
+
+    Args:
+        sizes (list[int]): The page sizes.
+        seconds (float): How long to request every page.
+    """
+    await fill(max(sizes))
+    print(HEADER.format("endpoint", "size", "req/s", "rows/s"))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:  # type: ignore
+        for url in ENDPOINTS:
+            for size in sizes:
+                rate: float = await throughput(client, url, size, seconds)
+                print(ROW.format(url, size, rate, rate * size))
+
+
+async def main(sizes: list[int], seconds: float) -> None:
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["database.models"]})
+    await Tortoise.generate_schemas()
+    registry.build()
+    try:  # noqa: WPS501
+        await measure(sizes, seconds)
+    finally:
+        registry.clear()
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.sizes, arguments.seconds))
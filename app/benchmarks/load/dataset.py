@@ -0,0 +1,187 @@
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Type
+
+from tortoise import Model, timezone
+
+from benchmarks.load.seed import seed, walk_time
+from database.models import DogTable, DogWalkerTable, OrderStatus, OrderTable
+from service.availability import SLOTS_PER_DAY
+
+# Entities by their URL prefix.
+DOGS = "dogs"
+WALKERS = "dogs-walkers"
+ORDERS = "orders"
+# Ids read back per table.
+SAMPLE_SIZE = 10000
+WALK_AT = "walk_at"
+SEEDED = "seeded {0.dogs} dogs, {0.walkers} walkers, {0.orders} orders in {1:.1f} s"
+
+
+def _no_rows() -> dict[str, dict[int, str]]:
+    return {DOGS: {}, WALKERS: {}, ORDERS: {}}
+
+
+@dataclass
+class Dataset:
+    """
+    Identifiers of the seeded rows the scenarios pick from.
+
+    Attributes:
+        dogs (list[str]): Dog ids.
+        walkers (list[str]): Walker ids.
+        orders (list[str]): Order ids.
+        first_day (date): Day of the earliest seeded order.
+        days (int): Number of days the seeded orders span.
+        created (dict[str, dict[int, str]]): Rows created by the write scenarios, by request number.
+    """
+
+    dogs: list[str]
+    walkers: list[str]
+    orders: list[str]
+    first_day: date
+    days: int
+    created: dict[str, dict[int, str]] = field(default_factory=_no_rows)
+
+
+class Picker:
+    """
+    Choices of the scenarios, seeded so that every run sends the same requests.
+
+    Attributes:
+        dataset (Dataset): The rows to pick from.
+        write_day (date): First day of the slots booked by the write scenarios, after the seeded days.
+    """
+
+    def __init__(self, dataset: Dataset, random_seed: int = 0):
+        """
+        Args:
+            dataset (Dataset): The rows to pick from.
+            random_seed (int): Seed of the choices.
+        """
+        self.dataset = dataset
+        self.write_day: date = dataset.first_day + timedelta(days=dataset.days + 1)
+        self._random = random.Random(random_seed)
+        self._pairs: int = min(len(dataset.dogs), len(dataset.walkers))
+
+    def seeded(self, entity: str) -> str:
+        """
+        Pick a seeded row.
+
+        Args:
+            entity (str): ``DOGS``, ``WALKERS`` or ``ORDERS``.
+
+        Returns:
+            str: The id of the row.
+        """
+        seeded: dict[str, list[str]] = {
+            DOGS: self.dataset.dogs,
+            WALKERS: self.dataset.walkers,
+            ORDERS: self.dataset.orders,
+        }
+        return self._random.choice(seeded[entity])
+
+    def day(self) -> date:
+        """
+        Pick a seeded day.
+
+        Returns:
+            date: A day with seeded orders.
+        """
+        offset: int = self._random.randrange(self.dataset.days)
+        return self.dataset.first_day + timedelta(days=offset)
+
+    def slot(self) -> int:
+        """
+        Pick a slot of a day.
+
+        Returns:
+            int: The slot number within the day.
+        """
+        return self._random.randrange(SLOTS_PER_DAY)
+
+    def order(self, index: int) -> dict[str, str]:
+        """
+        The n-th written order, one dog and walker pair per request, after the seeded days.
+
+        Args:
+            index (int): The request number.
+
+        Returns:
+            dict[str, str]: The body of the order.
+        """
+        slot, pair = divmod(index, self._pairs)
+        return {
+            "dog": self.dataset.dogs[pair],
+            "walker": self.dataset.walkers[pair],
+            "status": OrderStatus.planned.value,
+            "walk_at": walk_time(self.write_day, slot).isoformat(),
+        }
+
+    def created(self, entity: str, index: int) -> str:
+        """
+        A row created by a write scenario, the one of the same request number when there is one.
+
+        Args:
+            entity (str): The entity the row was created under.
+            index (int): The request number.
+
+        Returns:
+            str: The id of the created row.
+        """
+        rows: dict[int, str] = self.dataset.created[entity]
+        row_id: str | None = rows.get(index)
+        return row_id or next(iter(rows.values()))
+
+
+async def _ids(model: Type[Model]) -> list[str]:
+    ids: list[Any] = await model.all().limit(SAMPLE_SIZE).values_list("id", flat=True)
+    return [str(row_id) for row_id in ids]
+
+
+async def _walk_days() -> tuple[date, int]:
+    earliest: OrderTable | None = await OrderTable.all().order_by(WALK_AT).first()
+    latest: OrderTable | None = await OrderTable.all().order_by("-{0}".format(WALK_AT)).first()
+    if earliest is None or latest is None:
+        return date.today() + timedelta(days=1), 1
+    first_day: date = timezone.make_naive(earliest.walk_at).date()
+    last_day: date = timezone.make_naive(latest.walk_at).date()
+    return first_day, (last_day - first_day).days + 1
+
+
+async def load_dataset() -> Dataset:
+    """
+    Read back the ids to request, whether seeded now or by an earlier run.
+
+    Returns:
+        Dataset: A sample of the ids of every table and the days of the orders.
+    """
+    first_day, days = await _walk_days()
+    return Dataset(
+        dogs=await _ids(DogTable),
+        walkers=await _ids(DogWalkerTable),
+        orders=await _ids(OrderTable),
+        first_day=first_day,
+        days=days,
+    )
+
+
+async def prepare(arguments: argparse.Namespace) -> Dataset:
+    """
+    Seed the database unless asked not to, then read back the ids to request.
+
+    Args:
+        arguments (argparse.Namespace): The command line.
+
+    Returns:
+        Dataset: The rows the scenarios pick from.
+    """
+    if not arguments.skip_seed:
+        started: float = time.perf_counter()
+        first_day: date = date.today() + timedelta(days=1)
+        await seed(arguments.dogs, arguments.walkers, arguments.orders, first_day)
+        print(SEEDED.format(arguments, time.perf_counter() - started))
+    return await load_dataset()
@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import Any
+
+from benchmarks.load.dataset import WALKERS, Picker
+from benchmarks.load.seed import walk_time
+from database.models import OrderStatus
+
+# Pages the list scenarios cycle through.
+PAGES = 20
+QUERY = "params"
+# Keyword arguments of ``AsyncClient.request``.
+Options = dict[str, Any]
+
+
+def fixed(options: Options, picker: Picker, index: int) -> Options:
+    """
+    The same keyword arguments for every request, bind them with ``functools.partial``.
+
+    Args:
+        options (Options): The keyword arguments.
+        picker (Picker): Unused.
+        index (int): Unused.
+
+    Returns:
+        Options: The keyword arguments.
+    """
+    return options
+
+
+def page(picker: Picker, index: int) -> Options:
+    """
+    Cycle through the first pages of a list.
+
+    Args:
+        picker (Picker): Unused.
+        index (int): The request number.
+
+    Returns:
+        Options: The page parameter.
+    """
+    return {QUERY: {"page": index % PAGES + 1}}
+
+
+def available(picker: Picker, index: int) -> Options:
+    """
+    Ask for the walkers available in a seeded slot.
+
+    Args:
+        picker (Picker): The choices of the scenario.
+        index (int): Unused.
+
+    Returns:
+        Options: The walk time parameter.
+    """
+    walk_at: datetime = walk_time(picker.day(), picker.slot())
+    return {QUERY: {"walk_at": walk_at.isoformat()}}
+
+
+def schedule(picker: Picker, index: int) -> Options:
+    """
+    Ask for the schedule of a seeded day.
+
+    Args:
+        picker (Picker): The choices of the scenario.
+        index (int): Unused.
+
+    Returns:
+        Options: The date parameter.
+    """
+    return {QUERY: {"date": picker.day().isoformat()}}
+
+
+def walker_orders(picker: Picker, index: int) -> Options:
+    """
+    Filter the orders by a seeded walker.
+
+    Args:
+        picker (Picker): The choices of the scenario.
+        index (int): Unused.
+
+    Returns:
+        Options: The walker parameter.
+    """
+    return {QUERY: {"walker": picker.seeded(WALKERS)}}
+
+
+def new_order(picker: Picker, index: int) -> Options:
+    """
+    Book the n-th written order.
+
+    Args:
+        picker (Picker): The choices of the scenario.
+        index (int): The request number.
+
+    Returns:
+        Options: The order body.
+    """
+    return {"json": picker.order(index)}
+
+
+def started_order(picker: Picker, index: int) -> Options:
+    """
+    Move the n-th written order in progress.
+
+    Args:
+        picker (Picker): The choices of the scenario.
+        index (int): The request number.
+
+    Returns:
+        Options: The order body.
+    """
+    return {"json": {**picker.order(index), "status": OrderStatus.in_progress.value}}
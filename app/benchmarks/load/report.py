@@ -0,0 +1,144 @@
+import argparse
+import json
+import platform
+import statistics
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+from benchmarks.load.dataset import Dataset
+from database.models import OrderTable
+
+DIGITS = 3
+THROUGHPUT = "throughput"
+P95 = "p95"
+ENDPOINTS = "endpoints"
+# Cut points of the median, the 95th and the 99th percentile.
+PERCENTILES = MappingProxyType({"p50": 49, P95: 94, "p99": 98})
+HEADER = "{0:<36}{1:>9}{2:>9}{3:>9}{4:>9}{5:>9}{6:>8}".format(
+    "endpoint", "req/s", "mean", "p50", P95, "p99", "errors",
+)
+ROW = "{0:<36}{1[throughput]:>9.1f}{1[mean]:>9.2f}{1[p50]:>9.2f}{1[p95]:>9.2f}{1[p99]:>9.2f}{1[errors]:>8}"
+COMPARE_HEADER = "\n{0:<36}{1:>10}{2:>10}{3:>10}{4:>10}".format(
+    "endpoint", "p95 base", "p95 now", "rps base", "rps now",
+)
+COMPARE_ROW = "{0:<36}{1[p95]:>10.2f}{2[p95]:>10.2f}{1[throughput]:>10.1f}{2[throughput]:>10.1f}{3}"
+REGRESSION = "  REGRESSION"
+# Results of an endpoint or of a whole run, as written to JSON.
+Summary = dict[str, Any]
+
+
+def summarize(timings: list[float], errors: int, seconds: float) -> Summary:
+    """
+    Throughput and latency percentiles of the requests of an endpoint.
+
+    Args:
+        timings (list[float]): Latency of every request in milliseconds, at least one.
+        errors (int): Number of failed requests.
+        seconds (float): Wall time of all the requests.
+
+    Returns:
+        Summary: The summary of the endpoint.
+    """
+    summary: Summary = {
+        "requests": len(timings),
+        "errors": errors,
+        THROUGHPUT: round(len(timings) / seconds, 1),
+        "mean": round(statistics.mean(timings), DIGITS),
+    }
+    summary.update(_percentiles(timings))
+    return summary
+
+
+def _percentiles(timings: list[float]) -> dict[str, float]:
+    # Quantiles need two samples, a single one is every percentile.
+    samples: list[float] = timings if len(timings) > 1 else timings + timings
+    cuts: list[float] = [round(cut, DIGITS) for cut in statistics.quantiles(samples, n=100)]
+    return {name: cuts[cut] for name, cut in PERCENTILES.items()}
+
+
+def _regressed(now: Summary, base: Summary, tolerance: float) -> bool:
+    ceiling: float = base[P95] * (1 + tolerance)
+    floor: float = base[THROUGHPUT] * (1 - tolerance)
+    return now[P95] > ceiling or now[THROUGHPUT] < floor
+
+
+def compare(report: Summary, baseline: Summary, tolerance: float) -> list[str]:
+    """
+    Endpoints slower or less productive than the baseline beyond the tolerance.
+
+    Args:
+        report (Summary): The results of this run.
+        baseline (Summary): The results of an earlier run.
+        tolerance (float): Allowed relative change of p95 and throughput.
+
+    Returns:
+        list[str]: The names of the regressed endpoints.
+    """
+    regressions: list[str] = []
+    print(COMPARE_HEADER)
+    for name, now in report[ENDPOINTS].items():
+        base: Summary | None = baseline[ENDPOINTS].get(name)
+        if base is None:
+            continue
+        regressed: bool = _regressed(now, base, tolerance)
+        print(COMPARE_ROW.format(name, base, now, REGRESSION if regressed else ""))
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def save(report: Summary, path: str) -> None:
+    """
+    Write the results as JSON, e.g. to compare later runs against.
+
+    Args:
+        report (Summary): The results of this run.
+        path (str): The output file.
+    """
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2, ensure_ascii=False)
+
+
+def check(report: Summary, path: str, tolerance: float) -> int:
+    """
+    Compare the results against a saved baseline.
+
+    Args:
+        report (Summary): The results of this run.
+        path (str): The JSON file of the baseline.
+        tolerance (float): Allowed relative change of p95 and throughput.
+
+    Returns:
+        int: The exit status, 1 when an endpoint regressed.
+    """
+    with open(path, encoding="utf-8") as baseline:
+        regressions: list[str] = compare(report, json.load(baseline), tolerance)
+    if not regressions:
+        return 0
+    print("\n{0} endpoint(s) regressed beyond {1:.0%}".format(len(regressions), tolerance))
+    return 1
+
+
+async def describe(arguments: argparse.Namespace, dataset: Dataset) -> Summary:
+    """
+    Describe the run, saved along the results.
+
+    Args:
+        arguments (argparse.Namespace): The command line.
+        dataset (Dataset): The rows the scenarios pick from.
+
+    Returns:
+        Summary: The database, the target, the dataset and the load.
+    """
+    return {
+        "db": arguments.db_url.split("://", 1)[0],
+        "target": arguments.base_url or "asgi",
+        "dogs": len(dataset.dogs),
+        "walkers": len(dataset.walkers),
+        "orders": await OrderTable.all().count(),
+        "requests": arguments.requests,
+        "concurrency": arguments.concurrency,
+        "python": platform.python_version(),
+        "started": datetime.now().isoformat(timespec="seconds"),
+    }
@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import time
+from typing import Iterator
+
+from httpx import AsyncClient, Response
+
+from benchmarks.load.dataset import Picker
+from benchmarks.load.report import HEADER, ROW, Summary, summarize
+from benchmarks.load.scenarios import SCENARIOS, Scenario
+
+MILLISECONDS = 1000
+SKIPPED = "{0:<36}skipped, no {1} were created"
+
+
+class LoadRun:
+    """
+    Requests of one scenario sent by concurrent clients.
+
+    Attributes:
+        scenario (Scenario): The endpoint under load.
+        timings (list[float]): Latency of every request in milliseconds.
+        errors (list[int]): Status of every failed request.
+    """
+
+    def __init__(self, client: AsyncClient, picker: Picker, scenario: Scenario):
+        """
+        Args:
+            client (AsyncClient): The client bound to the app or the server.
+            picker (Picker): The choices of the scenarios.
+            scenario (Scenario): The endpoint under load.
+        """
+        self.scenario = scenario
+        self.timings: list[float] = []
+        self.errors: list[int] = []
+        self._client = client
+        self._picker = picker
+        self._sequence: Iterator[int] = iter(())
+
+    async def run(self, requests: int, concurrency: int) -> Summary:
+        """
+        Send ``requests`` requests from ``concurrency`` clients at once.
+
+        Args:
+            requests (int): Number of requests.
+            concurrency (int): Number of clients.
+
+        Returns:
+            Summary: Throughput and latency of the scenario.
+        """
+        self._sequence = iter(range(requests))
+        started: float = time.perf_counter()
+        await asyncio.gather(*(self._send_all() for _ in range(concurrency)))
+        seconds: float = time.perf_counter() - started
+        summary: Summary = summarize(self.timings, len(self.errors), seconds)
+        if self.errors:
+            summary["statuses"] = sorted(set(self.errors))
+        return summary
+
+    async def _send_all(self) -> None:
+        # The clients share the sequence, every request number is sent once.
+        for index in self._sequence:
+            await self._send(index)
+
+    async def _send(self, index: int) -> None:
+        method, url, options = self.scenario.request(self._picker, index)
+        started: float = time.perf_counter()
+        response: Response = await self._client.request(method, url, **options)
+        self.timings.append((time.perf_counter() - started) * MILLISECONDS)
+        if response.is_error:
+            self.errors.append(response.status_code)
+        elif self.scenario.keep:
+            self._keep(index, response)
+
+    def _keep(self, index: int, response: Response) -> None:
+        created: dict[int, str] = self._picker.dataset.created[self.scenario.entity]
+        created[index] = response.json()["id"]
+
+
+def selected(arguments: argparse.Namespace) -> list[Scenario]:
+    """
+    The scenarios to run, the ones whose name contains a part given with ``--only``.
+
+    Args:
+        arguments (argparse.Namespace): The command line.
+
+    Returns:
+        list[Scenario]: The scenarios in order, none when no request is to be sent.
+    """
+    if arguments.requests < 1:
+        return []
+    parts: list[str] = arguments.only or [""]
+    return [scenario for scenario in SCENARIOS if any(part in scenario.name for part in parts)]
+
+
+async def measure(arguments: argparse.Namespace, client: AsyncClient, picker: Picker) -> dict[str, Summary]:
+    """
+    Run the selected scenarios one after the other and print their results.
+
+    Args:
+        arguments (argparse.Namespace): The command line.
+        client (AsyncClient): The client bound to the app or the server.
+        picker (Picker): The choices of the scenarios.
+
+    Returns:
+        dict[str, Summary]: The results of every scenario that ran, by name.
+    """
+    endpoints: dict[str, Summary] = {}
+    print(HEADER)
+    for scenario in selected(arguments):
+        if scenario.created and not picker.dataset.created[scenario.entity]:
+            print(SKIPPED.format(scenario.name, scenario.entity))
+            continue
+        load = LoadRun(client, picker, scenario)
+        endpoints[scenario.name] = await load.run(arguments.requests, arguments.concurrency)
+        print(ROW.format(scenario.name, endpoints[scenario.name]))
+    return endpoints
@@ -0,0 +1,116 @@
+import json
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Callable
+
+from benchmarks.load.dataset import Picker
+from benchmarks.load.options import (
+    Options,
+    available,
+    fixed,
+    new_order,
+    page,
+    schedule,
+    started_order,
+    walker_orders,
+)
+
+API_PREFIX = "/api/v1"
+# Rows sent by the bulk and import scenarios.
+BULK_SIZE = 10
+DOG = MappingProxyType({"apartment": 1, "name": "Load", "breed": "Mutt"})
+DOG_LINE: bytes = "{0}\n".format(json.dumps({**DOG})).encode()
+DOGS: tuple[dict, ...] = tuple({**DOG} for _ in range(BULK_SIZE))
+WALKER = MappingProxyType({"name": "Load", "surname": "Walker", "active": True})
+SEND_DOG = partial(fixed, {"json": {**DOG}})
+SEND_DOGS = partial(fixed, {"json": DOGS})
+SEND_WALKER = partial(fixed, {"json": {**WALKER}})
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One endpoint under load.
+
+    ``{id}`` in the path is a seeded row of the entity the path starts with, or one
+    of the rows created by an earlier scenario when ``created`` is set.
+
+    Attributes:
+        name (str): Method and path under ``/api/v1``, e.g. ``GET /orders/{id}/``.
+        build (Callable[[Picker, int], Options]): Builds the keyword arguments of the n-th request.
+        keep (bool): Records the ``id`` of the rows created by the requests.
+        created (bool): The requests use the created rows, skipped when there are none.
+    """
+
+    name: str
+    build: Callable[[Picker, int], Options] = partial(fixed, {})
+    keep: bool = False
+    created: bool = False
+
+    @property
+    def method(self) -> str:
+        """
+        HTTP method of the requests.
+
+        Returns:
+            str: The method, e.g. ``GET``.
+        """
+        return self.name.split()[0]
+
+    @property
+    def entity(self) -> str:
+        """
+        Entity the path starts with.
+
+        Returns:
+            str: The URL prefix of the entity, e.g. ``orders``.
+        """
+        return self.name.split("/")[1]
+
+    def request(self, picker: Picker, index: int) -> tuple[str, str, Options]:
+        """
+        Build the n-th request.
+
+        Args:
+            picker (Picker): The choices of the scenario.
+            index (int): The request number.
+
+        Returns:
+            tuple[str, str, Options]: The method, the URL and the keyword arguments of the request.
+        """
+        path: str = self.name.split()[1].split("?")[0]
+        if "{id}" in path:
+            path = path.format(id=self._row_id(picker, index))
+        return self.method, API_PREFIX + path, self.build(picker, index)
+
+    def _row_id(self, picker: Picker, index: int) -> str:
+        if self.created:
+            return picker.created(self.entity, index)
+        return picker.seeded(self.entity)
+
+
+# Reads first, then writes in dependency order.
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("GET /dogs/", page),
+    Scenario("GET /dogs/{id}/"),
+    Scenario("GET /dogs-walkers/", page),
+    Scenario("GET /dogs-walkers/{id}/"),
+    Scenario("GET /dogs-walkers/available/", available),
+    Scenario("GET /dogs-walkers/{id}/schedule/", schedule),
+    Scenario("GET /orders/", page),
+    Scenario("GET /orders/?walker=", walker_orders),
+    Scenario("GET /orders/{id}/"),
+    Scenario("GET /orders/export/?walker=", walker_orders),
+    Scenario("POST /dogs/", SEND_DOG, keep=True),
+    Scenario("POST /dogs/bulk/", SEND_DOGS),
+    Scenario("POST /dogs/import/", partial(fixed, {"content": DOG_LINE * BULK_SIZE})),
+    Scenario("PUT /dogs/{id}/", SEND_DOG, created=True),
+    Scenario("POST /dogs-walkers/", SEND_WALKER, keep=True),
+    Scenario("PUT /dogs-walkers/{id}/", SEND_WALKER, created=True),
+    Scenario("POST /orders/", new_order, keep=True),
+    Scenario("PUT /orders/{id}/", started_order, created=True),
+    Scenario("DELETE /orders/{id}/", created=True),
+    Scenario("DELETE /dogs/{id}/", created=True),
+    Scenario("DELETE /dogs-walkers/{id}/", created=True),
+)
@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta
+
+from tortoise import timezone
+
+from api.v1.order.models import MIN_HOUR
+from database.models import DogTable, DogWalkerTable, OrderStatus, OrderTable
+from service.availability import SLOT_MINUTES, SLOTS_PER_DAY
+
+SEED_BATCH_SIZE = 1000
+# Orders built in memory before every bulk insert.
+SEED_CHUNK = 10000
+STATUSES: tuple[OrderStatus, ...] = tuple(OrderStatus)
+NAME = "Load"
+
+
+def walk_time(first_day: date, slot: int) -> datetime:
+    """
+    Start of a slot, counted over consecutive days from the first slot of ``first_day``.
+
+    Args:
+        first_day (date): The day of slot 0.
+        slot (int): The slot number, ``SLOTS_PER_DAY`` slots a day.
+
+    Returns:
+        datetime: The naive start of the slot.
+    """
+    day, slot_of_day = divmod(slot, SLOTS_PER_DAY)
+    midnight: datetime = datetime.combine(first_day, datetime.min.time())
+    return midnight + timedelta(days=day, hours=MIN_HOUR, minutes=SLOT_MINUTES * slot_of_day)
+
+
+def _dog(index: int) -> DogTable:
+    return DogTable(apartment=index, name="{0} {1}".format(NAME, index), breed="Mutt")
+
+
+def _walker(index: int) -> DogWalkerTable:
+    return DogWalkerTable(name=NAME, surname=str(index))
+
+
+def _order(index: int, pairs: list[tuple[DogTable, DogWalkerTable]], first_day: date) -> OrderTable:
+    slot, pair = divmod(index, len(pairs))
+    dog, walker = pairs[pair]
+    return OrderTable(
+        walk_at=timezone.make_aware(walk_time(first_day, slot)),
+        dog_id=dog.id,
+        walker_id=walker.id,
+        status=STATUSES[index % len(STATUSES)],
+    )
+
+
+async def _seed_orders(pairs: list[tuple[DogTable, DogWalkerTable]], orders: int, first_day: date) -> None:
+    for start in range(0, orders, SEED_CHUNK):
+        indexes: range = range(start, min(start + SEED_CHUNK, orders))
+        chunk: list[OrderTable] = [_order(index, pairs, first_day) for index in indexes]
+        await OrderTable.bulk_create(chunk, batch_size=SEED_BATCH_SIZE)
+
+
+async def seed(dogs: int, walkers: int, orders: int, first_day: date) -> None:
+    """
+    Insert the dataset in bulk, orders on the slot grid without slot conflicts.
+
+    Order ``i`` books pair ``i % n`` of dog and walker (``n`` the smaller pool) in
+    slot ``i // n``, so no dog or walker is ever booked twice in a slot.
+
+    Args:
+        dogs (int): Number of dogs.
+        walkers (int): Number of walkers.
+        orders (int): Number of orders.
+        first_day (date): The day of the first slot.
+    """
+    dog_rows: list[DogTable] = [_dog(index) for index in range(dogs)]
+    walker_rows: list[DogWalkerTable] = [_walker(index) for index in range(walkers)]
+    await DogTable.bulk_create(dog_rows, batch_size=SEED_BATCH_SIZE)
+    await DogWalkerTable.bulk_create(walker_rows, batch_size=SEED_BATCH_SIZE)
+    await _seed_orders(list(zip(dog_rows, walker_rows)), orders, first_day)
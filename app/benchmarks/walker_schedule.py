@@ -0,0 +1,154 @@
+"""
+Latency of ``GET /api/v1/dogs-walkers/{id}/schedule/`` over a large order history.
+
+Fills an in-memory SQLite database with orders spread over many walkers and
+days, then measures requests for random (walker, day) pairs twice: cold, where
+every schedule is read with the ``(walker_id, walk_at)`` range query, and warm,
+where it is served from the schedule cache.
+
+Usage:
+    python -m benchmarks.walker_schedule [--orders 500000] [--walkers 50] [--requests 2000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient, Response
+from tortoise import Tortoise, timezone
+
+from database.models import DogTable, DogWalkerTable, OrderTable
+from main import app
+from service.availability import SLOT_MINUTES, SLOTS_PER_DAY
+from service.schedule import walker_schedules
+
+DEFAULT_ORDERS = 500000
+DEFAULT_WALKERDEFAULT_ORDERS = 500000
+DEFAULT_WALKERS = 50
+DEFAULT_REQUESTS = 2000
+INSERT_CHUNK = 10000
+BATCH_SIZE = 1000
+MILLISECONDS = 1000
+FIRST_DAY = datetime(2020, 1, 1, 7)  # noqa: WPS432
+NAME = "Schedule"
+# The median, the 95th and the 99th percentile are cut points 49, 94 and 98.
+ROW = "{0}: p50 {1[49]:.2f} ms, p95 {1[94]:.2f} ms, p99 {1[98]:.2f} ms"
+
+
+def _dog(index: int) -> DogTable:
+    return DogTable(apartment=index, name=NAME, breed="Mutt")
+
+
+def _walker(index: int) -> DogWalkerTable:
+    return DogWalkerTable(name=NAME, surname=str(index))
+
+
+def _report(name: str, samples: list[float]) -> None:
+    print(ROW.format(name, statistics.quantiles(samples, n=100)))
+
+
+def _order(index: int, dogs: list[DogTable], staff: list[DogWalkerTable]) -> OrderTable:
+    rest, slot = divmod(index, SLOTS_PER_DAY)
+    day, walker = divmod(rest, len(staff))
+    walk_at: datetime = FIRST_DAY + timedelta(days=day, minutes=SLOT_MINUTES * slot)
+    # Every walker walks its own dog, so no dog is booked twice in a slot.
+    return OrderTable(
+        walk_at=timezone.make_aware(walk_at),
+        dog_id=dogs[walker].id,
+        walker_id=staff[walker].id,
+    )
+
+
+class ScheduleBenchmark:
+    """
+    Schedule requests for random walkers and days of a filled order history.
+
+    Attributes:
+        orders (int): Number of orders to create.
+        walkers (int): Number of walkers the orders are spread over.
+        days (list[date]): Days covered by the orders.
+    """
+
+    def __init__(self, orders: int, walkers: int) -> None:
+        self.orders = orders
+        self.walkers = walkers
+        first: date = FIRST_DAY.date()
+        days: int = orders // (walkers * SLOTS_PER_DAY) + 1
+        self.days = [first + timedelta(days=day) for day in range(days)]
+        self._staff: list[DogWalkerTable] = []
+
+    async def fill(self) -> None:
+        """
+        Create one dog per walker and the orders, walker after walker and day after day.
+        """
+        dogs = [_dog(index) for index in range(self.walkers)]
+        self._staff = [_walker(index) for index in range(self.walkers)]
+        await DogTable.bulk_create(dogs)
+        await DogWalkerTable.bulk_create(self._staff)
+        for chunk in range(0, self.orders, INSERT_CHUNK):
+            indexes: range = range(chunk, min(chunk + INSERT_CHUNK, self.orders))
+            batch: list[OrderTable] = [_order(index, dogs, self._staff) for index in indexes]
+            await OrderTable.bulk_create(batch, batch_size=BATCH_SIZE)
+
+    def pairs(self, requests: int) -> list[tuple[DogWalkerTable, date]]:
+        """
+        Pick random walkers and days.
+
+        Args:
+            requests (int): Number of pairs.
+
+        Returns:
+            list[tuple[DogWalkerTable, date]]: The walker and the day of every request.
+        """
+        walkers: list[DogWalkerTable] = random.choices(self._staff, k=requests)
+        days: list[date] = random.choices(self.days, k=requests)
+        return list(zip(walkers, days))
+
+    async def measure(self, client: AsyncClient, pairs: list[tuple[DogWalkerTable, date]]) -> list[float]:
+        """
+        Request the schedule of every pair.
+
+        Args:
+            client (AsyncClient): The client bound to the ASGI app.
+            pairs (list[tuple[DogWalkerTable, date]]): The walker and the day of every request.
+
+        Returns:
+            list[float]: Latency of every request in milliseconds.
+        """
+        return [await self._request(client, walker, day) for walker, day in pairs]
+
+    async def _request(self, client: AsyncClient, walker: DogWalkerTable, day: date) -> float:
+        started: float = time.perf_counter()
+        response: Response = await client.get(
+            f"/api/v1/dogs-walkers/{walker.id}/schedule/",
+            params={"date": day.isoformat()},
+        )
+        elapsed: float = time.perf_counter() - started
+        assert response.is_success, response.text
+        return elapsed * MILLISECONDS
+
+
+async def main(orders: int, walkers: int, requests: int) -> None:
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["database.models"]})
+    await Tortoise.generate_schemas()
+    walker_schedules.cache.max_size = requests
+    benchmark = ScheduleBenchmark(orders, walkers)
+    await benchmark.fill()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:  # type: ignore
+        pairs: list[tuple[DogWalkerTable, date]] = benchmark.pairs(requests)
+        for name in ("cold", "warm"):
+            samples: list[float] = await benchmark.measure(client, pairs)
+            _report(f"{orders} orders, {name}", samples)
+    print("schedule cache:", walker_schedules.stats)
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=DEFAULT_ORDERS)
+    parser.add_argument("--walkers", type=int, default=DEFAULT_WALKERS)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.orders, arguments.walkers, arguments.requests))
@@ -0,0 +1,179 @@
+"""
+Benchmark of write latency and SQL statement count per write endpoint.
+
+Drives POST/PUT/DELETE of every router through the ASGI app against an
+in-memory SQLite database and counts the statements the Tortoise client logs.
+
+Usage:
+    python -m benchmarks.write_path [--rounds 200]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from httpx import ASGITransport, AsyncClient, Response
+from tortoise import Tortoise
+
+from main import app
+from service.registry import registry
+
+DEFAULT_ROUNDS = 200
+MILLISECONDS = 1000
+# Indexes of the median and the 95th percentile among the percentile cut points.
+MEDIAN = 49
+P95 = 94
+FIRST_SLOT_HOUR = 7
+SLOTS_PER_DAY = 32
+SLOT_MINUTES = 30
+
+DOGS = "dogs"
+WALKERS = "dogs-walkers"
+ORDERS = "orders"
+# Created and updated in this order, deleted in the reverse one.
+ENTITIES: tuple[str, ...] = (DOGS, WALKERS, ORDERS)
+NAME = "Bench"
+
+HEADER = "{0:<24}{1:>10}{2:>10}{3:>10}{4:>14}"
+ROW = "{0:<24}{1:>10.3f}{2:>10.3f}{3:>10.3f}{4:>14.1f}"
+
+
+class StatementCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+def _report(name: str, timings: list[float], statements: float) -> None:
+    quantiles: list[float] = statistics.quantiles(timings, n=100)
+    median, p95 = quantiles[MEDIAN], quantiles[P95]
+    print(ROW.format(name, statistics.mean(timings), median, p95, statements))
+
+
+def _url(entity: str, row_id: str | None = None) -> str:
+    path: str = f"/api/v1/{entity}/"
+    return f"{path}{row_id}/" if row_id else path
+
+
+def _slot(start: datetime, index: int) -> str:
+    day, half_hour = divmod(index, SLOTS_PER_DAY)
+    return (start + timedelta(days=day, minutes=SLOT_MINUTES * half_hour)).strftime("%Y-%m-%d %H:%M")
+
+
+class WriteBenchmark:
+    """
+    Writes of every entity, each endpoint called ``rounds`` times.
+
+    Rows created by the POST rounds are updated and deleted by the following ones.
+
+    Attributes:
+        client (AsyncClient): The client bound to the ASGI app.
+        rounds (int): Number of requests per endpoint.
+        counter (StatementCounter): The statement counter attached to the Tortoise client logger.
+        ids (dict[str, list[str]]): Identifiers of the created rows by entity.
+    """
+
+    def __init__(self, client: AsyncClient, rounds: int, counter: StatementCounter) -> None:
+        self.client = client
+        self.rounds = rounds
+        self.counter = counter
+        self.ids: dict[str, list[str]] = {DOGS: [], WALKERS: [], ORDERS: []}
+        tomorrow: datetime = datetime.now() + timedelta(days=1)
+        self._start: datetime = tomorrow.replace(hour=FIRST_SLOT_HOUR, minute=0, second=0, microsecond=0)
+
+    async def run(self) -> None:
+        """
+        Create, update and delete rows of every entity, printing one line per endpoint.
+        """
+        print(HEADER.format("endpoint", "mean ms", "p50 ms", "p95 ms", "statements"))
+        for created in ENTITIES:
+            await self.measure(f"POST {created}", partial(self._create, created))
+        for updated in ENTITIES:
+            await self.measure(f"PUT {updated}", partial(self._update, updated))
+        for deleted in reversed(ENTITIES):
+            await self.measure(f"DELETE {deleted}", partial(self._delete, deleted))
+
+    async def measure(self, name: str, call: Callable[[int], Awaitable[Response]]) -> None:
+        """
+        Run a write ``rounds`` times and print latency percentiles and statements per call.
+
+        Args:
+            name (str): Label of the endpoint.
+            call (Callable[[int], Awaitable[Response]]): Performs the request for the given round.
+        """
+        timings: list[float] = []
+        self.counter.count = 0
+        for index in range(self.rounds):
+            started: float = time.perf_counter()
+            response: Response = await call(index)
+            timings.append((time.perf_counter() - started) * MILLISECONDS)
+            assert response.is_success, (name, response.status_code, response.text)
+        _report(name, timings, self.counter.count / self.rounds)
+
+    async def _create(self, entity: str, index: int) -> Response:
+        response: Response = await self.client.post(
+            _url(entity),
+            json=self._payload(entity, index),
+        )
+        self.ids[entity].append(response.json()["id"])
+        return response
+
+    async def _update(self, entity: str, index: int) -> Response:
+        return await self.client.put(
+            _url(entity, self.ids[entity][index]),
+            json=self._payload(entity, index, update=True),
+        )
+
+    async def _delete(self, entity: str, index: int) -> Response:
+        row_id: str = self.ids[entity][index]
+        return await self.client.delete(_url(entity, row_id))
+
+    def _payload(self, entity: str, index: int, update: bool = False) -> dict[str, Any]:
+        if entity == DOGS:
+            return {"apartment": 2 if update else 1, "name": NAME, "breed": "Mutt"}
+        if entity == WALKERS:
+            return {"name": NAME, "surname": "Walker", "active": True}
+        references: dict[str, str] = {
+            "dog": self.ids[DOGS][index],
+            "walker": self.ids[WALKERS][index],
+        }
+        if update:
+            return {**references, "status": "В процессе"}
+        return {**references, "status": "Запланирована", "walk_at": _slot(self._start, index)}
+
+
+def _attach(counter: StatementCounter) -> logging.Logger:
+    logger: logging.Logger = logging.getLogger("tortoise.db_client")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    logger.propagate = False
+    return logger
+
+
+async def main(rounds: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["database.models"]},
+    )
+    await Tortoise.generate_schemas()
+    registry.build()
+    counter = StatementCounter()
+    logger: logging.Logger = _attach(counter)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:  # type: ignore
+        await WriteBenchmark(client, rounds, counter).run()
+    logger.removeHandler(counter)
+    registry.clear()
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    asyncio.run(main(parser.parse_args().rounds))
@@ -0,0 +1,373 @@
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Iterator, NamedTuple
+from uuid import UUID
+
+from tortoise import timezone
+
+from api.v1.order.models import MIN_HOUR
+from database.models import OrderStatus
+from service.availability import SLOT_MINUTES, SLOTS_PER_DAY
+
+DATASET_BATCH_SIZE = 10000
+
+DOG_COLUMNS: tuple[str, ...] = ("id", "created", "updated", "apartment", "name", "breed", "active")
+WALKER_COLUMNS: tuple[str, ...] = ("id", "created", "updated", "name", "surname", "active")
+ORDER_COLUMNS: tuple[str, ...] = ("id", "created", "updated", "walk_at", "status", "dog_id", "walker_id")
+
+DOG_NAMES: tuple[str, ...] = (
+    "Bella",
+    "Max",
+    "Luna",
+    "Charlie",
+    "Lucy",
+    "Cooper",
+    "Daisy",
+    "Milo",
+    "Bailey",
+    "Rocky",
+    "Sadie",
+    "Buddy",
+    "Molly",
+    "Tucker",
+    "Stella",
+    "Bear",
+    "Zoe",
+    "Duke",
+    "Lola",
+    "Teddy",
+)
+BREEDS: tuple[str, ...] = (
+    "Labrador",
+    "German Shepherd",
+    "Golden Retriever",
+    "French Bulldog",
+    "Beagle",
+    "Poodle",
+    "Dachshund",
+    "Corgi",
+    "Husky",
+    "Boxer",
+    "Spaniel",
+    "Shiba Inu",
+    "Mutt",
+)
+NAMES: tuple[str, ...] = (
+    "Ivan",
+    "Anna",
+    "Pavel",
+    "Olga",
+    "Sergey",
+    "Maria",
+    "Dmitry",
+    "Elena",
+    "Alexey",
+    "Irina",
+    "Nikita",
+    "Daria",
+    "Artem",
+    "Polina",
+    "Roman",
+    "Ksenia",
+)
+SURNAMES: tuple[str, ...] = (
+    "Ivanov",
+    "Smirnov",
+    "Kuznetsov",
+    "Popov",
+    "Vasiliev",
+    "Petrov",
+    "Sokolov",
+    "Mikhailov",
+    "Novikov",
+    "Fedorov",
+    "Morozov",
+    "Volkov",
+    "Alekseev",
+    "Lebedev",
+    "Semenov",
+    "Egorov",
+)
+
+MINUTES_PER_HOUR = 60
+SLOT = timedelta(minutes=SLOT_MINUTES)
+DAYS_PER_WEEK = 7
+DAYS_OFF = 2
+FIRST_WEEKEND_DAY = 5
+MAX_APARTMENT = 500
+DAYS_PER_YEAR = 365
+UUID_BITS = 128
+SEED_BITS = 64
+# Dogs and walkers joined that long before the dataset is generated.
+JOINED_BEFORE = timedelta(days=DAYS_PER_YEAR)
+# Orders are placed that long ahead of the walk.
+PLACED_AHEAD = timedelta(days=2)
+# A demand peak: its height, its hour and its width in hours.
+Peak = tuple[float, float, float]
+# Demand of a day: a base share and its peaks.
+WEEKDAY_DEMAND: tuple[float, tuple[Peak, ...]] = (0.2, ((0.75, 8.5, 1.2), (0.75, 19, 1.5)))
+WEEKEND_DEMAND: tuple[float, tuple[Peak, ...]] = (0.3, ((0.6, 11, 2.5), (0.5, 18, 2)))
+
+Ids = list[UUID]
+# Walkers on shift in every slot of every weekday.
+Shifts = list[list[Ids]]
+
+
+def _peak(hour: float, peak: Peak) -> float:
+    height, center, width = peak
+    return height * math.exp(-(((hour - center) / width) ** 2))
+
+
+def demand(slot: int, weekend: bool) -> float:
+    """
+    Share of the walkers on shift booked in a slot, before ``utilization``.
+
+    Weekdays peak before and after office hours, weekends are flatter with a late
+    morning peak.
+
+    Args:
+        slot (int): The slot number within the day, 0 for 7:00.
+        weekend (bool): Whether the day is a Saturday or a Sunday.
+
+    Returns:
+        float: The relative demand, between 0 and 1.
+    """
+    hour: float = MIN_HOUR + slot * SLOT_MINUTES / MINUTES_PER_HOUR
+    base, peaks = WEEKEND_DEMAND if weekend else WEEKDAY_DEMAND
+    peaks_total: float = sum(_peak(hour, peak) for peak in peaks)
+    return min(1.0, base + peaks_total)
+
+
+def _uuid(generator: random.Random) -> UUID:
+    return UUID(int=generator.getrandbits(UUID_BITS), version=4)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    Shape of a synthetic dataset, the same spec always gives the same rows.
+
+    Attributes:
+        dogs (int): Number of dogs.
+        walkers (int): Number of dog walkers.
+        orders (int): Number of orders.
+        seed (int): Seed of the random generator.
+        today (date): Days before it are history, orders from it on are planned.
+        horizon_days (int): Number of days from ``today`` on that are booked.
+        utilization (float): Share of the walkers on shift booked at peak demand.
+        cancel_rate (float): Share of past orders that were cancelled.
+        inactive_rate (float): Share of walkers that left and have no orders.
+        shift_slots (int): Length of a walker shift in slots.
+    """
+
+    dogs: int = 10000
+    walkers: int = 1000
+    orders: int = 1000000
+    seed: int = 0
+    today: date = field(default_factory=date.today)
+    horizon_days: int = 14
+    utilization: float = 0.5
+    cancel_rate: float = 0.05
+    inactive_rate: float = 0.05
+    shift_slots: int = 16
+
+
+class _Day(NamedTuple):
+    weekday: int
+    history: bool
+    start: datetime
+    created: datetime
+
+
+class Dataset:  # noqa: WPS214
+    """
+    Seeded synthetic dogs, dog walkers and orders.
+
+    Every walker works a fixed shift of ``shift_slots`` consecutive slots five days
+    a week. The orders of a slot book distinct walkers on shift and distinct dogs,
+    so the ``(walk_at, walker)`` and ``(walk_at, dog)`` unique constraints always
+    hold, and every walk is on the half-hour grid of ``WalkTime``. The number of
+    bookings follows the daily demand profile, the days run backward from the end
+    of the horizon until the orders are placed.
+
+    Dogs and walkers are kept in memory, orders are generated batch by batch and
+    never held together.
+
+    Attributes:
+        spec (DatasetSpec): The parameters of the dataset.
+        dogs (list[tuple]): Dog rows, values in ``DOG_COLUMNS`` order.
+        walkers (list[tuple]): Walker rows, values in ``WALKER_COLUMNS`` order.
+        on_shift (Shifts): Ids of the walkers on shift in every slot of every weekday.
+        first_day (date): The day of the earliest order.
+    """
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        """
+        Args:
+            spec (DatasetSpec): The parameters of the dataset.
+
+        Raises:
+            ValueError: When orders are requested without dogs or active walkers.
+        """
+        self.spec = spec
+        self._random = random.Random(spec.seed)
+        joined: datetime = timezone.make_aware(datetime.combine(spec.today, time()) - JOINED_BEFORE)
+        self.dogs: list[tuple] = [self._dog(joined) for _ in range(spec.dogs)]
+        self.walkers: list[tuple] = [self._walker(joined) for _ in range(spec.walkers)]
+        self.on_shift: Shifts = [[[] for _ in range(SLOTS_PER_DAY)] for _ in range(DAYS_PER_WEEK)]
+        for walker in self.walkers:
+            if walker[-1]:
+                self._assign_shift(walker[0])
+        staffed: bool = any(map(any, self.on_shift))
+        if spec.orders and not (self.dogs and staffed):
+            raise ValueError("Orders need at least one dog and one active walker")
+        self._order_seed: int = self._random.getrandbits(SEED_BITS)
+        self.first_day: date = self._plan_first_day()
+
+    def orders(self, batch_size: int = DATASET_BATCH_SIZE) -> Iterator[list[tuple]]:
+        """
+        Generate the orders in ``walk_at`` order.
+
+        Iterating again yields the same orders.
+
+        Args:
+            batch_size (int): The number of orders per batch.
+
+        Returns:
+            Iterator[list[tuple]]: Batches of order rows, values in ``ORDER_COLUMNS`` order.
+        """
+        rows: Iterator[tuple] = _OrderPass(self, random.Random(self._order_seed)).rows()
+        batch: list[tuple] = list(islice(rows, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(rows, batch_size))
+
+    def expected(self, weekday: int, slot: int) -> float:
+        """
+        Expected number of orders in a slot, before the dogs and the remaining orders cap it.
+
+        Args:
+            weekday (int): The weekday, 0 for Monday.
+            slot (int): The slot number within the day.
+
+        Returns:
+            float: The expected number of orders.
+        """
+        weekend: bool = weekday >= FIRST_WEEKEND_DAY
+        on_shift: int = len(self.on_shift[weekday][slot])
+        return self.spec.utilization * demand(slot, weekend) * on_shift
+
+    def _dog(self, joined: datetime) -> tuple:
+        # The draws follow the columns, the same seed keeps giving the same rows.
+        dog_id: UUID = _uuid(self._random)
+        apartment: int = self._random.randint(1, MAX_APARTMENT)
+        name: str = self._random.choice(DOG_NAMES)
+        breed: str = self._random.choice(BREEDS)
+        return (dog_id, joined, joined, apartment, name, breed, True)  # noqa: WPS227
+
+    def _walker(self, joined: datetime) -> tuple:
+        walker_id: UUID = _uuid(self._random)
+        name: str = self._random.choice(NAMES)
+        surname: str = self._random.choice(SURNAMES)
+        active: bool = self._random.random() >= self.spec.inactive_rate
+        return (walker_id, joined, joined, name, surname, active)  # noqa: WPS227
+
+    def _assign_shift(self, walker_id: UUID) -> None:
+        starts: int = SLOTS_PER_DAY - self.spec.shift_slots + 1
+        start: int = self._random.randrange(starts)
+        days_off: list[int] = self._random.sample(range(DAYS_PER_WEEK), DAYS_OFF)
+        for weekday in range(DAYS_PER_WEEK):
+            if weekday in days_off:
+                continue
+            for slot in range(start, start + self.spec.shift_slots):
+                self.on_shift[weekday][slot].append(walker_id)
+
+    def _plan_first_day(self) -> date:
+        horizon: int = max(self.spec.horizon_days, 1)
+        per_weekday: list[float] = [self._expected_day(weekday) for weekday in range(DAYS_PER_WEEK)]
+        # Days are filled backward from the last day of the horizon.
+        day: date = self.spec.today + timedelta(days=horizon - 1)
+        placed: float = per_weekday[day.weekday()]
+        while placed < self.spec.orders:
+            day -= timedelta(days=1)
+            placed += per_weekday[day.weekday()]
+        return day
+
+    def _expected_day(self, weekday: int) -> float:
+        dogs: int = len(self.dogs)
+        slots: Iterator[float] = (self.expected(weekday, slot) for slot in range(SLOTS_PER_DAY))
+        return sum(min(expected, dogs) for expected in slots)
+
+
+class _OrderPass:
+    """
+    One pass over the orders of a dataset, slot after slot from its first day on.
+
+    Attributes:
+        left (int): Orders still to generate.
+    """
+
+    def __init__(self, dataset: Dataset, generator: random.Random) -> None:
+        """
+        Args:
+            dataset (Dataset): The dataset.
+            generator (random.Random): The random generator of the pass.
+        """
+        self.left: int = dataset.spec.orders
+        self._dataset = dataset
+        self._random = generator
+        self._dog_ids: Ids = [dog[0] for dog in dataset.dogs]
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Generate the order rows.
+
+        Returns:
+            Iterator[tuple]: Order rows, values in ``ORDER_COLUMNS`` order.
+        """
+        day: date = self._dataset.first_day
+        while self.left:
+            yield from self._day_rows(self._day(day))
+            day += timedelta(days=1)
+
+    def _day(self, day: date) -> _Day:
+        today: date = self._dataset.spec.today
+        start: datetime = datetime.combine(day, time(MIN_HOUR))
+        # Orders are placed ahead, or on the day the dataset is generated.
+        created: datetime = min(start - PLACED_AHEAD, datetime.combine(today, time()))
+        return _Day(day.weekday(), day < today, start, timezone.make_aware(created))
+
+    def _day_rows(self, day: _Day) -> Iterator[tuple]:
+        for slot in range(SLOTS_PER_DAY):
+            if not self.left:
+                return
+            yield from self._slot_rows(day, slot)
+
+    def _slot_rows(self, day: _Day, slot: int) -> Iterator[tuple]:
+        on_shift: Ids = self._dataset.on_shift[day.weekday][slot]
+        expected: float = self._dataset.expected(day.weekday, slot) + self._random.random()
+        capacity: int = min(len(on_shift), len(self._dog_ids), self.left)
+        booked: int = min(int(expected), capacity)
+        if not booked:
+            return
+        self.left -= booked
+        # Dogs are drawn before walkers.
+        dog_ids: Ids = self._random.sample(self._dog_ids, booked)
+        yield from self._walks(day, slot, dog_ids, self._random.sample(on_shift, booked))
+
+    def _walks(self, day: _Day, slot: int, dog_ids: Ids, walker_ids: Ids) -> Iterator[tuple]:
+        walk_at: datetime = timezone.make_aware(day.start + SLOT * slot)
+        updated: datetime = walk_at + SLOT if day.history else day.created
+        for dog_id, walker_id in zip(dog_ids, walker_ids):
+            status: OrderStatus = self._status(day.history)
+            yield (_uuid(self._random), day.created, updated, walk_at, status, dog_id, walker_id)  # noqa: WPS227
+
+    def _status(self, history: bool) -> OrderStatus:
+        if not history:
+            return OrderStatus.planned
+        if self._random.random() < self._dataset.spec.cancel_rate:
+            return OrderStatus.cancel
+        return OrderStatus.success
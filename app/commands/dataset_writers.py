@@ -0,0 +1,189 @@
+from datetime import datetime
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+from uuid import UUID
+
+import orjson
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from commands.dataset import DATASET_BATCH_SIZE, DOG_COLUMNS, ORDER_COLUMNS, WALKER_COLUMNS, Dataset
+from database.models import DogTable, DogWalkerTable, OrderTable
+
+Columns = tuple[str, ...]
+# Rows of a table, one statement or write per batch.
+Batches = Iterator[list[tuple]]
+# A table, its columns and its rows.
+Table = tuple[str, Columns, Batches]
+
+NDJSON_LINE = partial(orjson.dumps, option=orjson.OPT_APPEND_NEWLINE)
+INSERT = 'INSERT INTO "{0}" ({1}) VALUES ({2})'
+# Indexes backing primary keys and unique constraints are left alone.
+POSTGRES_INDEXES = """
+    SELECT indexname AS name, indexdef AS sql FROM pg_indexes
+    WHERE tablename = $1 AND indexdef NOT LIKE 'CREATE UNIQUE%'
+"""
+SQLITE_INDEXES = """
+    SELECT name, sql FROM sqlite_master
+    WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'
+"""
+
+
+def _plain(cell: Any, text: dict[Any, str] | None = None) -> Any:
+    # Enums are stored by value. With a cache, ids and timestamps are stored as text like the ORM
+    # stores them on SQLite, the text of the timestamps shared by many rows is built once.
+    if isinstance(cell, Enum):
+        return cell.value
+    if text is None or not isinstance(cell, (UUID, datetime)):
+        return cell
+    if cell not in text:
+        text[cell] = str(cell)
+    return text[cell]
+
+
+def _chunks(rows: list[tuple], size: int) -> Batches:
+    starts = range(0, len(rows), size)
+    return (rows[start:start + size] for start in starts)
+
+
+def _tables(dataset: Dataset, batch_size: int) -> tuple[Table, ...]:
+    return (
+        (DogTable.Meta.table, DOG_COLUMNS, _chunks(dataset.dogs, batch_size)),
+        (DogWalkerTable.Meta.table, WALKER_COLUMNS, _chunks(dataset.walkers, batch_size)),
+        (OrderTable.Meta.table, ORDER_COLUMNS, dataset.orders(batch_size)),
+    )
+
+
+def _write_lines(target: BinaryIO, columns: Columns, batches: Batches) -> int:
+    written: int = 0
+    for rows in batches:
+        lines: list[dict] = [dict(zip(columns, map(_plain, row))) for row in rows]
+        target.write(b"".join(map(NDJSON_LINE, lines)))
+        written += len(rows)
+    return written
+
+
+def write_ndjson(dataset: Dataset, directory: Path, batch_size: int = DATASET_BATCH_SIZE) -> dict[str, int]:
+    """
+    Write the dataset as one NDJSON file per table, in the export format.
+
+    Args:
+        dataset (Dataset): The dataset.
+        directory (Path): The directory of ``dogs.ndjson``, ``dog_walkers.ndjson`` and ``orders.ndjson``.
+        batch_size (int): The number of orders encoded per write.
+
+    Returns:
+        dict[str, int]: Number of rows written per table.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    written: dict[str, int] = {}
+    for table, columns, batches in _tables(dataset, batch_size):
+        with open(directory / "{0}.ndjson".format(table), "wb") as target:
+            written[table] = _write_lines(target, columns, batches)
+    return written
+
+
+class _Loader:
+    """
+    Bulk loader of tables through one Tortoise connection.
+    """
+
+    def __init__(self, connection_name: str, defer_indexes: bool) -> None:
+        """
+        Args:
+            connection_name (str): The Tortoise connection to write with.
+            defer_indexes (bool): Whether secondary indexes are built after the load.
+        """
+        self._name = connection_name
+        self._connection = Tortoise.get_connection(connection_name)
+        self._postgres: bool = self._connection.capabilities.dialect == "postgres"
+        self._defer_indexes = defer_indexes
+
+    async def load(self, table: str, columns: Columns, batches: Batches) -> int:
+        """
+        Load the rows of a table, its secondary indexes dropped meanwhile unless asked not to.
+
+        Args:
+            table (str): The table.
+            columns (tuple[str, ...]): The columns of the rows.
+            batches (Iterator[list[tuple]]): The rows, one statement per batch.
+
+        Returns:
+            int: Number of rows written.
+        """
+        indexes: list[dict] = await self._secondary_indexes(table) if self._defer_indexes else []
+        for dropped in indexes:
+            await self._connection.execute_script('DROP INDEX "{0}"'.format(dropped["name"]))
+        try:  # noqa: WPS501
+            return await self._insert_all(table, columns, batches)
+        finally:
+            for index in indexes:
+                await self._connection.execute_script(index["sql"])
+
+    async def _secondary_indexes(self, table: str) -> list[dict]:
+        query: str = POSTGRES_INDEXES if self._postgres else SQLITE_INDEXES
+        return await self._connection.execute_query_dict(query, [table])
+
+    async def _insert_all(self, table: str, columns: Columns, batches: Batches) -> int:
+        written: int = 0
+        for rows in batches:
+            await self._insert(table, columns, rows)
+            written += len(rows)
+        return written
+
+    async def _insert(self, table: str, columns: Columns, rows: list[tuple]) -> None:
+        if self._postgres:
+            await self._copy(table, columns, rows)
+            return
+        text: dict[Any, str] = {}
+        plain = partial(_plain, text=text)
+        converted: list[list] = [list(map(plain, row)) for row in rows]
+        await self._connection.execute_many(self._statement(table, columns), converted)
+
+    def _statement(self, table: str, columns: Columns) -> str:
+        names: str = ", ".join(map('"{0}"'.format, columns))
+        placeholders: str = ", ".join("?" * len(columns))
+        return INSERT.format(table, names, placeholders)
+
+    async def _copy(self, table: str, columns: Columns, rows: list[tuple]) -> None:
+        records: list[tuple] = [tuple(map(_plain, row)) for row in rows]
+        async with in_transaction(self._name) as transaction:
+            # Tortoise has no COPY API, the transaction exposes the underlying asyncpg connection.
+            asyncpg_connection: Any = transaction._connection  # noqa: WPS437
+            await asyncpg_connection.copy_records_to_table(table, records=records, columns=list(columns))
+
+
+async def write_database(
+    dataset: Dataset,
+    batch_size: int = DATASET_BATCH_SIZE,
+    connection_name: str = "default",
+    defer_indexes: bool = True,
+) -> dict[str, int]:
+    """
+    Insert the dataset into initialized Tortoise tables.
+
+    Postgres loads every batch with a binary ``COPY``, SQLite with one
+    prepared ``INSERT`` executed for the whole batch. Rows bypass the repositories,
+    no write event is published, caches of running workers are not invalidated.
+
+    Keeping every secondary index current row by row costs more than building it
+    once, so by default they are dropped during the load and created again after
+    it. Primary keys and unique constraints are kept and still checked. Meant for
+    a database that does not serve traffic meanwhile.
+
+    Args:
+        dataset (Dataset): The dataset.
+        batch_size (int): The number of rows per statement.
+        connection_name (str): The Tortoise connection to write with.
+        defer_indexes (bool): Whether secondary indexes are built after the load.
+
+    Returns:
+        dict[str, int]: Number of rows written per table.
+    """
+    loader = _Loader(connection_name, defer_indexes)
+    written: dict[str, int] = {}
+    for table, columns, batches in _tables(dataset, batch_size):
+        written[table] = await loader.load(table, columns, batches)
+    return written
@@ -0,0 +1,103 @@
+"""
+Generate a seeded synthetic dataset of dogs, dog walkers and orders.
+
+Orders are spread over the half-hour grid following a daily demand profile,
+no dog or walker is booked twice in a slot. The same arguments always give the
+same rows. The dataset is inserted in bulk into the database, whose tables must
+exist, or written to dogs.ndjson, dog_walkers.ndjson and orders.ndjson in the
+export format.
+
+Usage:
+    python -m commands.generate_dataset [--dogs 10000] [--walkers 1000] [--orders 1000000] [--seed 0]
+                                        [--today 2024-06-01] [--horizon-days 14] [--output db|ndjson] [--keep-indexes]
+                                        [--directory dataset] [--db-url sqlite://db.sqlite3] [--batch-size 10000]
+"""
+import argparse
+import asyncio
+import itertools
+import time
+from datetime import date
+from pathlib import Path
+
+from tortoise import Tortoise
+
+from commands.dataset import DATASET_BATCH_SIZE, Dataset, DatasetSpec
+from commands.dataset_writers import write_database, write_ndjson
+from core.config import settings
+
+DEFAULT_DOGS = 10000
+DEFAULT_WALKERS = 1000
+DEFAULT_ORDERS = 1000000
+DEFAULT_HORIZON_DAYS = 14
+NDJSON = "ndjson"
+WRITTEN = "{0} {1}"
+SUMMARY = "{0} from {1} in {2:.2f} s ({3:.0f} rows/s)"
+
+
+async def write(dataset: Dataset, arguments: argparse.Namespace) -> dict[str, int]:
+    """
+    Write the dataset where the command line asks for.
+
+    Args:
+        dataset (Dataset): The dataset.
+        arguments (argparse.Namespace): The command line.
+
+    Returns:
+        dict[str, int]: Number of rows written per table.
+    """
+    if arguments.output == NDJSON:
+        return await asyncio.to_thread(write_ndjson, dataset, Path(arguments.directory), arguments.batch_size)
+    await Tortoise.init(db_url=arguments.db_url, modules={"models": ["database.models"]})
+    try:  # noqa: WPS501
+        return await write_database(dataset, arguments.batch_size, defer_indexes=not arguments.keep_indexes)
+    finally:
+        await Tortoise.close_connections()
+
+
+def summary(written: dict[str, int], first_day: date, seconds: float) -> str:
+    """
+    Describe the rows written and the write rate.
+
+    Args:
+        written (dict[str, int]): Number of rows written per table.
+        first_day (date): First day of the orders.
+        seconds (float): Wall time of the generation and the write.
+
+    Returns:
+        str: The line printed once done.
+    """
+    tables: str = ", ".join(itertools.starmap(WRITTEN.format, written.items()))
+    rows: int = sum(written.values())
+    return SUMMARY.format(tables, first_day, seconds, rows / seconds)
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    started: float = time.perf_counter()
+    dataset = Dataset(
+        DatasetSpec(
+            dogs=arguments.dogs,
+            walkers=arguments.walkers,
+            orders=arguments.orders,
+            seed=arguments.seed,
+            today=arguments.today,
+            horizon_days=arguments.horizon_days,
+        ),
+    )
+    written: dict[str, int] = await write(dataset, arguments)
+    print(summary(written, dataset.first_day, time.perf_counter() - started))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dogs", type=int, default=DEFAULT_DOGS)
+    parser.add_argument("--walkers", type=int, default=DEFAULT_WALKERS)
+    parser.add_argument("--orders", type=int, default=DEFAULT_ORDERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--today", type=date.fromisoformat, default=date.today(), help="First day of planned orders")
+    parser.add_argument("--horizon-days", type=int, default=DEFAULT_HORIZON_DAYS, help="Days booked from --today on")
+    parser.add_argument("--output", choices=("db", NDJSON), default="db")
+    parser.add_argument("--directory", default="dataset", help="Directory of the NDJSON files")
+    parser.add_argument("--db-url", default=settings.db.postgres_dsn)
+    parser.add_argument("--batch-size", type=int, default=DATASET_BATCH_SIZE)
+    parser.add_argument("--keep-indexes", action="store_true", help="Maintain secondary indexes during the load")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, TextIO
+
+from api.v1.export import NDJSON_LINE, TO_JSON, FileFormat
+from models.bulk import ImportReport, RejectedRow
+from service.importer import import_records, read_records
+from service.services import BaseService
+
+# 64 KiB.
+READ_SIZE = 65536
+STANDARD_INPUT = "-"
+CSV_SUFFIX = ".csv"
+SUMMARY = "received {0}, imported {1}, rejected {2} in {3:.2f} s ({4:.0f} rows/s)"
+
+
+async def read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+    """
+    Read a file in fixed-size chunks without blocking the event loop.
+
+    Args:
+        source (BinaryIO): The open file.
+
+    Returns:
+        AsyncIterator[bytes]: The file content.
+    """
+    chunk: bytes = await asyncio.to_thread(source.read, READ_SIZE)
+    while chunk:
+        yield chunk
+        chunk = await asyncio.to_thread(source.read, READ_SIZE)
+
+
+def open_source(files: ExitStack, path: str) -> BinaryIO:
+    """
+    Open the file to import, closed with the other files of the import.
+
+    Args:
+        files (ExitStack): The files of the import.
+        path (str): The file, ``-`` for standard input.
+
+    Returns:
+        BinaryIO: The open file.
+    """
+    if path == STANDARD_INPUT:
+        return sys.stdin.buffer
+    return files.enter_context(Path(path).open("rb"))
+
+
+def file_format(path: str, chosen: FileFormat | None) -> FileFormat:
+    """
+    Return the format of the file to import, guessed from its extension if not chosen.
+
+    Args:
+        path (str): The file.
+        chosen (FileFormat | None): The format given on the command line.
+
+    Returns:
+        FileFormat: NDJSON or CSV.
+    """
+    if chosen is not None:
+        return chosen
+    return FileFormat.csv if Path(path).suffix.lower() == CSV_SUFFIX else FileFormat.ndjson
+
+
+class RejectedLines:
+    """
+    Writer of every rejected line of an import to an NDJSON report, if one was asked for.
+    """
+
+    def __init__(self, files: ExitStack, path: str | None) -> None:
+        """
+        Args:
+            files (ExitStack): The files of the import, the report is closed with them.
+            path (str | None): The report, None to keep no report.
+        """
+        self._report: TextIO | None = None
+        if path:
+            self._report = files.enter_context(Path(path).open("w", encoding="utf-8"))
+
+    def __call__(self, row: RejectedRow) -> None:
+        if self._report is not None:
+            self._report.write(NDJSON_LINE.format(TO_JSON(row.model_dump())))
+
+
+async def import_file(service: BaseService, arguments: argparse.Namespace) -> ImportReport:
+    """
+    Import the file the command line asks for.
+
+    Args:
+        service (BaseService): The service of the imported entity.
+        arguments (argparse.Namespace): The command line.
+
+    Returns:
+        ImportReport: Counters, throughput and the first rejected rows.
+    """
+    with ExitStack() as files:
+        source = open_source(files, arguments.path)
+        records = read_records(read_chunks(source), file_format(arguments.path, arguments.format))
+        return await import_records(
+            service,
+            records,
+            batch_size=arguments.batch_size,
+            on_rejected=RejectedLines(files, arguments.rejected),
+        )
+
+
+def summary(report: ImportReport) -> str:
+    """
+    Describe the outcome of an import in one line.
+
+    Args:
+        report (ImportReport): The outcome.
+
+    Returns:
+        str: Counters and throughput.
+    """
+    counts: tuple[int, int, int] = (report.received, report.imported, report.rejected)
+    return SUMMARY.format(*counts, report.seconds, report.rows_per_second)
@@ -0,0 +1,53 @@
+"""
+Import dogs, dog walkers or orders from an NDJSON or CSV file.
+
+The file is read in chunks and validated and committed in batches through the
+same path as ``POST /api/v1/{entity}/import/``, so memory does not grow with
+the file size. Rejected lines are written to an NDJSON report.
+
+Usage:
+    python -m commands.import_rows orders orders.ndjson [--format csv] [--batch-size 1000]
+                                   [--rejected rejected.ndjson] [--db-url sqlite://db.sqlite3]
+"""
+import argparse
+import asyncio
+from types import MappingProxyType
+
+from tortoise import Tortoise
+
+from api.v1.export import FileFormat
+from commands.import_files import import_file, summary
+from core.config import settings
+from service.importer import IMPORT_BATCH_SIZE
+from service.registry import registry
+from service.order_service import OrderService
+from service.services import BaseService, DogService
+from service.walker_service import DogWalkerService
+
+SERVICES: MappingProxyType[str, type[BaseService]] = MappingProxyType({
+    "dogs": DogService,
+    "dogs-walkers": DogWalkerService,
+    "orders": OrderService,
+})
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    await Tortoise.init(db_url=arguments.db_url, modules={"models": ["database.models"]})
+    registry.build()
+    try:  # noqa: WPS501
+        report = await import_file(registry.service(SERVICES[arguments.entity]), arguments)
+    finally:
+        registry.clear()
+        await Tortoise.close_connections()
+    print(summary(report))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entity", choices=sorted(SERVICES))
+    parser.add_argument("path", help="NDJSON or CSV file, - for standard input")
+    parser.add_argument("--format", type=FileFormat, help="Guessed from the file extension if omitted")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--rejected", help="Write every rejected line to this NDJSON file")
+    parser.add_argument("--db-url", default=settings.db.postgres_dsn)
+    asyncio.run(main(parser.parse_args()))
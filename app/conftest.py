@@ -1,25 +1,52 @@
-from typing import Callable, AsyncGenerator
+import math
+from contextlib import contextmanager
+from typing import Callable, AsyncGenerator, Generator
 from core.config import test_settings
+from database.queries import QueryStats, record_queries
 from pytest_asyncio import fixture
 from httpx import AsyncClient, ASGITransport
 from tortoise import Tortoise
+from tortoise.utils import get_schema_sql
 import os
+import pytest
 from main import app
 
 
 @fixture(scope="session")
 async def init_db() -> AsyncGenerator:
-    """Initial database connection"""
+    """Initial database connection, with an unreplicated second file standing in for a read replica"""
     await Tortoise.init(
-        db_url=f"sqlite://{test_settings.database}",
-        modules={"models": ["database.models"]},
+        config={
+            "connections": {
+                "default": f"sqlite://{test_settings.database}",
+                "replica": f"sqlite://{test_settings.replica_database}",
+            },
+            "apps": {"models": {"models": ["database.models"], "default_connection": "default"}},
+        },
         _create_db=True,
     )
     await Tortoise.generate_schemas()
+    replica = Tortoise.get_connection("replica")
+    await replica.execute_script(get_schema_sql(Tortoise.get_connection("default"), safe=False))
     yield
     await Tortoise.close_connections()
-    if os.path.exists(test_settings.database):
-        os.remove(test_settings.database)
+    for database in (test_settings.database, test_settings.replica_database):
+        if os.path.exists(database):
+            os.remove(database)
+
+
+@pytest.fixture
+def query_budget() -> Callable:
+    """Context manager failing the test when the statements run inside exceed a budget"""
+
+    @contextmanager
+    def budget(statements: float = math.inf, repeated: float = 0) -> Generator[QueryStats, None, None]:
+        with record_queries() as stats:
+            yield stats
+            assert stats.statements <= statements, f"over the budget of {statements} statements: {stats.report()}"
+            assert stats.repeated <= repeated, f"over the budget of {repeated} repeated statements: {stats.report()}"
+
+    return budget
 
 
 @fixture
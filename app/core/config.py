@@ -4,6 +4,15 @@ from pydantic_settings import (
 )
 from dotenv import load_dotenv
 
+from core.service_settings import (
+    AssignmentSettings,
+    CacheSettings,
+    InvalidationSettings,
+    PaginationSettings,
+    QuerySettings,
+    TransitionSettings,
+)
+
 load_dotenv(".env.example")
 
 
@@ -17,6 +26,21 @@ class FastApiSettings(BaseSettings):
 
 class DBSettings(BaseSettings):
     postgres_dsn: str
+    pool_min_size: int = 5
+    pool_max_size: int = 10
+    pool_statement_cache_size: int = 100
+    # asyncpg bounds the life of a pooled connection by its idle time and its number of queries.
+    pool_max_inactive_lifetime: float = 300.0
+    pool_max_queries: int = 50000
+    pool_acquire_timeout: float | None = 10.0
+    pool_warmup: bool = True
+    replica_dsns: list[str] = []
+    read_your_writes_seconds: float = 5.0
+
+    # Names of the Tortoise connections of the read replicas, one per replica DSN.
+    @property
+    def replica_connections(self) -> list[str]:
+        return [f"replica_{index}" for index in range(len(self.replica_dsns))]
 
 
 class TestSettings(BaseSettings):
@@ -24,6 +48,7 @@ class TestSettings(BaseSettings):
     walkers_url: str
     orders_url: str
     database: str
+    replica_database: str
 
     model_config = SettingsConfigDict(env_prefix="test_")
 
@@ -31,6 +56,12 @@ class TestSettings(BaseSettings):
 class AppSettings(BaseSettings):
     fast_api: FastApiSettings = FastApiSettings()
     db: DBSettings = DBSettings()
+    pagination: PaginationSettings = PaginationSettings()
+    assignment: AssignmentSettings = AssignmentSettings()
+    cache: CacheSettings = CacheSettings()
+    invalidation: InvalidationSettings = InvalidationSettings()
+    transitions: TransitionSettings = TransitionSettings()
+    queries: QuerySettings = QuerySettings()
 
 
 settings = AppSettings()
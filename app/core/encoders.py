@@ -0,0 +1,46 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+NOT_SERIALIZABLE = "Object of type {0} is not JSON serializable"
+
+
+def json_default(cell: Any) -> Any:
+    """
+    ``default`` hook of ``json.dumps`` for the column types of the tables.
+
+    Args:
+        cell (Any): A value the json module cannot serialize by itself.
+
+    Returns:
+        Any: Its JSON representation: ids and timestamps as strings, enums by value.
+
+    Raises:
+        TypeError: For any other type.
+    """
+    if isinstance(cell, UUID):
+        return str(cell)
+    if isinstance(cell, (datetime, date)):
+        return cell.isoformat()
+    if isinstance(cell, Enum):
+        return cell.value
+    raise TypeError(NOT_SERIALIZABLE.format(type(cell).__name__))
+
+
+def dump_json(document: Any) -> bytes:
+    """
+    Serialize a response body with orjson.
+
+    UTC timestamps end in ``Z`` like in pydantic, so the bytes match what
+    FastAPI would produce from the response model.
+
+    Args:
+        document (Any): Plain dicts and lists of column values.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    return orjson.dumps(document, default=json_default, option=orjson.OPT_UTC_Z)
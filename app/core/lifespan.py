@@ -0,0 +1,72 @@
+from contextlib import asynccontextmanager
+from logging import config as logging_config
+from typing import AsyncIterator
+
+from tortoise import Tortoise
+
+from core.config import settings
+from core.logger import LOGGING
+from database.bus import create_transport, invalidation_bus
+from database.pool import DEFAULT_CONNECTION, tortoise_config, warm_pool
+from database.replicas import read_replicas
+from service.availability import availability_index
+from service.registry import registry
+from service.transitions import start_status_scheduler, status_scheduler
+
+
+@asynccontextmanager
+async def lifespan(_) -> AsyncIterator[None]:
+    """
+    Start the database and the services of a worker, stop them on shutdown.
+
+    Args:
+        _: The application.
+
+    Yields:
+        None: While the worker serves requests.
+    """
+    logging_config.dictConfig(LOGGING)
+    await start_database()
+    await start_services()
+    yield
+
+    await stop()
+
+
+async def start_database() -> None:
+    """
+    Open the primary and the replica connections, warming their pools.
+    """
+    await Tortoise.init(config=tortoise_config(settings.db))
+    read_replicas.configure(settings.db.replica_connections)
+    if settings.db.pool_warmup:
+        for connection_name in (DEFAULT_CONNECTION, *read_replicas.replicas):
+            await warm_pool(connection_name)
+
+
+async def start_services() -> None:
+    """
+    Build the repositories, then start the invalidation bus and the status scheduler.
+    """
+    registry.build()
+    transport = create_transport(
+        settings.invalidation.transport,
+        settings.db.postgres_dsn,
+        settings.invalidation.channel,
+        settings.invalidation.reconnect,
+    )
+    await invalidation_bus.start(transport, resync=registry.flush)
+    await availability_index.load()
+    if settings.transitions.enabled:
+        await start_status_scheduler()
+
+
+async def stop() -> None:
+    """
+    Stop the services before closing the connections they use.
+    """
+    await status_scheduler.stop()
+    await invalidation_bus.stop(settings.invalidation.drain_timeout)
+    registry.clear()
+    read_replicas.configure(())
+    await Tortoise.close_connections()
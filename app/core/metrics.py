@@ -0,0 +1,218 @@
+import inspect
+import os
+from functools import wraps
+from typing import Any, AsyncGenerator, AsyncIterator, Callable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from tortoise import Tortoise
+from tortoise.exceptions import ConfigurationError
+
+# Set by the gunicorn config before the workers start, every worker then writes its
+# samples to memory-mapped files in that directory and a scrape of any worker sums them.
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+ROUTE_LABELS = ("method", "route")
+STATUS_LABELS = (*ROUTE_LABELS, "status")
+REPOSITORY_LABELS = ("repository", "method")
+READ_LABELS = ("table", "read")
+POOL_LABELS = ("state",)
+REQUEST_DURATION_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_DURATION_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    5.0,
+)
+POOL_ACQUIRE_WAIT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from the request to the last byte of the response, per route template.",
+    ROUTE_LABELS,
+    buckets=REQUEST_DURATION_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled, per route template.",
+    ROUTE_LABELS,
+    multiprocess_mode="livesum",
+)
+RESPONSES = Counter(
+    "http_responses",
+    "Responses sent, per route template and status code.",
+    STATUS_LABELS,
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of the repository methods, the count is the number of calls.",
+    REPOSITORY_LABELS,
+    buckets=QUERY_DURATION_BUCKETS,
+)
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connections of the database pool by state: open, idle, in_use and max, and acquires waiting.",
+    POOL_LABELS,
+    multiprocess_mode="livesum",
+)
+POOL_ACQUIRE_WAIT = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time waited for a pooled database connection.",
+    buckets=POOL_ACQUIRE_WAIT_BUCKETS,
+)
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls",
+    "Reads that ran their own database call, per table and kind of read.",
+    READ_LABELS,
+)
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced",
+    "Reads served by an identical call already in flight, per table and kind of read.",
+    READ_LABELS,
+)
+
+
+class TimedChunks:
+    """
+    Async iterator timing every chunk of an async generator.
+
+    Every step is timed, the one ending the generator included, as it may run
+    the query finding no more rows.
+    """
+
+    def __init__(self, chunks: AsyncGenerator, histogram: Histogram) -> None:
+        """
+        Args:
+            chunks (AsyncGenerator): The timed generator.
+            histogram (Histogram): The histogram observing every step.
+        """
+        self._chunks = chunks
+        self._histogram = histogram
+
+    def __aiter__(self) -> "TimedChunks":
+        return self
+
+    async def __anext__(self) -> Any:
+        with self._histogram.time():
+            return await anext(self._chunks)
+
+    async def aclose(self) -> None:
+        """
+        Close the timed generator, e.g. when the iteration stops early.
+        """
+        await self._chunks.aclose()
+
+
+def observed(func: Callable) -> Callable:
+    """
+    Decorator timing a repository method into ``db_query_duration_seconds``.
+
+    The repository label is the ``table`` of the decorated instance. Failed calls
+    are timed as well. An async generator is timed chunk by chunk, every chunk is
+    one query.
+
+    Args:
+        func (Callable): An async method or async generator method of a repository.
+
+    Returns:
+        Callable: The timed method.
+    """
+    if inspect.isasyncgenfunction(func):
+        return _observed_chunks(func)
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        with QUERY_DURATION.labels(self.table, func.__name__).time():
+            return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _observed_chunks(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs) -> AsyncIterator:
+        histogram: Histogram = QUERY_DURATION.labels(self.table, func.__name__)
+        return TimedChunks(func(self, *args, **kwargs), histogram)
+
+    return wrapper
+
+
+def observe_pool(connection_name: str = "default") -> None:
+    """
+    Copy the state of the connection pool into ``db_pool_connections``.
+
+    Only asyncpg clients have a pool, other clients leave the gauges untouched.
+
+    Args:
+        connection_name (str): The Tortoise connection.
+    """
+    try:
+        pool = getattr(Tortoise.get_connection(connection_name), "_pool", None)
+    except ConfigurationError:
+        return
+    if pool is None:
+        return
+    size: int = pool.get_size()
+    idle: int = pool.get_idle_size()
+    POOL_CONNECTIONS.labels("open").set(size)
+    POOL_CONNECTIONS.labels("idle").set(idle)
+    POOL_CONNECTIONS.labels("in_use").set(size - idle)
+    POOL_CONNECTIONS.labels("max").set(pool.get_max_size())
+    POOL_CONNECTIONS.labels("waiting").set(getattr(pool, "waiting", 0))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render every metric in the Prometheus text exposition format.
+
+    Under gunicorn the samples of all the live and exited workers are merged,
+    counters and histograms are summed, gauges summed over live workers.
+
+    Returns:
+        tuple[bytes, str]: The exposition and its content type.
+    """
+    registry: CollectorRegistry = REGISTRY
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
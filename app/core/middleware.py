@@ -0,0 +1,171 @@
+import logging
+
+from fastapi import status
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics import REQUEST_DURATION, REQUESTS_IN_PROGRESS, RESPONSES, observe_pool
+from database.queries import QueryStats, record_queries
+
+logger = logging.getLogger(__name__)
+
+TYPE = "type"
+HTTP = "http"
+RESPONSE_START = "http.response.start"
+UNMATCHED_ROUTE = "unmatched"
+MILLISECONDS = 1000
+SERVER_TIMING = 'db;dur={0:.3f};desc="{1} statements, {2} repeated"'
+REQUEST = "{0} {1} {2}"
+N_PLUS_ONE = "Possible N+1 on {0}: {1}"
+QUERIES = "{0}: {1}"
+
+
+class ResponseSend:
+    """
+    ASGI ``send`` remembering the status code of the response.
+
+    Attributes:
+        status_code (int): Status of the response, 500 until it starts.
+    """
+
+    def __init__(self, send: Send) -> None:
+        """
+        Args:
+            send (Send): The wrapped ``send``.
+        """
+        self._send = send
+        self.status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    async def __call__(self, message: Message) -> None:
+        if message[TYPE] == RESPONSE_START:
+            self.status_code = message["status"]
+        await self._send(message)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Template of the route a request matches.
+
+    A path matching a route with another method is still labelled with that route, the 405 included.
+
+    Args:
+        scope (Scope): The ASGI scope of the request.
+
+    Returns:
+        str: The route path, e.g. ``/api/v1/orders/{order_id}/``, or ``unmatched``.
+    """
+    partial: str | None = None
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, in-flight requests and status codes per route.
+
+    Requests are labelled with the template of the route they match, e.g.
+    ``/api/v1/orders/{order_id}/``, so identifiers do not create label values.
+    Requests matching no route share the ``unmatched`` label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Args:
+            app (ASGIApp): The wrapped application, its routes are looked up from ``scope["app"]``.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope[TYPE] != HTTP:
+            await self.app(scope, receive, send)
+            return
+        labels: tuple[str, str] = (scope["method"], route_template(scope))
+        response = ResponseSend(send)
+        in_progress = REQUESTS_IN_PROGRESS.labels(*labels)
+        in_progress.inc()
+        try:  # noqa: WPS501
+            with REQUEST_DURATION.labels(*labels).time():
+                await self.app(scope, receive, response)
+        finally:
+            RESPONSES.labels(*labels, str(response.status_code)).inc()
+            in_progress.dec()
+            observe_pool()
+
+
+class ServerTimingSend(ResponseSend):
+    """
+    ASGI ``send`` adding the statements recorded so far to the response headers.
+    """
+
+    def __init__(self, send: Send, stats: QueryStats) -> None:
+        """
+        Args:
+            send (Send): The wrapped ``send``.
+            stats (QueryStats): The statements of the request.
+        """
+        super().__init__(send)
+        self._stats = stats
+
+    async def __call__(self, message: Message) -> None:
+        if message[TYPE] == RESPONSE_START:
+            # Statements of a streamed body run after the headers and are only logged.
+            header: tuple[bytes, bytes] = (b"server-timing", server_timing(self._stats))
+            message["headers"] = [*message.get("headers", ()), header]
+        await super().__call__(message)
+
+
+class QueryTimingMiddleware:
+    """
+    ASGI middleware recording the SQL statements of every request.
+
+    The number of statements, the time spent in the database and the statements
+    repeating an earlier shape are sent in a ``Server-Timing`` header and logged
+    at debug level. A request running one shape ``n_plus_one_threshold`` times or
+    more is logged as a warning, it most likely loads a relation row by row.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True, n_plus_one_threshold: int = 3) -> None:
+        """
+        Args:
+            app (ASGIApp): The wrapped application.
+            server_timing (bool): Whether the ``Server-Timing`` header is sent.
+            n_plus_one_threshold (int): Runs of one shape in a request logged as a warning.
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope[TYPE] != HTTP:
+            await self.app(scope, receive, send)
+            return
+        with record_queries() as stats:
+            response = ServerTimingSend(send, stats) if self.server_timing else ResponseSend(send)
+            await self.app(scope, receive, response)
+            self._log(scope, response.status_code, stats)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats) -> None:
+        request: str = REQUEST.format(scope["method"], scope["path"], status_code)
+        if stats.repeated_shapes(self.n_plus_one_threshold):
+            logger.warning(N_PLUS_ONE.format(request, stats.report()))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(QUERIES.format(request, stats.report()))
+
+
+def server_timing(stats: QueryStats) -> bytes:
+    """
+    Build the ``Server-Timing`` value of the statements of a request.
+
+    Args:
+        stats (QueryStats): The recorded statements.
+
+    Returns:
+        bytes: e.g. ``db;dur=1.234;desc="3 statements, 1 repeated"``.
+    """
+    timing: str = SERVER_TIMING.format(stats.seconds * MILLISECONDS, stats.statements, stats.repeated)
+    return timing.encode()
@@ -0,0 +1,70 @@
+from pydantic_settings import (
+    BaseSettings,
+    SettingsConfigDict,
+)
+
+from database.transports import BusTransport, Reconnect
+from database.counters import CountMode
+from service.assignment import AssignmentPolicy
+
+
+class PaginationSettings(BaseSettings):
+    count_mode: CountMode = CountMode.exact
+    count_modes: dict[str, CountMode] = {}
+    count_cache_ttl: float = 30.0
+
+    model_config = SettingsConfigDict(env_prefix="pagination_")
+
+
+class AssignmentSettings(BaseSettings):
+    policy: AssignmentPolicy = AssignmentPolicy.least_loaded
+    max_attempts: int = 3
+
+    model_config = SettingsConfigDict(env_prefix="assignment_")
+
+
+class CacheSettings(BaseSettings):
+    tables: set[str] = {"dogs", "dog_walkers", "orders"}
+    max_size: int = 1024
+    ttl: float = 60.0
+
+    model_config = SettingsConfigDict(env_prefix="cache_")
+
+
+class InvalidationSettings(BaseSettings):
+    transport: BusTransport = BusTransport.none
+    channel: str = "dogs_walkers_invalidation"
+    retry_delay: float = 0.5
+    max_retry_delay: float = 30.0
+    connect_timeout: float = 5.0
+    drain_timeout: float = 5.0
+
+    model_config = SettingsConfigDict(env_prefix="invalidation_")
+
+    # Connection waits of the Postgres transport.
+    @property
+    def reconnect(self) -> Reconnect:
+        return Reconnect(
+            retry_delay=self.retry_delay,
+            max_retry_delay=self.max_retry_delay,
+            connect_timeout=self.connect_timeout,
+        )
+
+
+class TransitionSettings(BaseSettings):
+    enabled: bool = True
+    batch_size: int = 500
+    horizon_hours: float = 24.0
+    max_sleep: float = 60.0
+    lock_key: int = 7235001
+    # Only Postgres elects one worker, elsewhere the scheduler runs only in a deployment of one process.
+    single_process: bool = False
+
+    model_config = SettingsConfigDict(env_prefix="transitions_")
+
+
+class QuerySettings(BaseSettings):
+    server_timing: bool = True
+    n_plus_one_threshold: int = 3
+
+    model_config = SettingsConfigDict(env_prefix="queries_")
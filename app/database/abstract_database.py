@@ -1,35 +1,69 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, AsyncIterator, Generic, TypeVar
 from uuid import UUID
 
 from tortoise import Model
 from tortoise.contrib.pydantic import (
     PydanticModel,
 )
+from fastapi.exceptions import HTTPException
 from pydantic import BaseModel
 
+from database.counters import CountMode, RowCount
+from database.versions import RowVersion
+
 TM = TypeVar("TM", bound=Model)
 TT = TypeVar("TT", bound=PydanticModel)
 
 ModelType = TypeVar("ModelType")
 
 
-class AbstractDatabase(Generic[ModelType], ABC):
+class AbstractDatabase(Generic[ModelType], ABC):  # noqa: WPS214
     @abstractmethod
     async def fetch_all_data(
         self,
         page: int,
         size: int,
-    ) -> dict[str, list | int]:
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Fetch all rows from the database with pagination.
 
         Args:
             page (int): The page number to retrieve.
             size (int): The number of rows per page.
+            count_mode (CountMode | None): Strategy for the total count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match.
 
         Returns:
-            dict[str, list[TableType] | int]: A dictionary containing pagination information and a list of results.
+            dict[str, Any]: A dictionary containing pagination information and a list of results.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_data_by_cursor(
+        self,
+        cursor: str,
+        size: int,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch the page adjacent to a cursor using keyset pagination.
+
+        Args:
+            cursor (str): Opaque cursor returned with a previous page.
+            size (int): The number of rows per page.
+            count_mode (CountMode | None): Strategy for the total count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match, the same as for the previous page.
+
+        Returns:
+            dict[str, Any]: A dictionary containing pagination information,
+            a list of results and the cursors of the adjacent pages.
+
+        Raises:
+            HTTPException: If the cursor is malformed.
         """
         raise NotImplementedError
 
@@ -49,6 +83,93 @@ class AbstractDatabase(Generic[ModelType], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def fetch_rows(self, row_ids: list[UUID]) -> list[dict]:
+        """
+        Fetch the rows with the given IDs in one query. Missing IDs are skipped.
+
+        Args:
+            row_ids (list[UUID]): The unique identifiers of the rows.
+
+        Returns:
+            list[dict]: The serialized rows in the model ordering.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_rows(self, chunk_size: int, **filters: Any) -> AsyncIterator[list[dict]]:
+        """
+        Iterate over every matching row in chunks, holding one chunk in memory at a time.
+
+        Args:
+            chunk_size (int): The number of rows per chunk.
+            **filters (Any): ORM lookups the rows must match, e.g. ``status=...``.
+
+        Returns:
+            AsyncIterator[list[dict]]: Chunks of plain column values in the model ordering,
+            foreign keys as ``<name>_id``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_row_version(self, row_id: UUID) -> RowVersion:
+        """
+        Read the validator of a row without fetching or serializing the row.
+
+        Args:
+            row_id (UUID): The unique identifier of the row.
+
+        Returns:
+            RowVersion: The same version ``row_version`` gives for the current row.
+
+        Raises:
+            HTTPException: If the row does not exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def row_version(self, row: ModelType) -> RowVersion:
+        """
+        Compute the validator of a row returned by ``fetch_single_row``.
+
+        Args:
+            row (ModelType): The row.
+
+        Returns:
+            RowVersion: The version of the row.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_table_version(self) -> RowVersion:
+        """
+        Read a validator of the table, changed by any insert or update and by deletes of joined rows.
+
+        Deletes of the table's own rows only change its row count, see ``count_rows``.
+
+        Returns:
+            RowVersion: The version of the table.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_rows(
+        self,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> RowCount:
+        """
+        Count the rows of a listing the way its pages count them.
+
+        Args:
+            count_mode (CountMode | None): Strategy for the count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match.
+
+        Returns:
+            RowCount: The total and the mode that produced it.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def insert_row(self, instance: BaseModel) -> UUID:
         """
@@ -62,6 +183,20 @@ class AbstractDatabase(Generic[ModelType], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def insert_rows(self, instances: list[BaseModel]) -> list[UUID | HTTPException]:
+        """
+        Insert many rows into the database in one transaction.
+
+        Args:
+            instances (list[instance_type]): The data for the new rows.
+
+        Returns:
+            list[UUID | HTTPException]: For every instance, in input order, the identifier
+            of the new row or the error that prevented inserting it.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update_row(self, row_id: UUID, instance: BaseModel) -> None:
         """
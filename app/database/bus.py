@@ -0,0 +1,174 @@
+import asyncio
+import json
+import logging
+from typing import Any, Callable
+from uuid import uuid4
+
+from tortoise import Tortoise
+
+from database.bus_messages import Models, decode, encode
+from database.events import WriteEvent, WriteEvents, write_events
+from database.tables import model_meta
+from database.transports import BusTransport, InvalidationTransport, LoopbackTransport, PostgresTransport, Reconnect
+
+logger = logging.getLogger(__name__)
+
+DROPPED = "Dropped {0} write events not sent within {1:.1f} s"
+NOT_SENT = "Failed to send {0} write events"
+MALFORMED = "Malformed invalidation message {0!r}"
+
+
+class InvalidationBus:
+    """
+    Relays repository write events between the workers of a deployment.
+
+    Local writes are queued and sent in batches by a background task, so write
+    paths never wait for the transport. Writes received from other workers are
+    published to the local listeners (caches, the availability index) as
+    ``remote`` events and are not sent again.
+
+    Attributes:
+        origin (str): Identifier of this worker, used to skip its own messages.
+    """
+
+    def __init__(self, events: WriteEvents):
+        """
+        Args:
+            events (WriteEvents): The publisher of this worker's writes.
+        """
+        self._events = events
+        self.origin: str = uuid4().hex
+        self._transport: InvalidationTransport | None = None
+        self._queue: asyncio.Queue[WriteEvent] | None = None
+        self._sender: asyncio.Task | None = None
+        self._models: Models = {}
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the bus is connected to a transport.
+
+        Returns:
+            bool: True between ``start`` and ``stop``.
+        """
+        return self._transport is not None
+
+    async def start(
+        self,
+        transport: InvalidationTransport | None,
+        resync: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Connect to the transport and start relaying writes.
+
+        Args:
+            transport (InvalidationTransport | None): The channel to the other workers, None keeps the bus off.
+            resync (Callable[[], None] | None): Drops the local state derived from the tables, called
+                after the transport reconnected since writes of other workers may have been missed.
+        """
+        if transport is None or self.is_running:
+            return
+        self._models = {
+            model_meta(model).db_table: model for app in Tortoise.apps.values() for model in app.values()
+        }
+        queue: asyncio.Queue[WriteEvent] = asyncio.Queue()
+        await transport.start(self._receive, resync)
+        self._queue = queue
+        self._transport = transport
+        self._sender = asyncio.create_task(self._send_forever(queue, transport))
+        self._events.subscribe(self.on_write)
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Send the writes still queued and disconnect.
+
+        Args:
+            timeout (float): Longest wait for the queued writes in seconds, the rest is dropped.
+        """
+        if self._transport is None:
+            return
+        self._events.unsubscribe(self.on_write)
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(DROPPED.format(self._queue.qsize(), timeout))
+        if self._sender is not None:
+            self._sender.cancel()
+        await self._transport.stop()
+        self._transport = None
+        self._queue = None
+        self._sender = None
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Queue a local write for the other workers.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        if event.remote or self._queue is None:
+            return
+        self._queue.put_nowait(event)
+
+    async def _send_forever(self, queue: asyncio.Queue[WriteEvent], transport: InvalidationTransport) -> None:
+        while True:
+            batch: list[WriteEvent] = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await _send(transport, encode(self.origin, batch))
+            except Exception:
+                logger.exception(NOT_SENT.format(len(batch)))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _receive(self, payload: str) -> None:
+        try:
+            message: dict[str, Any] = json.loads(payload)
+        except ValueError:
+            logger.exception(MALFORMED.format(payload))
+            return
+        if message.get("o") == self.origin:
+            return
+        try:
+            events: list[WriteEvent] = decode(self._models, message)
+        except Exception:
+            logger.exception(MALFORMED.format(payload))
+            return
+        for event in events:
+            self._events.publish(event)
+
+
+def create_transport(
+    kind: BusTransport,
+    dsn: str,
+    channel: str,
+    timing: Reconnect | None = None,
+) -> InvalidationTransport | None:
+    """
+    Build the transport configured for the deployment.
+
+    Args:
+        kind (BusTransport): The transport type, ``none`` disables the bus.
+        dsn (str): The database URL, used by the Postgres transport.
+        channel (str): The channel shared by the workers.
+        timing (Reconnect | None): Connection waits and retry delays of the Postgres transport.
+
+    Returns:
+        InvalidationTransport | None: The transport, None when disabled.
+    """
+    if kind == BusTransport.postgres:
+        return PostgresTransport(dsn, channel, timing)
+    if kind == BusTransport.loopback:
+        return LoopbackTransport(channel)
+    return None
+
+
+async def _send(transport: InvalidationTransport, payloads: list[str]) -> None:
+    for payload in payloads:
+        await transport.send(payload)
+
+
+invalidation_bus = InvalidationBus(write_events)
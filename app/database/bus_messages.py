@@ -0,0 +1,93 @@
+import json
+from typing import Any, Type
+from uuid import UUID
+
+from tortoise import Model
+
+from core.encoders import json_default
+from database.events import WriteAction, WriteEvent
+from database.tables import model_meta
+
+# Postgres rejects NOTIFY payloads of 8000 bytes and more.
+MAX_PAYLOAD_BYTES = 7000
+
+Models = dict[str, Type[Model]]
+Columns = dict[str, Any]
+
+
+def encode(origin: str, events: list[WriteEvent]) -> list[str]:
+    """
+    Serialize events into as few payloads as fit the transport limit.
+
+    Args:
+        origin (str): Identifier of the sending worker.
+        events (list[WriteEvent]): The events to send.
+
+    Returns:
+        list[str]: JSON payloads of at most ``MAX_PAYLOAD_BYTES`` each.
+    """
+    payloads: list[str] = []
+    chunk: list[str] = []
+    size: int = 0
+    for event in events:
+        encoded: str = _encode_event(event)
+        if chunk and size + len(encoded) > MAX_PAYLOAD_BYTES:
+            payloads.append(_envelope(origin, chunk))
+            chunk, size = [], 0
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        payloads.append(_envelope(origin, chunk))
+    return payloads
+
+
+def _encode_event(event: WriteEvent) -> str:
+    row: list[Any] = [event.table, event.action.value, str(event.row_id), event.columns]
+    encoded: str = json.dumps(row, default=json_default)
+    if len(encoded) > MAX_PAYLOAD_BYTES:
+        # Too large to carry the columns, the id alone still invalidates the row.
+        encoded = json.dumps([*row[:-1], {}])
+    return encoded
+
+
+def _envelope(origin: str, encoded_events: list[str]) -> str:
+    joined: str = ",".join(encoded_events)
+    return f'{{"o":"{origin}","e":[{joined}]}}'
+
+
+def decode(models: Models, message: dict[str, Any]) -> list[WriteEvent]:
+    """
+    Rebuild the events of a message, column values converted back to Python types.
+
+    Args:
+        models (Models): Tortoise ORM tables keyed by table name.
+        message (dict[str, Any]): The parsed payload.
+
+    Returns:
+        list[WriteEvent]: The remote events.
+    """
+    return [_decode_event(models, *encoded) for encoded in message["e"]]
+
+
+def _decode_event(
+    models: Models,
+    table: str,
+    action: str,
+    row_id: str,
+    columns: Columns,
+) -> WriteEvent:
+    model: Type[Model] | None = models.get(table)
+    if model is not None:
+        columns = _to_python(model, columns)
+    written: WriteAction = WriteAction(action)
+    return WriteEvent(table, written, UUID(row_id), columns, remote=True)
+
+
+def _to_python(model: Type[Model], columns: Columns) -> Columns:
+    fields_map = model_meta(model).fields_map
+    converted: Columns = dict(columns)
+    for name, column in columns.items():
+        field = fields_map.get(name)
+        if field is not None:
+            converted[name] = field.to_python_value(column)
+    return converted
@@ -0,0 +1,204 @@
+from collections import defaultdict
+from typing import Any, AsyncIterator, NamedTuple
+from uuid import UUID
+
+from fastapi.exceptions import HTTPException
+from pydantic import BaseModel
+
+from database.abstract_database import AbstractDatabase
+from database.counters import CountMode, RowCount
+from database.events import WriteAction, WriteEvent
+from database.lru import CacheLimits, CacheStats, LRUCache
+from database.replicas import read_replicas
+from database.versions import RowVersion
+
+
+class _Entry(NamedTuple):
+    row: Any
+    references: tuple[tuple[str, UUID], ...]
+
+
+class CachedDatabase(AbstractDatabase):  # noqa: WPS214
+    """
+    Read-through LRU/TTL cache of ``fetch_single_row`` over any repository.
+
+    Every other call is passed through unchanged. A row is dropped when it is
+    updated or deleted through this wrapper and, once ``on_write`` is subscribed
+    to the write events, when it or a row it references is written anywhere in
+    the process. Writes of other workers arrive through the invalidation bus when
+    it runs, ``ttl`` bounds the staleness of anything missed.
+
+    Attributes:
+        table (str): Database table of the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        database: AbstractDatabase,
+        table: str,
+        references: dict[str, str] | None = None,
+        limits: CacheLimits = CacheLimits(),
+    ):
+        """
+        Args:
+            database (AbstractDatabase): The repository to cache.
+            table (str): Database table of the wrapped repository.
+            references (dict[str, str] | None): Referenced table to the row attribute holding
+                its id, e.g. ``{"dogs": "dog_id"}``. A write to a referenced row drops the rows
+                pointing at it.
+            limits (CacheLimits): Maximum number of cached rows and their lifetime in seconds.
+        """
+        self._database = database
+        self.table = table
+        self._references: dict[str, str] = references or {}
+        self._rows: LRUCache[UUID, _Entry] = LRUCache(*limits, on_drop=self._dropped)
+        self._referrers: dict[tuple[str, UUID], set[UUID]] = defaultdict(set)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Hit, miss and eviction counters of the cache.
+
+        Returns:
+            CacheStats: The current counters.
+        """
+        return self._rows.stats
+
+    async def fetch_single_row(self, row_id: UUID) -> Any:
+        """
+        Return the cached row, reading it from the wrapped repository on a miss.
+
+        Misses always read the primary, never a read replica.
+
+        Args:
+            row_id (UUID): The unique identifier of the row.
+
+        Returns:
+            Any: The row matching the given ID.
+
+        Raises:
+            HTTPException: If the row does not exist. Missing rows are not cached.
+        """
+        entry: _Entry | None = self._rows.get(row_id)
+        if entry is not None:
+            return entry.row
+        generation: int = self._rows.generation
+        # A lagging replica could put back the row a write just dropped, misses read the primary.
+        with read_replicas.primary():
+            row = await self._database.fetch_single_row(row_id)
+        if generation == self._rows.generation:
+            self._store(row_id, row)
+        return row
+
+    def invalidate(self, row_id: UUID) -> None:
+        """
+        Drop a row from the cache.
+
+        Args:
+            row_id (UUID): The unique identifier of the row.
+        """
+        self._rows.invalidate(row_id)
+
+    def clear(self) -> None:
+        """
+        Drop every cached row, the counters are kept.
+        """
+        self._rows.clear()
+        self._referrers.clear()
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Drop the rows affected by a repository write.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        if event.action == WriteAction.insert:
+            return
+        if event.table == self.table:
+            self.invalidate(event.row_id)
+        elif event.table in self._references:
+            for row_id in tuple(self._referrers.get((event.table, event.row_id), ())):
+                self.invalidate(row_id)
+
+    async def fetch_all_data(
+        self,
+        page: int,
+        size: int,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await self._database.fetch_all_data(page, size, count_mode, filters)
+
+    async def fetch_data_by_cursor(
+        self,
+        cursor: str,
+        size: int,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await self._database.fetch_data_by_cursor(cursor, size, count_mode, filters)
+
+    async def fetch_rows(self, row_ids: list[UUID]) -> list[dict]:
+        return await self._database.fetch_rows(row_ids)
+
+    def stream_rows(self, chunk_size: int, **filters: Any) -> AsyncIterator[list[dict]]:
+        return self._database.stream_rows(chunk_size, **filters)
+
+    async def fetch_row_version(self, row_id: UUID) -> RowVersion:
+        return await self._database.fetch_row_version(row_id)
+
+    def row_version(self, row: Any) -> RowVersion:
+        return self._database.row_version(row)
+
+    async def fetch_table_version(self) -> RowVersion:
+        return await self._database.fetch_table_version()
+
+    async def count_rows(
+        self,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> RowCount:
+        return await self._database.count_rows(count_mode, filters)
+
+    async def insert_row(self, instance: BaseModel) -> UUID:
+        return await self._database.insert_row(instance)
+
+    async def insert_rows(self, instances: list[BaseModel]) -> list[UUID | HTTPException]:
+        return await self._database.insert_rows(instances)
+
+    async def update_row(self, row_id: UUID, instance: BaseModel) -> None:
+        # The row is dropped whether the write succeeded or not.
+        try:  # noqa: WPS501
+            await self._database.update_row(row_id, instance)
+        finally:
+            self.invalidate(row_id)
+
+    async def delete_row(self, row_id: UUID) -> None:
+        try:  # noqa: WPS501
+            await self._database.delete_row(row_id)
+        finally:
+            self.invalidate(row_id)
+
+    def _store(self, row_id: UUID, row: Any) -> None:
+        references: tuple[tuple[str, UUID], ...] = self._references_of(row)
+        self._rows.put(row_id, _Entry(row, references))
+        if row_id not in self._rows:
+            return
+        for reference in references:
+            self._referrers[reference].add(row_id)
+
+    def _dropped(self, row_id: UUID, entry: _Entry) -> None:
+        for reference in entry.references:
+            referrers: set[UUID] = self._referrers[reference]
+            referrers.discard(row_id)
+            if not referrers:
+                del self._referrers[reference]
+
+    def _references_of(self, row: Any) -> tuple[tuple[str, UUID], ...]:
+        found: list[tuple[str, UUID]] = []
+        for table, attribute in self._references.items():
+            reference_id: UUID | None = getattr(row, attribute, None)
+            if reference_id is not None:
+                found.append((table, reference_id))
+        return tuple(found)
@@ -0,0 +1,140 @@
+import time
+from enum import Enum
+from typing import Any, NamedTuple, Type
+
+from tortoise import Model
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.queryset import QuerySet
+
+from database.events import WriteAction, WriteEvent
+from database.tables import model_meta
+
+
+class CountMode(Enum):
+    exact = "exact"
+    cached = "cached"
+    approximate = "approximate"
+
+
+class RowCount(NamedTuple):
+    """
+    Result of a count together with the strategy that actually produced it.
+
+    Attributes:
+        total (int): Number of rows.
+        mode (CountMode): ``cached`` only when served from the cache, ``exact`` when
+            the approximate strategy had to fall back to a real count.
+    """
+
+    total: int
+    mode: CountMode
+
+
+class RowCounter:
+    """
+    Count strategy layer for paginated listings of a single table.
+
+    * ``exact`` runs ``SELECT COUNT(*)`` every time.
+    * ``cached`` keeps the exact count for ``ttl`` seconds and drops it on every
+      insert or delete of the table, made by this worker or relayed from the
+      others by the invalidation bus (``on_write``).
+    * ``approximate`` reads the planner statistics (``pg_class.reltuples``) on
+      Postgres and falls back to an exact count on other backends or when the
+      table has not been analyzed yet.
+
+    Attributes:
+        table (str): Database table of the counted model.
+        default_mode (CountMode): The mode used when a request does not choose one.
+    """
+
+    def __init__(
+        self,
+        model: Type[Model],
+        default_mode: CountMode = CountMode.exact,
+        ttl: float = 30.0,
+    ):
+        """
+        Args:
+            model (Type[Model]): The Tortoise ORM table to count.
+            default_mode (CountMode): The mode used when a request does not choose one.
+            ttl (float): Lifetime of a cached count in seconds.
+        """
+        self._model = model
+        self.table: str = model_meta(model).db_table
+        self.default_mode = default_mode
+        self._ttl = ttl
+        self._cached: int | None = None
+        self._expires_at: float = 0
+        self._generation: int = 0
+
+    async def count(
+        self,
+        mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> RowCount:
+        """
+        Count rows of the table with the requested strategy.
+
+        Args:
+            mode (CountMode | None): The strategy to use, ``default_mode`` if omitted.
+            filters (dict[str, Any] | None): ORM lookups of a filtered listing. Filtered
+                counts are always exact, neither the cache nor the statistics know them.
+            using_db (BaseDBAsyncClient | None): The connection to count on, e.g. a read replica,
+                the default one if omitted. Cached counts are always taken on the default one.
+
+        Returns:
+            RowCount: The total and the mode that produced it.
+        """
+        if filters:
+            rows: QuerySet = self._model.all(using_db=using_db).filter(**filters)
+            filtered: int = await rows.count()
+            return RowCount(filtered, CountMode.exact)
+        mode = mode or self.default_mode
+        if mode == CountMode.cached:
+            return await self._cached_count()
+        if mode == CountMode.approximate:
+            estimate: int | None = await self._estimate(using_db or model_meta(self._model).db)
+            if estimate is not None:
+                return RowCount(estimate, CountMode.approximate)
+        return RowCount(await self._model.all(using_db=using_db).count(), CountMode.exact)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached count after rows were inserted or deleted.
+        """
+        self._cached = None
+        self._generation += 1
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Drop the cached count after a row of the table was inserted or deleted.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        if event.table == self.table and event.action != WriteAction.update:
+            self.invalidate()
+
+    async def _cached_count(self) -> RowCount:
+        # Counted on the primary, a lagging replica would keep a stale total cached for the whole ttl.
+        if self._cached is not None and time.monotonic() < self._expires_at:
+            return RowCount(self._cached, CountMode.cached)
+        generation: int = self._generation
+        total: int = await self._model.all().count()
+        if generation == self._generation:
+            # A write that raced with the count would leave a stale value behind.
+            self._cached = total
+            self._expires_at = time.monotonic() + self._ttl
+        return RowCount(total, CountMode.exact)
+
+    async def _estimate(self, connection: BaseDBAsyncClient) -> int | None:
+        if connection.capabilities.dialect != "postgres":
+            return None
+        rows: list[dict] = await connection.execute_query_dict(
+            "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = $1::regclass",
+            [self.table],
+        )
+        if not rows or rows[0]["estimate"] < 0:
+            return None
+        return rows[0]["estimate"]
@@ -0,0 +1,115 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+
+
+class CursorDirection(Enum):
+    next = "next"
+    prev = "prev"
+
+
+class Cursor(NamedTuple):
+    """
+    Decoded keyset position.
+
+    Attributes:
+        fields (list[str]): The ordering fields the cursor was issued for, ``id`` last.
+        boundary (list[Any]): Raw values of ``fields`` for the boundary row.
+        direction (CursorDirection): Whether to read the rows after or before the boundary.
+    """
+
+    fields: list[str]
+    boundary: list[Any]
+    direction: CursorDirection
+
+    def issued_for(self, fields: list[str]) -> bool:
+        """
+        Whether the cursor was issued for the given ordering.
+
+        Args:
+            fields (list[str]): The ordering fields the endpoint paginates by.
+
+        Returns:
+            bool: True if the fields match and every one of them has a boundary value.
+        """
+        return self.fields == fields and len(self.boundary) == len(fields)
+
+
+def _to_json(raw: Any) -> Any:
+    if isinstance(raw, datetime):
+        return raw.isoformat()
+    if isinstance(raw, Enum):
+        return raw.value
+    if isinstance(raw, UUID):
+        return str(raw)
+    return raw
+
+
+def _parse(token: str) -> Cursor | None:
+    padded: str = token + "=" * (-len(token) % 4)
+    try:
+        payload: Any = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        return None
+    try:
+        return Cursor(
+            fields=payload["f"],
+            boundary=payload["v"],
+            direction=CursorDirection(payload["d"]),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def encode_cursor(
+    fields: list[str],
+    row: dict,
+    direction: CursorDirection,
+) -> str:
+    """
+    Build an opaque cursor pointing at the given row.
+
+    Args:
+        fields (list[str]): The ordering fields, ``id`` last.
+        row (dict): The serialized boundary row.
+        direction (CursorDirection): The direction the cursor continues in.
+
+    Returns:
+        str: URL-safe token to be passed back as the ``cursor`` query parameter.
+    """
+    payload = {
+        "f": fields,
+        "v": [_to_json(row[field]) for field in fields],
+        "d": direction.value,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, fields: list[str]) -> Cursor:
+    """
+    Decode a cursor issued by ``encode_cursor`` for the same ordering.
+
+    Args:
+        token (str): The opaque cursor received from the client.
+        fields (list[str]): The ordering fields the endpoint paginates by.
+
+    Returns:
+        Cursor: The decoded keyset position.
+
+    Raises:
+        HTTPException: If the token is malformed or was issued for another ordering.
+    """
+    cursor: Cursor | None = _parse(token)
+    if cursor is None or not cursor.issued_for(fields):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return cursor
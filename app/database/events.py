@@ -0,0 +1,87 @@
+import logging
+from enum import Enum
+from typing import Any, Callable, NamedTuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+LISTENER_FAILED = "Write listener {0!r} failed for {1}"
+
+
+class WriteAction(Enum):
+    insert = "insert"
+    update = "update"
+    delete = "delete"
+
+
+class WriteEvent(NamedTuple):
+    """
+    A row written through a repository.
+
+    Attributes:
+        table (str): Database table name, e.g. ``orders``.
+        action (WriteAction): What happened to the row.
+        row_id (UUID): The identifier of the row.
+        columns (dict[str, Any]): Column values written, foreign keys as ``<name>_id``.
+            Empty for deletes.
+        remote (bool): True when the write was made by another worker and relayed
+            by the invalidation bus.
+    """
+
+    table: str
+    action: WriteAction
+    row_id: UUID
+    columns: dict[str, Any]
+    remote: bool = False
+
+
+Listener = Callable[[WriteEvent], None]
+
+
+class WriteEvents:
+    """
+    Process-wide publisher of repository writes.
+
+    In-memory structures derived from the tables (indexes, caches) subscribe here
+    instead of re-reading the database. Listeners run synchronously right after
+    the statement succeeded and must not block.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[Listener] = []
+
+    def subscribe(self, listener: Listener) -> None:
+        """
+        Register a listener for every following write.
+
+        Args:
+            listener (Listener): Callable receiving each WriteEvent.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """
+        Stop delivering writes to a listener.
+
+        Args:
+            listener (Listener): A previously subscribed callable.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def publish(self, event: WriteEvent) -> None:
+        """
+        Deliver a write to every listener. A failing listener does not fail the write.
+
+        Args:
+            event (WriteEvent): The write that was committed.
+        """
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception(LISTENER_FAILED.format(listener, event))
+
+
+write_events = WriteEvents()
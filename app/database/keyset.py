@@ -0,0 +1,82 @@
+from typing import Any, Iterator, NamedTuple
+
+from tortoise import expressions
+from tortoise.models import MetaInfo
+
+from database.cursor import Cursor
+
+DESCENDING = "-{0}"
+AFTER = "{0}__gt"
+BEFORE = "{0}__lt"
+
+
+class PageRows(NamedTuple):
+    """
+    Rows of a page and whether there are rows on either side of it.
+
+    Attributes:
+        rows (list[dict[str, Any]]): The rows in the model ordering.
+        more_before (bool): Whether rows precede the page.
+        more_after (bool): Whether rows follow the page.
+    """
+
+    rows: list[dict[str, Any]]
+    more_before: bool
+    more_after: bool
+
+
+def keyset_filter(keyset: dict[str, Any], forward: bool) -> expressions.Q:
+    """
+    Expand a row-value comparison into a portable OR-of-ANDs predicate.
+
+    ``(a, b, id) > (x, y, z)`` becomes
+    ``a > x OR (a = x AND b > y) OR (a = x AND b = y AND id > z)``.
+
+    Args:
+        keyset (dict[str, Any]): The boundary values keyed by ordering field, ``id`` last.
+        forward (bool): Whether the rows after the boundary are wanted, or the ones before it.
+
+    Returns:
+        expressions.Q: The predicate.
+    """
+    conditions: Iterator[expressions.Q] = _conditions(keyset, AFTER if forward else BEFORE)
+    return expressions.Q(*conditions, join_type=expressions.Q.OR)
+
+
+def keyset_ordering(fields: list[str], forward: bool) -> list[str]:
+    """
+    Return the ordering that reads the rows next to a boundary first.
+
+    Args:
+        fields (list[str]): The ordering fields, ``id`` last.
+        forward (bool): Whether the rows after the boundary are read, or the ones before it.
+
+    Returns:
+        list[str]: The ``order_by`` arguments.
+    """
+    return fields if forward else [DESCENDING.format(field) for field in fields]
+
+
+def cursor_keyset(meta: MetaInfo, position: Cursor) -> dict[str, Any]:
+    """
+    Convert the raw boundary of a cursor into the values of the ordering fields.
+
+    Args:
+        meta (MetaInfo): The table the cursor pages through.
+        position (Cursor): The decoded cursor.
+
+    Returns:
+        dict[str, Any]: The boundary values keyed by ordering field.
+    """
+    return {
+        field: meta.fields_map[field].to_python_value(boundary)
+        for field, boundary in zip(position.fields, position.boundary)
+    }
+
+
+def _conditions(keyset: dict[str, Any], lookup: str) -> Iterator[expressions.Q]:
+    equal: dict[str, Any] = {}
+    for field, boundary in keyset.items():
+        condition: dict[str, Any] = {**equal, lookup.format(field): boundary}
+        yield expressions.Q(**condition)
+        equal[field] = boundary
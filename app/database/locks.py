@@ -0,0 +1,128 @@
+import logging
+from abc import ABC, abstractmethod
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_SCHEMES: frozenset[str] = frozenset(("asyncpg", "postgres", "psycopg"))
+LOCK_LOST = "Advisory lock {0} lost with its connection"
+LOCK_FAILED = "Advisory lock {0} could not be requested"
+
+
+class LeaderLock(ABC):
+    """
+    Lock electing the one worker of a deployment that runs a singleton job.
+
+    The lock is held until ``release`` or until the worker dies, another worker
+    calling ``try_acquire`` then takes over.
+    """
+
+    @abstractmethod
+    async def try_acquire(self) -> bool:
+        """
+        Take the lock if it is free, or check that it is still held.
+
+        Returns:
+            bool: True while this worker holds the lock.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self) -> None:
+        """
+        Give the lock up and release its connection.
+        """
+        raise NotImplementedError
+
+
+class LocalLock(LeaderLock):
+    """
+    In-process lock, one holder per key among the locks of the process.
+
+    Does not see other processes, so every worker would elect itself. Used in
+    tests and in deployments that explicitly run a single process.
+    """
+
+    _holders: dict[int, "LocalLock"] = {}
+
+    def __init__(self, key: int):
+        """
+        Args:
+            key (int): The lock identifier.
+        """
+        self.key = key
+
+    async def try_acquire(self) -> bool:
+        return self._holders.setdefault(self.key, self) is self
+
+    async def release(self) -> None:
+        if self._holders.get(self.key) is self:
+            del self._holders[self.key]
+
+
+class PostgresAdvisoryLock(LeaderLock):
+    """
+    Postgres session-level advisory lock on a dedicated connection.
+
+    Pooled connections are shared by requests, a session lock taken on one would
+    follow it back to the pool. The lock lives exactly as long as its own
+    connection, Postgres releases it when the worker holding it disappears.
+    """
+
+    def __init__(self, dsn: str, key: int):
+        """
+        Args:
+            dsn (str): The Tortoise database URL, ``asyncpg://`` or ``postgres://``.
+            key (int): The advisory lock key shared by the workers.
+        """
+        self._dsn = "postgresql://{0}".format(dsn.split("://", 1)[1])
+        self.key = key
+        self._connection: asyncpg.Connection | None = None
+        self._held: bool = False
+
+    async def try_acquire(self) -> bool:
+        if self._connection is not None and self._connection.is_closed():
+            if self._held:
+                logger.warning(LOCK_LOST.format(self.key))
+            self._connection = None
+            self._held = False
+        if self._held:
+            return True
+        try:
+            self._held = await self._request()
+        except (OSError, asyncpg.PostgresError):
+            logger.exception(LOCK_FAILED.format(self.key))
+            await self.release()
+        return self._held
+
+    async def release(self) -> None:
+        self._held = False
+        if self._connection is not None:
+            # Closing the session releases its advisory locks.
+            await self._connection.close()
+            self._connection = None
+
+    async def _request(self) -> bool:
+        if self._connection is None:
+            self._connection = await asyncpg.connect(self._dsn)
+        return await self._connection.fetchval("SELECT pg_try_advisory_lock($1)", self.key)
+
+
+def create_lock(dsn: str, key: int, single_process: bool = False) -> LeaderLock | None:
+    """
+    Build the leader lock suited to the database of the deployment.
+
+    Args:
+        dsn (str): The database URL.
+        key (int): The lock identifier shared by the workers.
+        single_process (bool): Whether the deployment runs one process, which makes an
+            in-process lock enough when the database has no advisory locks.
+
+    Returns:
+        LeaderLock | None: An advisory lock on Postgres, an in-process lock for a single
+        process, None when the workers cannot agree on one leader.
+    """
+    if dsn.split("://", 1)[0] in POSTGRES_SCHEMES:
+        return PostgresAdvisoryLock(dsn, key)
+    return LocalLock(key) if single_process else None
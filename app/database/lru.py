@@ -0,0 +1,172 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+Entry = TypeVar("Entry")
+
+
+class CacheLimits(NamedTuple):
+    """
+    Bounds of a cache.
+
+    Attributes:
+        max_size (int): Maximum number of entries.
+        ttl (float): Lifetime of an entry in seconds.
+    """
+
+    max_size: int = 1024
+    ttl: float = 60.0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a cache since it was created.
+
+    Attributes:
+        hits (int): Reads served from the cache.
+        misses (int): Reads that went to the source.
+        evictions (int): Entries dropped to stay within ``max_size``.
+        expirations (int): Entries found older than ``ttl`` on read.
+        invalidations (int): Entries dropped because what they were built from was written.
+        size (int): Entries currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+
+
+class LRUCache(Generic[Key, Entry]):  # noqa: WPS214
+    """
+    Bounded map with least recently used eviction, a lifetime per entry and counters.
+
+    A read that misses takes ``generation`` before loading the value and stores it
+    only if the generation did not change meanwhile: an invalidation that raced with
+    the load would otherwise be undone by a stale value.
+
+    Attributes:
+        max_size (int): Maximum number of entries, least recently used go first.
+        ttl (float): Lifetime of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        on_drop: Callable[[Key, Entry], None] | None = None,
+    ):
+        """
+        Args:
+            max_size (int): Maximum number of entries.
+            ttl (float): Lifetime of an entry in seconds.
+            on_drop (Callable[[Key, Entry], None] | None): Called with every entry that is
+                replaced, evicted, expired or invalidated, e.g. to update reverse indexes.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._on_drop = on_drop
+        # Expiry time and entry under every key.
+        self._entries: OrderedDict[Key, tuple[float, Entry]] = OrderedDict()
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+        self._invalidations: int = 0
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._entries
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped by every invalidation.
+
+        Returns:
+            int: The current generation.
+        """
+        return self._generation
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Hit, miss and eviction counters of the cache.
+
+        Returns:
+            CacheStats: The current counters.
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
+
+    def get(self, key: Key) -> Entry | None:
+        """
+        Return a live entry and mark it as recently used, counting a hit or a miss.
+
+        Args:
+            key (Key): The entry key.
+
+        Returns:
+            Entry | None: The cached entry, None when missing or expired.
+        """
+        entry: tuple[float, Entry] | None = self._entries.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._expirations += 1
+            self._drop(key)
+        self._misses += 1
+        return None
+
+    def put(self, key: Key, entry: Entry) -> None:
+        """
+        Store an entry, evicting the least recently used entries beyond ``max_size``.
+
+        Args:
+            key (Key): The entry key.
+            entry (Entry): The entry, replaces the one cached under the key.
+        """
+        self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, entry)
+        while len(self._entries) > self.max_size:
+            self._evictions += 1
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *keys: Key) -> None:
+        """
+        Drop entries and make the reads in progress discard what they load.
+
+        Args:
+            *keys (Key): The entries to drop, none to only outdate the reads in progress.
+        """
+        self._generation += 1
+        for key in keys:
+            if key in self._entries:
+                self._invalidations += 1
+                self._drop(key)
+
+    def clear(self) -> None:
+        """
+        Drop every entry without calling ``on_drop``, the counters are kept.
+        """
+        self._generation += 1
+        self._entries.clear()
+
+    def _drop(self, key: Key) -> None:
+        entry: tuple[float, Entry] | None = self._entries.pop(key, None)
+        if entry is not None and self._on_drop is not None:
+            self._on_drop(key, entry[1])
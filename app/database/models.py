@@ -5,6 +5,7 @@ from tortoise.models import Model
 
 
 CHAR_FIELD_LEN = 50
+WALK_AT = "walk_at"
 
 
 class IDModel(Model):
@@ -16,7 +17,8 @@ class IDModel(Model):
 
 class DateTimeModel(Model):
     created = fields.DatetimeField(auto_now_add=True, null=False)
-    updated = fields.DatetimeField(auto_now=True, null=False)
+    # Indexed for the max(updated) list validator, (id, updated) answers row validators alone.
+    updated = fields.DatetimeField(auto_now=True, null=False, db_index=True)
 
     class Meta:
         abstract = True
@@ -35,6 +37,7 @@ class DogTable(IDModel, DateTimeModel):
     class Meta:
         ordering = ["name", "breed"]
         table = "dogs"
+        indexes = (("id", "updated"),)
 
     def __str__(self):
         return f"{self.name} - {self.breed}"
@@ -48,6 +51,7 @@ class DogWalkerTable(IDModel, DateTimeModel):
     class Meta:
         ordering = ["active", "name"]
         table = "dog_walkers"
+        indexes = (("id", "updated"),)
 
     def __str__(self):
         return f"{self.name} {self.surname}"
@@ -81,11 +85,18 @@ class OrderTable(IDModel, DateTimeModel):
     )
 
     class Meta:
-        ordering = ["walk_at"]
+        ordering = [WALK_AT]
         table = "orders"
         unique_together = (
-            ("walk_at", "walker"),
-            ("walk_at", "dog"),
+            (WALK_AT, "walker"),
+            (WALK_AT, "dog"),
+        )
+        # Filtered order lists are sorted by walk_at, the equality column goes first.
+        indexes = (
+            ("id", "updated"),
+            ("status", WALK_AT),
+            ("dog_id", WALK_AT),
+            ("walker_id", WALK_AT),
         )
 
     def __str__(self):
@@ -0,0 +1,197 @@
+from datetime import datetime
+from typing import Any, Optional, Type
+from uuid import UUID
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from tortoise import Model, expressions, timezone
+from tortoise import exceptions as tort_exc
+
+from api.v1.order.models import NewOrder, OrderUpdateModel
+from database.models import DogTable, DogWalkerTable
+from database.tables import not_found
+
+DOG = "dog"
+WALKER = "walker"
+ORDER_RELATIONS: tuple[str, ...] = (DOG, WALKER)
+# A taken slot: the relation, the walk time and the dog or walker.
+Slot = tuple[str, datetime, Optional[UUID]]
+
+
+def order_columns(order: OrderUpdateModel) -> dict[str, Any]:
+    """
+    Return the column values of an order, its dog and walker written by id.
+
+    Args:
+        order (OrderUpdateModel): The order data.
+
+    Returns:
+        dict[str, Any]: Values for ``create``, ``update`` or the table constructor.
+    """
+    columns: dict[str, Any] = order.model_dump(exclude=set(ORDER_RELATIONS))
+    return {"dog_id": order.dog, "walker_id": order.walker, **columns}
+
+
+def order_slots(
+    walk_at: datetime,
+    dog: UUID | None,
+    walker: UUID | None,
+) -> tuple[Slot, Slot]:
+    """
+    Return the slots an order takes.
+
+    Args:
+        walk_at (datetime): The walk time, naive.
+        dog (UUID | None): The dog of the order.
+        walker (UUID | None): The dog walker of the order.
+
+    Returns:
+        tuple[Slot, Slot]: The slot of the dog and the slot of the walker.
+    """
+    return (DOG, walk_at, dog), (WALKER, walk_at, walker)
+
+
+async def reference_error(
+    error: tort_exc.IntegrityError,
+    dog: UUID | None,
+    walker: UUID | None,
+) -> Exception:
+    """
+    Translate a foreign key violation into the 404 of the missing dog or walker.
+
+    Foreign keys are written by id without reading the referenced rows first, so
+    a missing dog or walker only shows up as an integrity error. The lookups here
+    run on that failure path only.
+
+    Args:
+        error (IntegrityError): The error raised by the write.
+        dog (UUID | None): The dog the order was written with.
+        walker (UUID | None): The dog walker the order was written with.
+
+    Returns:
+        Exception: The 404 for the missing reference, or the original error otherwise.
+    """
+    if "foreign key" not in str(error).lower():
+        return error
+    if not await DogTable.exists(id=dog):
+        return not_found(DogTable)
+    if not await DogWalkerTable.exists(id=walker):
+        return not_found(DogWalkerTable)
+    return error
+
+
+class BatchChecks:
+    """
+    Checks of the orders of a bulk insert against the references and slots found for the batch.
+
+    Attributes:
+        rows (list[Model]): The rows of the orders that passed, in input order.
+    """
+
+    def __init__(
+        self,
+        model: Type[Model],
+        dogs: set[UUID],
+        walkers: set[UUID],
+        busy: set[Slot],
+    ) -> None:
+        """
+        Args:
+            model (Type[Model]): The orders table.
+            dogs (set[UUID]): The existing dogs of the batch.
+            walkers (set[UUID]): The existing dog walkers of the batch.
+            busy (set[Slot]): Slots taken in the table.
+        """
+        self._model = model
+        self._dogs = dogs
+        self._walkers = walkers
+        self._busy = busy
+        self.rows: list[Model] = []
+
+    @classmethod
+    async def load(cls, model: Type[Model], instances: list[NewOrder]) -> "BatchChecks":
+        """
+        Read the references and slots of a batch, with one ``IN`` query per table and one for the slots.
+
+        Args:
+            model (Type[Model]): The orders table.
+            instances (list[NewOrder]): The orders about to be inserted.
+
+        Returns:
+            BatchChecks: The checks of the batch.
+        """
+        dogs: set[UUID] = await _existing_ids(DogTable, {order.dog for order in instances})
+        walkers: set[UUID] = await _existing_ids(DogWalkerTable, {order.walker for order in instances})
+        return cls(model, dogs, walkers, await _busy_slots(model, instances))
+
+    def outcome(self, order: NewOrder) -> UUID | HTTPException:
+        """
+        Check the next order of the batch, keeping its row and taking its slots if it passes.
+
+        Args:
+            order (NewOrder): The order about to be inserted.
+
+        Returns:
+            UUID | HTTPException: The identifier of the new row, or the error a single insert would have raised.
+        """
+        error: HTTPException | None = self._error(order)
+        if error is not None:
+            return error
+        self._busy.update(order_slots(order.walk_at, order.dog, order.walker))
+        row: Model = self._model(**order_columns(order))
+        self.rows.append(row)
+        return row.id  # type: ignore[attr-defined]
+
+    def _error(self, order: NewOrder) -> HTTPException | None:
+        if order.dog not in self._dogs:
+            return not_found(DogTable)
+        if order.walker is None:
+            return HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="No dog walker is available at this time",
+            )
+        if order.walker not in self._walkers:
+            return not_found(DogWalkerTable)
+        return _slot_conflict(order, self._busy)
+
+
+async def _existing_ids(model: Type[Model], row_ids: set[UUID | None]) -> set[UUID]:
+    found: list[Any] = await model.filter(id__in=row_ids).values_list("id", flat=True)
+    return set(found)
+
+
+async def _busy_slots(model: Type[Model], instances: list[NewOrder]) -> set[Slot]:
+    if not instances:
+        return set()
+    walks: list[datetime] = [order.walk_at for order in instances]
+    references: expressions.Q = expressions.Q(
+        expressions.Q(dog_id__in={order.dog for order in instances}),
+        expressions.Q(walker_id__in={order.walker for order in instances}),
+        join_type=expressions.Q.OR,
+    )
+    # A range rather than IN: Tortoise does not encode datetimes inside IN like stored values on SQLite.
+    existing: list[dict[str, Any]] = await model.filter(
+        references,
+        walk_at__gte=timezone.make_aware(min(walks)),
+        walk_at__lte=timezone.make_aware(max(walks)),
+    ).values("walk_at", "dog_id", "walker_id")
+    return {
+        slot
+        for taken in existing
+        for slot in order_slots(
+            timezone.make_naive(taken["walk_at"]),
+            taken["dog_id"],
+            taken["walker_id"],
+        )
+    }
+
+
+def _slot_conflict(order: NewOrder, busy: set[Slot]) -> HTTPException | None:
+    taken: zip[tuple[Slot, str]] = zip(
+        order_slots(order.walk_at, order.dog, order.walker),
+        ("Dog already has an order at this time", "Dog walker already has an order at this time"),
+    )
+    for slot, detail in taken:
+        if slot in busy:
+            return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    return None
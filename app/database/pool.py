@@ -0,0 +1,217 @@
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+from typing import Any, Awaitable
+
+import asyncpg
+from tortoise import Tortoise
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.backends.base.config_generator import expand_db_url
+
+from core.config import DBSettings
+from core.metrics import POOL_ACQUIRE_WAIT, POOL_ACQUIRE_WAIT_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_ENGINE = "tortoise.backends.asyncpg"
+DEFAULT_CONNECTION = "default"
+MILLISECONDS = 1000
+# Defaults of ``asyncpg.create_pool``, the pool class itself has none.
+MAX_QUERIES = 50000
+MAX_INACTIVE_CONNECTION_LIFETIME = 300
+POOL_WARMED = "Database pool warmed, {0} connections in {1:.1f} ms"
+# Keys of the cumulative acquire wait histogram, the last one counts every acquire.
+WAIT_BOUNDS: tuple[str, ...] = (*map(str, POOL_ACQUIRE_WAIT_BUCKETS), "+Inf")
+
+
+class PoolTimeoutError(asyncio.TimeoutError):
+    """
+    No connection of the pool became free within the acquire timeout.
+    """
+
+
+class TimedPool(asyncpg.Pool):
+    """
+    asyncpg pool bounding and timing the wait for a free connection.
+
+    Attributes:
+        acquire_timeout (float | None): Longest wait for a connection in seconds, unbounded if None.
+        waiting (int): Acquires in progress, waiting for a connection or opening one.
+        timeouts (int): Acquires that gave up after ``acquire_timeout``.
+    """
+
+    def __init__(self, *connect_args: Any, acquire_timeout: float | None = None, **kwargs: Any) -> None:
+        """
+        Args:
+            *connect_args (Any): Positional arguments of ``asyncpg.connect``.
+            acquire_timeout (float | None): Longest wait for a connection in seconds.
+            **kwargs (Any): Arguments of ``asyncpg.Pool`` and of ``asyncpg.connect``.
+        """
+        super().__init__(*connect_args, **kwargs)
+        self.acquire_timeout = acquire_timeout
+        self.waiting: int = 0
+        self.timeouts: int = 0
+        # Acquires per bucket of ``POOL_ACQUIRE_WAIT_BUCKETS``, the last one beyond them.
+        self._waits: list[int] = [0 for _ in WAIT_BOUNDS]
+        self._wait_seconds: float = 0
+        self._wait_max: float = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Sizes of the pool and distribution of the acquire waits of this worker.
+
+        Returns:
+            dict[str, Any]: The connection counts, the waiting acquires and the
+            cumulative acquire wait histogram keyed by upper bound in seconds.
+        """
+        size: int = self.get_size()
+        idle: int = self.get_idle_size()
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self.get_min_size(),
+            "max_size": self.get_max_size(),
+            "waiting": self.waiting,
+            "acquire_wait": {
+                "count": sum(self._waits),
+                "seconds": self._wait_seconds,
+                "max": self._wait_max,
+                "timeouts": self.timeouts,
+                "buckets": dict(zip(WAIT_BOUNDS, itertools.accumulate(self._waits))),
+            },
+        }
+
+    async def _acquire(self, timeout: float | None) -> Any:
+        # Statements and transactions of Tortoise alike acquire through here.
+        self.waiting += 1
+        started: float = time.perf_counter()
+        try:
+            return await super()._acquire(timeout if timeout is not None else self.acquire_timeout)
+        except asyncio.TimeoutError as error:
+            self.timeouts += 1
+            raise PoolTimeoutError(f"No database connection free within {self.acquire_timeout} s") from error
+        finally:
+            self.waiting -= 1
+            waited: float = time.perf_counter() - started
+            self._waits[bisect.bisect_left(POOL_ACQUIRE_WAIT_BUCKETS, waited)] += 1
+            self._wait_seconds += waited
+            self._wait_max = max(self._wait_max, waited)
+            POOL_ACQUIRE_WAIT.observe(waited)
+
+
+class PooledAsyncpgClient(AsyncpgDBClient):
+    """
+    Tortoise asyncpg client creating a ``TimedPool``.
+    """
+
+    def __init__(self, *args: Any, acquire_timeout: float | None = None, **kwargs: Any) -> None:
+        """
+        Args:
+            *args (Any): Arguments of the Tortoise asyncpg client.
+            acquire_timeout (float | None): Longest wait for a pooled connection in seconds.
+            **kwargs (Any): Credentials and pool arguments of the Tortoise asyncpg client.
+        """
+        super().__init__(*args, **kwargs)
+        self.acquire_timeout = acquire_timeout
+
+    async def ping(self) -> None:
+        """
+        Run a trivial query on a pooled connection.
+        """
+        async with self.acquire_connection() as connection:
+            await connection.fetchval("SELECT 1")
+
+    async def create_pool(self, **kwargs: Any) -> TimedPool:
+        options: dict[str, Any] = {
+            "max_queries": MAX_QUERIES,
+            "max_inactive_connection_lifetime": MAX_INACTIVE_CONNECTION_LIFETIME,
+            "setup": None,
+            "init": None,
+            "record_class": asyncpg.Record,
+            **kwargs,
+        }
+        return await TimedPool(None, acquire_timeout=self.acquire_timeout, **options)
+
+
+# Tortoise engine modules expose their client as ``client_class``, ``tortoise_config`` selects this one.
+client_class = PooledAsyncpgClient
+
+
+def tortoise_config(db: DBSettings, modules: list[str] | None = None) -> dict[str, Any]:
+    """
+    Build the Tortoise config of the application database and of its read replicas.
+
+    A Postgres URL gets this engine and the pool settings of ``db``, any other
+    URL is used as is. The models belong to the ``default`` connection, the
+    replicas are only read through ``using_db``.
+
+    Args:
+        db (DBSettings): The database settings.
+        modules (list[str] | None): The model modules, ``database.models`` if omitted.
+
+    Returns:
+        dict[str, Any]: The config for ``Tortoise.init(config=...)``.
+    """
+    connections: dict[str, dict[str, Any]] = {DEFAULT_CONNECTION: _connection(db.postgres_dsn, db)}
+    for name, dsn in zip(db.replica_connections, db.replica_dsns):
+        connections[name] = _connection(dsn, db)
+    return {
+        "connections": connections,
+        "apps": {"models": {"models": modules or ["database.models"], "default_connection": DEFAULT_CONNECTION}},
+    }
+
+
+def _connection(dsn: str, db: DBSettings) -> dict[str, Any]:
+    connection: dict[str, Any] = expand_db_url(dsn)
+    if connection["engine"] == POSTGRES_ENGINE:
+        connection["engine"] = __name__
+        connection["credentials"].update(
+            minsize=db.pool_min_size,
+            maxsize=db.pool_max_size,
+            max_queries=db.pool_max_queries,
+            max_inactive_connection_lifetime=db.pool_max_inactive_lifetime,
+            statement_cache_size=db.pool_statement_cache_size,
+            acquire_timeout=db.pool_acquire_timeout,
+        )
+    return connection
+
+
+async def warm_pool(connection_name: str = DEFAULT_CONNECTION) -> int:
+    """
+    Open the pool and run a trivial query on each of its ``min_size`` connections.
+
+    The connections are acquired together, so each is a different one and is
+    proven usable before the worker takes traffic.
+
+    Args:
+        connection_name (str): The Tortoise connection.
+
+    Returns:
+        int: The number of connections warmed, 0 without a pool.
+    """
+    client = Tortoise.get_connection(connection_name)
+    if not isinstance(client, PooledAsyncpgClient):
+        return 0
+    started: float = time.perf_counter()
+    pings: list[Awaitable[None]] = [client.ping() for _ in range(client.pool_minsize)]
+    await asyncio.gather(*pings)
+    elapsed: float = (time.perf_counter() - started) * MILLISECONDS
+    logger.info(POOL_WARMED.format(client.pool_minsize, elapsed))
+    return client.pool_minsize
+
+
+def pool_stats(connection_name: str = DEFAULT_CONNECTION) -> dict[str, Any] | None:
+    """
+    Stats of the connection pool of this worker.
+
+    Args:
+        connection_name (str): The Tortoise connection.
+
+    Returns:
+        dict[str, Any] | None: See ``TimedPool.stats``, None without a pool or before it is opened.
+    """
+    pool = getattr(Tortoise.get_connection(connection_name), "_pool", None)
+    return pool.stats() if isinstance(pool, TimedPool) else None
@@ -0,0 +1,181 @@
+import inspect
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterator
+
+from tortoise.backends.asyncpg import client as asyncpg_client
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base_postgres import client as postgres_client
+from tortoise.backends.sqlite import client as sqlite_client
+
+EXECUTE_METHODS: tuple[str, ...] = (
+    "execute_insert",
+    "execute_query",
+    "execute_query_dict",
+    "execute_many",
+    "execute_script",
+)
+# Inherited methods are missing from the class, abstract and already wrapped ones are left alone.
+SKIPPED_FLAGS: tuple[str, ...] = ("__isabstractmethod__", "__recorded__")
+BACKENDS = (sqlite_client, postgres_client, asyncpg_client)
+MILLISECONDS = 1000
+TOTALS = "{0} statements in {1:.2f} ms, {2} repeated"
+# Formats a shape and its count.
+SHAPE_RUNS = "  {1} x {0}"
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|\?|(?<![\w.\"])\d+(?:\.\d+)?\b")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def query_shape(query: str) -> str:
+    """
+    Reduce a statement to its shape, the same statement with other values.
+
+    Literals and placeholders become ``?`` and value lists ``(...)``, so the
+    statements of an N+1 loop, or ``IN`` lists of any length, share one shape.
+
+    Args:
+        query (str): The SQL statement.
+
+    Returns:
+        str: The normalized statement.
+    """
+    shape: str = _LISTS.sub("(...)", _LITERALS.sub("?", query))
+    return _SPACES.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """
+    Statements run while a recording is active.
+
+    Attributes:
+        statements (int): Number of statements.
+        seconds (float): Time spent waiting for the database.
+        shapes (Counter[str]): Statements per shape, see ``query_shape``.
+    """
+
+    def __init__(self) -> None:
+        self.statements: int = 0
+        self.seconds: float = 0
+        self.shapes: Counter[str] = Counter()
+
+    @property
+    def repeated(self) -> int:
+        """
+        Number of statements whose shape already ran before them.
+
+        Returns:
+            int: Statements beyond the first of every shape.
+        """
+        return self.statements - len(self.shapes)
+
+    def repeated_shapes(self, threshold: int = 2) -> dict[str, int]:
+        """
+        Shapes run at least ``threshold`` times, the signature of an N+1 loop.
+
+        Args:
+            threshold (int): The minimum number of runs.
+
+        Returns:
+            dict[str, int]: Runs per shape, most frequent first.
+        """
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+    def add(self, query: str, seconds: float) -> None:
+        """
+        Account for one statement.
+
+        Args:
+            query (str): The SQL statement.
+            seconds (float): Its duration.
+        """
+        self.statements += 1
+        self.seconds += seconds
+        self.shapes[query_shape(query)] += 1
+
+    def report(self) -> str:
+        """
+        Describe the statements for a log line or a failed assertion.
+
+        Returns:
+            str: The totals and the runs of every shape.
+        """
+        totals: str = TOTALS.format(self.statements, self.seconds * MILLISECONDS, self.repeated)
+        runs: list[str] = [SHAPE_RUNS.format(*run) for run in self.shapes.most_common()]
+        return "\n".join((totals, *runs))
+
+
+# Recordings of the current task, nested recordings all see the statements.
+_recordings: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_recordings", default=())
+# Set while a statement runs, a client method delegating to another is counted once.
+_running: ContextVar[bool] = ContextVar("query_running", default=False)
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryStats]:
+    """
+    Record the statements run by the current task and the tasks it starts.
+
+    Returns:
+        Iterator[QueryStats]: The statistics, updated until the block exits.
+    """
+    stats = QueryStats()
+    token = _recordings.set((*_recordings.get(), stats))
+    try:  # noqa: WPS501
+        yield stats
+    finally:
+        _recordings.reset(token)
+
+
+async def _record(recordings: tuple[QueryStats, ...], query: str, statement: Awaitable) -> Any:
+    token = _running.set(True)
+    started: float = time.perf_counter()
+    try:  # noqa: WPS501
+        return await statement
+    finally:
+        elapsed: float = time.perf_counter() - started
+        _running.reset(token)
+        for stats in recordings:
+            stats.add(query, elapsed)
+
+
+def _recorded(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapper(self, query: str, *args, **kwargs):
+        recordings: tuple[QueryStats, ...] = _recordings.get()
+        if not recordings or _running.get():
+            return await method(self, query, *args, **kwargs)
+        return await _record(recordings, query, method(self, query, *args, **kwargs))
+
+    wrapper.__recorded__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _clients() -> Iterator[type]:
+    # Client classes of the backends, transaction wrappers included, not the ones they import.
+    for module in BACKENDS:
+        for _, client in inspect.getmembers(module, inspect.isclass):
+            if issubclass(client, BaseDBAsyncClient) and client.__module__ == module.__name__:
+                yield client
+
+
+def install() -> None:
+    """
+    Hook the recorder into the statement methods of the Tortoise clients.
+
+    Every client class of the SQLite and asyncpg backends, transaction wrappers
+    included, gets its own ``execute_*`` methods wrapped. Without an active
+    recording a statement costs one context variable lookup more. Calling it
+    again is a no-op.
+    """
+    for client in _clients():
+        for name in EXECUTE_METHODS:
+            method: Any = vars(client).get(name)
+            flags: list[bool] = [getattr(method, flag, False) for flag in SKIPPED_FLAGS]
+            if callable(method) and not any(flags):
+                setattr(client, name, _recorded(method))
@@ -0,0 +1,187 @@
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import Iterable, Iterator
+
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+READ_PRIMARY_HEADER = "x-read-primary"
+READ_PRIMARY_COOKIE = "read_primary_until"
+SAFE_METHODS: frozenset[str] = frozenset(("GET", "HEAD", "OPTIONS"))
+SET_COOKIE = "{0}={1:.0f}; Max-Age={2}; Path=/; HttpOnly; SameSite=Lax"
+
+_UNPINNED = ""
+# Connection of the reads of the current request, None for the primary.
+_pinned: ContextVar[str | None] = ContextVar("read_connection", default=_UNPINNED)
+
+
+class ReplicaRouter:
+    """
+    Round-robin choice of the read replica serving repository reads.
+
+    A request is pinned to one connection for all of its reads, so a page and
+    its ``ETag`` come from the same replica. Writes always go to the primary,
+    they never ask the router.
+
+    Attributes:
+        replicas (tuple[str, ...]): Tortoise connection names of the replicas, none by default.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a router without replicas, every read goes to the primary.
+        """
+        self.replicas: tuple[str, ...] = ()
+        self._turn: int = 0
+
+    def configure(self, replicas: Iterable[str]) -> None:
+        """
+        Set the replica connections, an empty list sends every read to the primary.
+
+        Args:
+            replicas (Iterable[str]): Tortoise connection names of the replicas.
+        """
+        self.replicas = tuple(replicas)
+        self._turn = 0
+
+    def pick(self) -> str | None:
+        """
+        Take the next replica in turn.
+
+        Returns:
+            str | None: The connection name, None without replicas.
+        """
+        if not self.replicas:
+            return None
+        name: str = self.replicas[self._turn % len(self.replicas)]
+        self._turn += 1
+        return name
+
+    def connection(self) -> BaseDBAsyncClient | None:
+        """
+        Return the connection for a read of the current task.
+
+        Outside a pinned block, e.g. in commands, every call takes the next replica.
+
+        Returns:
+            BaseDBAsyncClient | None: The replica client, None for the primary, which
+            ``using_db`` treats as the default connection.
+        """
+        name: str | None = _pinned.get()
+        if name == _UNPINNED:
+            name = self.pick()
+        return Tortoise.get_connection(name) if name else None
+
+    def reads_primary(self) -> bool:
+        """
+        Whether the reads of the current task go to the primary.
+
+        Returns:
+            bool: True without replicas or when pinned to the primary.
+        """
+        return not self.replicas or _pinned.get() is None
+
+    @contextmanager
+    def pinned(self, primary: bool = False) -> Iterator[str | None]:
+        """
+        Send every read of the block to one connection.
+
+        Args:
+            primary (bool): Whether the block reads from the primary instead of the next replica.
+
+        Returns:
+            Iterator[str | None]: The replica of the block, None for the primary.
+        """
+        name: str | None = None if primary else self.pick()
+        token = _pinned.set(name)
+        try:
+            yield name
+        finally:
+            _pinned.reset(token)
+
+    @contextmanager
+    def primary(self) -> Iterator[None]:
+        """
+        Send every read of the block to the primary.
+        """
+        with self.pinned(primary=True):
+            yield
+
+
+read_replicas = ReplicaRouter()
+
+
+class ReadRoutingMiddleware:
+    """
+    ASGI middleware pinning every request to the connection its reads go to.
+
+    Reads of safe requests go to the next replica. Writes, and reads of clients
+    that just wrote, go to the primary: a successful write sets the
+    ``read_primary_until`` cookie for ``read_your_writes_seconds``, long enough
+    for the replicas to catch up, and clients without cookies send the
+    ``X-Read-Primary`` header instead. Without replicas requests pass through.
+    """
+
+    def __init__(self, app: ASGIApp, read_your_writes_seconds: float = 5.0) -> None:
+        """
+        Args:
+            app (ASGIApp): The wrapped application.
+            read_your_writes_seconds (float): How long a client reads from the primary after a write.
+        """
+        self.app = app
+        self.read_your_writes_seconds = read_your_writes_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not read_replicas.replicas:
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] in SAFE_METHODS:
+            own_writes: bool = _reads_own_writes(Headers(scope=scope))
+            with read_replicas.pinned(primary=own_writes):
+                await self.app(scope, receive, send)
+            return
+        response = ReadPrimarySend(send, math.ceil(self.read_your_writes_seconds))
+        with read_replicas.primary():
+            await self.app(scope, receive, response)
+
+
+class ReadPrimarySend:
+    """
+    ASGI ``send`` setting the ``read_primary_until`` cookie on a successful response.
+    """
+
+    def __init__(self, send: Send, seconds: int) -> None:
+        """
+        Args:
+            send (Send): The wrapped ``send``.
+            seconds (int): How long the client reads from the primary.
+        """
+        self._send = send
+        self.seconds = seconds
+
+    async def __call__(self, message: Message) -> None:
+        response_start: bool = message["type"] == "http.response.start"
+        if response_start and message["status"] < status.HTTP_400_BAD_REQUEST:
+            cookie: tuple[bytes, bytes] = (b"set-cookie", self._cookie())
+            message["headers"] = [*message.get("headers", ()), cookie]
+        await self._send(message)
+
+    def _cookie(self) -> bytes:
+        until: float = time.time() + self.seconds
+        return SET_COOKIE.format(READ_PRIMARY_COOKIE, until, self.seconds).encode()
+
+
+def _reads_own_writes(headers: Headers) -> bool:
+    if READ_PRIMARY_HEADER in headers:
+        return True
+    morsel = SimpleCookie(headers.get("cookie", "")).get(READ_PRIMARY_COOKIE)
+    try:
+        return morsel is not None and float(morsel.value) > time.time()
+    except ValueError:
+        return False
@@ -0,0 +1,78 @@
+from typing import Type, cast
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from tortoise import Model
+from tortoise.fields.relational import RelationalField
+from tortoise.models import MetaInfo
+
+ID = "id"
+UPDATED = "updated"
+FOREIGN_KEY = "{0}_id"
+UNLISTED_COLUMNS: tuple[str, ...] = ("created", UPDATED)
+
+
+def model_meta(model: Type[Model]) -> MetaInfo:
+    """
+    Return the Tortoise description of a table: its name, fields and connection.
+
+    Args:
+        model (Type[Model]): The Tortoise ORM table class.
+
+    Returns:
+        MetaInfo: The metadata Tortoise keeps for the table.
+    """
+    # ``_meta`` is how Tortoise itself exposes the table description.
+    return model._meta  # noqa: WPS437
+
+
+def related_model(model: Type[Model], relation: str) -> Type[Model]:
+    """
+    Return the table a foreign key of the given table points to.
+
+    Args:
+        model (Type[Model]): The Tortoise ORM table class.
+        relation (str): Name of the foreign key field, e.g. ``dog``.
+
+    Returns:
+        Type[Model]: The referenced table class.
+    """
+    field: RelationalField = cast(RelationalField, model_meta(model).fields_map[relation])
+    return field.related_model
+
+
+def listed_columns(model: Type[Model]) -> list[str]:
+    """
+    Return the columns of a table that are part of a listed row.
+
+    Foreign keys are nested as relations, the bookkeeping timestamps are never listed.
+
+    Args:
+        model (Type[Model]): The Tortoise ORM table class.
+
+    Returns:
+        list[str]: The column names in table order.
+    """
+    meta: MetaInfo = model_meta(model)
+    skipped: set[str] = {*UNLISTED_COLUMNS, *map(FOREIGN_KEY.format, meta.fk_fields)}
+    return [name for name in meta.fields_db_projection if name not in skipped]
+
+
+def not_found(model: Type[Model] | None) -> HTTPException:
+    """
+    Build the 404 error reported when a row of the given table does not exist.
+
+    Args:
+        model (Type[Model] | None): The table that was queried.
+
+    Returns:
+        HTTPException: The error with a human readable table name.
+    """
+    table = "Record"
+    if model and hasattr(model, "Meta") and hasattr(model.Meta, "table"):
+        singular: str = model.Meta.table[:-1]
+        table = singular.title().replace("_", " ")
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{table} with such id does not exist",
+    )
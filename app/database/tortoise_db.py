@@ -1,25 +1,65 @@
 from uuid import UUID
+import asyncpg
 from fastapi.exceptions import HTTPException
 from fastapi import status
-from typing import Type, Generic, TypeVar
+from typing import Any, AsyncIterator, Mapping, Type, Generic, TypeVar
 from database.abstract_database import (
     AbstractDatabase,
 )
-from database import models
 from tortoise import exceptions as tort_exc
-from tortoise import Model
+from tortoise import Model, timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.queryset import QuerySet
-from tortoise.contrib.pydantic import (
-    pydantic_model_creator,
-    pydantic_queryset_creator,
-    PydanticListModel,
-)
+from tortoise.transactions import in_transaction
+from tortoise.contrib.pydantic import pydantic_model_creator
 from pydantic import BaseModel
 from functools import wraps
-from api.v1.order.models import OrderUpdateModel
+from api.v1.order.models import NewOrder, OrderUpdateModel
+from database.counters import (
+    CountMode,
+    RowCount,
+    RowCounter,
+)
+from database.events import (
+    WriteAction,
+    WriteEvent,
+    write_events,
+)
+from database.cursor import (
+    Cursor,
+    CursorDirection,
+    decode_cursor,
+    encode_cursor,
+)
+from database.keyset import PageRows, cursor_keyset, keyset_filter, keyset_ordering
+from database.order_checks import ORDER_RELATIONS, BatchChecks, order_columns, reference_error
+from database.replicas import read_replicas
+from database.tables import FOREIGN_KEY, ID, UPDATED, listed_columns, model_meta, not_found, related_model
+from database.versions import RowVersion
+from core.metrics import observed
 
 ModelType = TypeVar("ModelType", bound=Model)
 
+BULK_BATCH_SIZE = 500
+JOINED_COLUMN = "{0}__{1}"
+TABLE_UPDATED = '(SELECT MAX("updated") FROM "{0}") "updated_{1}"'
+
+
+def _conflict(error: tort_exc.IntegrityError) -> HTTPException:
+    """
+    Build the 409 error reported when a write violates a constraint.
+
+    Args:
+        error (IntegrityError): The error raised by the write.
+
+    Returns:
+        HTTPException: The conflict with the database message.
+    """
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"IntegrityError: {error}",
+    )
+
 
 def _exists(func):
     """
@@ -40,62 +80,124 @@ def _exists(func):
         try:
             return await func(*args, **kwargs)
         except tort_exc.DoesNotExist as ex:
-            table = "Record"
-            if ex.model and hasattr(ex.model, "Meta") and hasattr(ex.model.Meta, "table"):
-                table = ex.model.Meta.table[:-1].title().replace("_", " ")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{table} with such id does not exist".format(table=table),
-            )
+            raise not_found(ex.model)
         except tort_exc.IntegrityError as ie:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"IntegrityError: {ie}",
-            )
+            raise _conflict(ie)
 
     return wrapper
 
 
-class DogDatabase(AbstractDatabase, Generic[ModelType]):
-    def __init__(self, model: Type[ModelType]):
+def _nested(row: dict[str, Any], columns: dict[str, str]) -> dict[str, Any] | None:
+    # Joined columns are read as ``<relation>__<column>``, a relation that is not set reads as NULLs.
+    related: dict[str, Any] = {column: row.pop(joined) for joined, column in columns.items()}
+    return related if related[ID] is not None else None
+
+
+class DogDatabase(AbstractDatabase, Generic[ModelType]):  # noqa: WPS214
+    # Reads go to the connection ``read_replicas`` picks for the request, writes to the default one.
+    # Forward relations loaded with a JOIN together with the row itself.
+    _related: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        model: Type[ModelType],
+        counter: RowCounter | None = None,
+        related_counters: Mapping[str, RowCounter] | None = None,
+    ):
         """
         Initialize the database instance with a specific Tortoise ORM model.
 
         Args:
             model (Type[TM]): The Tortoise ORM model class to use for database operations.
+            counter (RowCounter | None): Count strategy for paginated listings, exact counts if omitted.
+            related_counters (Mapping[str, RowCounter] | None): Count strategies of the joined tables
+                keyed by relation name, exact counts for the ones omitted.
         """
         self._model = model
-        self._pydantic = pydantic_model_creator(model)
-        self._pydantic_list = pydantic_queryset_creator(model)
+        self._meta = model_meta(model)
+        self.table: str = self._meta.db_table
+        self._counter = counter or RowCounter(model)
+        self._related_counters: dict[str, RowCounter] = {
+            name: (related_counters or {}).get(name) or RowCounter(related_model(model, name)) for name in self._related
+        }
+        # Backward relations are never part of the API models, loading them is wasted queries.
+        exclude: tuple[str, ...] = tuple(self._meta.backward_fk_fields | self._meta.backward_o2o_fields)
+        self._pydantic = pydantic_model_creator(model, exclude=exclude)
+        self._cursor_fields: list[str] = [*getattr(model.Meta, "ordering", []), ID]
+        # Listed rows are read as plain values, joined relations as ``<relation>__<column>``.
+        self._related_columns: dict[str, dict[str, str]] = {
+            name: {JOINED_COLUMN.format(name, column): column for column in listed_columns(related_model(model, name))}
+            for name in self._related
+        }
+        self._columns: list[str] = [
+            *listed_columns(model),
+            *(joined for columns in self._related_columns.values() for joined in columns),
+        ]
+        self._tables: tuple[str, ...] = (
+            self.table,
+            *(model_meta(related_model(model, name)).db_table for name in self._related),
+        )
+        columns: str = ", ".join(TABLE_UPDATED.format(table, index) for index, table in enumerate(self._tables))
+        self._version_query: str = f"SELECT {columns}"
 
+    @observed
     async def fetch_all_data(
         self,
         page: int,
         size: int,
-    ) -> dict[str, list[ModelType] | int]:
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Fetch all rows from the database with pagination.
 
         Args:
             page (int): The page number to retrieve.
             size (int): The number of rows per page.
+            count_mode (CountMode | None): Strategy for the total count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match.
 
         Returns:
-            dict[str, list[TT] | int]: A dictionary containing pagination information and a list of rows.
+            dict[str, Any]: A dictionary containing pagination information and a list of rows.
         """
-        total_count: int = await self._model.all().count()
-        total_pages: int = (total_count + size - 1) // size
+        connection: BaseDBAsyncClient | None = read_replicas.connection()
+        row_count: RowCount = await self._counter.count(count_mode, filters, using_db=connection)
         offset: int = (page - 1) * size
-        queryset: QuerySet = self._model.all().offset(offset).limit(size)
-        instances: PydanticListModel = await self._pydantic_list.from_queryset(queryset)
-        return {
-            "page_number": page,
-            "size": size,
-            "total_pages": total_pages,
-            "total_result": total_count,
-            "result": instances.model_dump(),
-        }
+        rows: list[dict[str, Any]] = await self._serialize(self._listed(connection, filters).offset(offset).limit(size))
+        found = PageRows(rows, more_before=bool(offset), more_after=offset + len(rows) < row_count.total)
+        return {"page_number": page, **self._page(size, row_count, found)}
+
+    @observed
+    async def fetch_data_by_cursor(
+        self,
+        cursor: str,
+        size: int,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch the page adjacent to a cursor using keyset pagination.
+
+        The page is located with a ``WHERE (ordering..., id) > (...)`` predicate on the
+        model ordering instead of an ``OFFSET``, so any page costs the same as the first one.
+
+        Args:
+            cursor (str): Opaque cursor previously returned as ``next_cursor`` or ``prev_cursor``.
+            size (int): The number of rows per page.
+            count_mode (CountMode | None): Strategy for the total count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match, the same as for the previous page.
 
+        Returns:
+            dict[str, Any]: A dictionary containing pagination information,
+            a list of rows and the cursors of the adjacent pages.
+        """
+        connection: BaseDBAsyncClient | None = read_replicas.connection()
+        queryset: QuerySet = self._listed(connection, filters)
+        found: PageRows = await self._rows_after(queryset, decode_cursor(cursor, self._cursor_fields), size)
+        row_count: RowCount = await self._counter.count(count_mode, filters, using_db=connection)
+        return {"page_number": None, **self._page(size, row_count, found)}
+
+    @observed
     @_exists
     async def fetch_single_row(self, row_id: UUID) -> ModelType:
         """
@@ -107,8 +209,136 @@ class DogDatabase(AbstractDatabase, Generic[ModelType]):
         Returns:
             TM: The row matching the given ID.
         """
-        return await self._model.get(id=row_id)
+        return await self._model.get(id=row_id, using_db=read_replicas.connection()).select_related(*self._related)
+
+    @observed
+    async def fetch_rows(self, row_ids: list[UUID]) -> list[dict]:
+        """
+        Fetch the rows with the given IDs with a single ``WHERE id IN (...)`` query.
+
+        Args:
+            row_ids (list[UUID]): The unique identifiers of the rows.
+
+        Returns:
+            list[dict]: The serialized rows in the model ordering, missing IDs are skipped.
+        """
+        if not row_ids:
+            return []
+        return await self._serialize(
+            self._model.all(using_db=read_replicas.connection()).filter(id__in=row_ids).order_by(*self._cursor_fields),
+        )
+
+    @observed
+    async def stream_rows(self, chunk_size: int, **filters: Any) -> AsyncIterator[list[dict]]:
+        """
+        Iterate over every matching row in keyset-paginated chunks.
+
+        Each chunk is one ``WHERE (ordering..., id) > (last row) ... LIMIT`` statement
+        reading plain column values, so neither the table size nor the position in it
+        changes the memory or the cost of a chunk.
+
+        Args:
+            chunk_size (int): The number of rows per chunk.
+            **filters (Any): ORM lookups the rows must match, e.g. ``status=...``.
+
+        Returns:
+            AsyncIterator[list[dict]]: Chunks of column values in the model ordering,
+            foreign keys as ``<name>_id``.
+        """
+        # One replica for the whole stream, its chunks then see the same state of the table.
+        queryset: QuerySet = self._model.all(using_db=read_replicas.connection()).filter(**filters)
+        chunk_queryset: QuerySet = queryset
+        while True:
+            chunk: QuerySet = chunk_queryset.order_by(*self._cursor_fields).limit(chunk_size)
+            rows: list[dict] = await chunk.values(*self._meta.fields_db_projection)
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            keyset: dict[str, Any] = {field: rows[-1][field] for field in self._cursor_fields}
+            chunk_queryset = queryset.filter(keyset_filter(keyset, forward=True))
+
+    @observed
+    async def fetch_row_version(self, row_id: UUID) -> RowVersion:
+        """
+        Read the validator of a row without fetching or serializing the row.
+
+        Only ``updated`` of the row and of its joined relations is selected, which
+        the ``(id, updated)`` indexes answer without reading the table.
+
+        Args:
+            row_id (UUID): The unique identifier of the row.
+
+        Returns:
+            RowVersion: The same version ``row_version`` gives for the current row.
+
+        Raises:
+            HTTPException: If the row does not exist.
+        """
+        # Ordered by id so the default ordering does not pull non-indexed columns in.
+        row: QuerySet = self._model.all(using_db=read_replicas.connection()).filter(id=row_id).order_by(ID)
+        columns: list[str] = [UPDATED, *(JOINED_COLUMN.format(name, UPDATED) for name in self._related)]
+        timestamps: tuple | None = await row.first().values_list(*columns)
+        if timestamps is None:
+            raise not_found(self._model)
+        return RowVersion.of(self.table, row_id, *timestamps)
+
+    def row_version(self, row: ModelType) -> RowVersion:
+        """
+        Compute the validator of a row returned by ``fetch_single_row``.
+
+        Args:
+            row (TM): The row with its relations loaded.
+
+        Returns:
+            RowVersion: The version of the row.
+        """
+        return RowVersion.of(
+            self.table,
+            row.id,  # type: ignore[attr-defined]
+            row.updated,  # type: ignore[attr-defined]
+            *(getattr(getattr(row, name), UPDATED, None) for name in self._related),
+        )
+
+    @observed
+    async def fetch_table_version(self) -> RowVersion:
+        """
+        Read the latest ``updated`` of the table and of its joined relations with one
+        aggregate statement, which the ``updated`` indexes answer without reading the tables.
+
+        Deleting a joined row nulls the references to it without touching ``updated``,
+        so the joined tables are counted too, each with its configured strategy.
+
+        Returns:
+            RowVersion: The version of the table.
+        """
+        connection: BaseDBAsyncClient | None = read_replicas.connection()
+        rows: list[dict] = await (connection or self._meta.db).execute_query_dict(self._version_query)
+        totals: list[int] = [
+            (await counter.count(using_db=connection)).total for counter in self._related_counters.values()
+        ]
+        updated: map = map(self._meta.fields_map[UPDATED].to_python_value, rows[0].values())
+        return RowVersion.of(*updated, *self._tables, *totals)
+
+    @observed
+    async def count_rows(
+        self,
+        count_mode: CountMode | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> RowCount:
+        """
+        Count the rows of a listing the way its pages count them.
+
+        Args:
+            count_mode (CountMode | None): Strategy for the count, the repository default if omitted.
+            filters (dict[str, Any] | None): ORM lookups the rows must match.
+
+        Returns:
+            RowCount: The total and the mode that produced it.
+        """
+        return await self._counter.count(count_mode, filters, using_db=read_replicas.connection())
 
+    @observed
     async def insert_row(self, instance: BaseModel) -> UUID:
         """
         Insert a new row into the database.
@@ -120,9 +350,27 @@ class DogDatabase(AbstractDatabase, Generic[ModelType]):
             UUID: The unique identifier of the newly inserted row.
         """
         row: ModelType = await self._model.create(**instance.model_dump())
-        await row.save()
+        self._publish_insert(row)
         return row.id  # type: ignore[attr-defined]
 
+    @observed
+    @_exists
+    async def insert_rows(self, instances: list[BaseModel]) -> list[UUID | HTTPException]:
+        """
+        Insert many rows with multi-row INSERT statements inside one transaction.
+
+        Args:
+            instances (list[TT]): The data for the new rows.
+
+        Returns:
+            list[UUID | HTTPException]: The identifier of every new row, in input order.
+        """
+        rows: list[ModelType] = [self._model(**instance.model_dump()) for instance in instances]
+        failed: dict[UUID, HTTPException] = await self._bulk_create(rows)
+        row_ids: list[UUID] = [row.id for row in rows]  # type: ignore[attr-defined]
+        return [failed.get(row_id, row_id) for row_id in row_ids]
+
+    @observed
     @_exists
     async def update_row(self, row_id: UUID, instance: BaseModel) -> None:
         """
@@ -132,20 +380,193 @@ class DogDatabase(AbstractDatabase, Generic[ModelType]):
             row_id (UUID): The unique identifier of the row to update.
             instance (TT): The updated data for the row.
         """
-        row: ModelType = await self._model.get(id=row_id)
-        await row.update_from_dict(instance.model_dump())
-        await row.save()
+        await self._update(row_id, **instance.model_dump())
 
+    @observed
     @_exists
     async def delete_row(self, row_id: UUID) -> None:
         """
-        Delete a row from the database by its ID.
+        Delete a row from the database by its ID with a single ``DELETE ... WHERE id = ...`` statement.
 
         Args:
             row_id (UUID): The unique identifier of the row to delete.
         """
-        row: ModelType = await self._model.get(id=row_id)
-        await row.delete()
+        deleted: int = await self._model.filter(id=row_id).delete()
+        if not deleted:
+            raise not_found(self._model)
+        self._publish(WriteAction.delete, row_id)
+
+    def _listed(self, connection: BaseDBAsyncClient | None, filters: dict[str, Any] | None) -> QuerySet:
+        return self._model.all(using_db=connection).filter(**(filters or {})).order_by(*self._cursor_fields)
+
+    async def _rows_after(self, queryset: QuerySet, position: Cursor, size: int) -> PageRows:
+        """
+        Read the page next to a cursor, one row more to know whether another page follows.
+
+        Args:
+            queryset (QuerySet): The listed rows.
+            position (Cursor): The decoded cursor.
+            size (int): The number of rows per page.
+
+        Returns:
+            PageRows: The rows in the model ordering and whether rows precede and follow them.
+        """
+        forward: bool = position.direction == CursorDirection.next
+        boundary: QuerySet = queryset.filter(keyset_filter(cursor_keyset(self._meta, position), forward))
+        rows: list[dict[str, Any]] = await self._serialize(
+            boundary.order_by(*keyset_ordering(self._cursor_fields, forward)).limit(size + 1),
+        )
+        has_more: bool = len(rows) > size
+        page_rows: list[dict[str, Any]] = rows[:size]
+        if forward:
+            return PageRows(page_rows, more_before=bool(page_rows), more_after=has_more)
+        page_rows.reverse()
+        return PageRows(page_rows, more_before=has_more, more_after=bool(page_rows))
+
+    def _page(self, size: int, row_count: RowCount, found: PageRows) -> dict[str, Any]:
+        rows: list[dict[str, Any]] = found.rows
+        return {
+            "size": size,
+            "total_pages": (row_count.total + size - 1) // size,
+            "total_result": row_count.total,
+            "count_mode": row_count.mode,
+            "result": rows,
+            "next_cursor": self._cursor(rows[-1], CursorDirection.next) if rows and found.more_after else None,
+            "prev_cursor": self._cursor(rows[0], CursorDirection.prev) if rows and found.more_before else None,
+        }
+
+    def _cursor(self, row: dict, direction: CursorDirection) -> str:
+        return encode_cursor(self._cursor_fields, row, direction)
+
+    async def _serialize(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        """
+        Run the queryset with its forward relations joined in and return plain rows.
+
+        Column values are read directly, without building model instances or
+        validating them again: they come from our own tables.
+
+        Args:
+            queryset (QuerySet): The page query.
+
+        Returns:
+            list[dict[str, Any]]: The rows, every relation nested as a dict or None when unset.
+        """
+        rows: list[dict[str, Any]] = await queryset.values(*self._columns)
+        for name, columns in self._related_columns.items():
+            for row in rows:
+                row[name] = _nested(row, columns)
+        return rows
+
+    async def _bulk_create(self, rows: list[ModelType]) -> dict[UUID, HTTPException]:
+        """
+        Insert rows in one transaction, or one by one if a concurrent write made the batch fail.
+
+        Args:
+            rows (list[TM]): The rows to insert.
+
+        Returns:
+            dict[UUID, HTTPException]: The error of every row that was not inserted, keyed by its id.
+        """
+        if not rows:
+            return {}
+        try:
+            async with in_transaction(self._meta.default_connection) as connection:
+                await self._insert_batch(rows, connection)
+        except tort_exc.IntegrityError:
+            # Another request took a slot or removed a reference after the checks, only its rows fail.
+            return await self._create_each(rows)
+        for row in rows:
+            self._publish_insert(row)
+        return {}
+
+    async def _insert_batch(self, rows: list[ModelType], connection: BaseDBAsyncClient) -> None:
+        if connection.capabilities.dialect == "postgres":
+            await self._copy(rows, connection)
+        else:
+            await self._model.bulk_create(rows, batch_size=BULK_BATCH_SIZE, using_db=connection)
+
+    async def _create_each(self, rows: list[ModelType]) -> dict[UUID, HTTPException]:
+        failed: dict[UUID, HTTPException] = {}
+        for row in rows:
+            try:
+                await row.save(force_create=True)
+            except tort_exc.IntegrityError as error:
+                failed[row.id] = await self._row_error(row, error)  # type: ignore[attr-defined]
+            else:
+                self._publish_insert(row)
+        return failed
+
+    async def _row_error(self, row: ModelType, error: tort_exc.IntegrityError) -> HTTPException:
+        """
+        Translate the integrity error of a single row of a bulk insert.
+
+        Args:
+            row (TM): The row that was not inserted.
+            error (IntegrityError): The error raised by its insert.
+
+        Returns:
+            HTTPException: The error reported for the row.
+        """
+        return _conflict(error)
+
+    async def _copy(self, rows: list[ModelType], connection) -> None:
+        """
+        Load rows with a binary ``COPY ... FROM STDIN`` on Postgres.
+
+        Column values go through the ORM fields, so ``auto_now`` timestamps and enums
+        are written exactly as ``bulk_create`` would write them.
+
+        Args:
+            rows (list[TM]): The rows to load.
+            connection: The transaction the rows are loaded in.
+
+        Raises:
+            IntegrityError: If a row violates a constraint, as ``bulk_create`` would raise it.
+        """
+        columns: dict[str, str] = self._meta.fields_db_projection
+        records: list[tuple] = [
+            tuple(self._meta.fields_map[name].to_db_value(getattr(row, name), row) for name in columns) for row in rows
+        ]
+        # Tortoise has no COPY API, the transaction exposes the underlying asyncpg connection.
+        # Its errors are not translated by Tortoise, constraint violations are translated here.
+        try:
+            await connection._connection.copy_records_to_table(  # noqa: WPS437
+                self.table,
+                records=records,
+                columns=list(columns.values()),
+            )
+        except asyncpg.IntegrityConstraintViolationError as error:
+            raise tort_exc.IntegrityError(error) from error
+
+    def _publish_insert(self, row: ModelType) -> None:
+        written: dict = {name: getattr(row, name) for name in self._meta.fields_db_projection}
+        self._publish(WriteAction.insert, written.pop(ID), written)
+
+    def _publish(self, action: WriteAction, row_id: UUID, written: dict | None = None) -> None:
+        write_events.publish(WriteEvent(self.table, action, row_id, written or {}))
+
+    async def _update(self, row_id: UUID, **changes) -> None:
+        """
+        Update a row with a single ``UPDATE ... WHERE id = ...`` statement.
+
+        Args:
+            row_id (UUID): The unique identifier of the row to update.
+            **changes: Column values to write.
+
+        Raises:
+            HTTPException: If no row has the given ID.
+        """
+        # QuerySet.update() bypasses auto_now, so the timestamp is written explicitly.
+        changes[UPDATED] = timezone.now()
+        updated: int = await self._model.filter(id=row_id).update(**changes)
+        if not updated:
+            raise not_found(self._model)
+        fk_fields: set[str] = self._meta.fk_fields
+        self._publish(
+            WriteAction.update,
+            row_id,
+            {FOREIGN_KEY.format(name) if name in fk_fields else name: written for name, written in changes.items()},
+        )
 
 
 class DogWalkerDatabase(DogDatabase, Generic[ModelType]):
@@ -153,6 +574,9 @@ class DogWalkerDatabase(DogDatabase, Generic[ModelType]):
 
 
 class OrderDatabase(DogDatabase, Generic[ModelType]):
+    _related = ORDER_RELATIONS
+
+    @observed
     @_exists
     async def insert_row(self, instance: OrderUpdateModel) -> UUID:
         """
@@ -164,18 +588,37 @@ class OrderDatabase(DogDatabase, Generic[ModelType]):
         Returns:
             UUID: The unique identifier of the newly inserted row.
         """
-        dog: models.DogTable = await models.DogTable.get(id=instance.dog)
-        walker: models.DogWalkerTable = await models.DogWalkerTable.get(
-            id=instance.walker,
-        )
-        row: ModelType = await self._model.create(
-            dog=dog,
-            walker=walker,
-            **instance.model_dump(exclude={"dog", "walker"}),
-        )
-        await row.save()
+        try:
+            row: ModelType = await self._model.create(**order_columns(instance))
+        except tort_exc.IntegrityError as error:
+            missing: Exception = await reference_error(error, instance.dog, instance.walker)
+            raise missing
+        self._publish_insert(row)
         return row.id  # type: ignore[attr-defined]
 
+    @observed
+    @_exists
+    async def insert_rows(self, instances: list[NewOrder]) -> list[UUID | HTTPException]:
+        """
+        Insert many orders with multi-row INSERT statements inside one transaction.
+
+        Referenced dogs and walkers are checked with one ``IN`` query per table and
+        busy slots with one more query, so the cost does not grow with extra round
+        trips per order. Orders that fail a check are reported and skipped.
+
+        Args:
+            instances (list[NewOrder]): The data for the new orders.
+
+        Returns:
+            list[UUID | HTTPException]: For every order, in input order, its new identifier
+            or the error a single insert would have raised.
+        """
+        checks: BatchChecks = await BatchChecks.load(self._model, instances)
+        outcomes: list[UUID | HTTPException] = [checks.outcome(order) for order in instances]
+        failed: dict[UUID, HTTPException] = await self._bulk_create(checks.rows)  # type: ignore[arg-type]
+        return [failed.get(outcome, outcome) if isinstance(outcome, UUID) else outcome for outcome in outcomes]
+
+    @observed
     @_exists
     async def update_row(
         self,
@@ -189,43 +632,16 @@ class OrderDatabase(DogDatabase, Generic[ModelType]):
             row_id (UUID): The unique identifier of the row to update.
             instance (TT): The updated data for the row.
         """
-        row: ModelType = await self._model.get(id=row_id)
-        dog: models.DogTable = await models.DogTable.get(id=instance.dog)
-        walker: models.DogWalkerTable = await models.DogWalkerTable.get(
-            id=instance.walker,
+        try:
+            await self._update(row_id, **order_columns(instance))
+        except tort_exc.IntegrityError as error:
+            missing: Exception = await reference_error(error, instance.dog, instance.walker)
+            raise missing
+
+    async def _row_error(self, row: ModelType, error: tort_exc.IntegrityError) -> HTTPException:
+        missing: Exception = await reference_error(
+            error,
+            row.dog_id,  # type: ignore[attr-defined]
+            row.walker_id,  # type: ignore[attr-defined]
         )
-        dict_for_update = instance.model_dump(exclude={"dog", "walker"})
-        dict_for_update["dog"] = dog
-        dict_for_update["walker"] = walker
-        row.update_from_dict(dict_for_update)
-        await row.save()
-
-
-async def get_dog_database() -> AbstractDatabase:
-    """
-    Dependency to provide an instance of DogDatabase.
-
-    Returns:
-        AbstractDatabase: An instance of DogDatabase.
-    """
-    return DogDatabase[models.DogTable](models.DogTable)
-
-
-async def get_walker_database() -> AbstractDatabase:
-    """
-    Dependency to provide an instance of DogWalkerDatabase.
-
-    Returns:
-        AbstractDatabase: An instance of DogWalkerDatabase.
-    """
-    return DogWalkerDatabase[models.DogWalkerTable](models.DogWalkerTable)
-
-
-async def get_order_database() -> AbstractDatabase:
-    """
-    Dependency to provide an instance of OrderDatabase.
-
-    Returns:
-        AbstractDatabase: An instance of OrderDatabase.
-    """
-    return OrderDatabase[models.OrderTable](models.OrderTable)
+        return missing if isinstance(missing, HTTPException) else _conflict(error)
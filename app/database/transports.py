@@ -0,0 +1,231 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Type
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+NOTIFY = "SELECT pg_notify($1, $2)"
+NOT_CONNECTED = "Invalidation channel not connected within {0:.1f} s, retrying in the background"
+UNAVAILABLE = "Invalidation channel unavailable, retrying in {0:.1f} s"
+# A connection that broke or could not be opened, worth retrying.
+CONNECTION_ERRORS: tuple[Type[Exception], ...] = (OSError, asyncpg.PostgresConnectionError, asyncpg.InterfaceError)
+
+Receiver = Callable[[str], None]
+
+
+class BusTransport(Enum):
+    none = "none"
+    loopback = "loopback"
+    postgres = "postgres"
+
+
+class InvalidationTransport(ABC):
+    """
+    Channel carrying serialized write events between the workers of a deployment.
+    """
+
+    @abstractmethod
+    async def start(self, receive: Receiver, reconnected: Callable[[], None] | None = None) -> None:
+        """
+        Connect and deliver every payload sent on the channel to ``receive``.
+
+        Args:
+            receive (Receiver): Called with each payload, including the ones this worker sent.
+            reconnected (Callable[[], None] | None): Called after a lost connection was restored,
+                payloads sent meanwhile were not delivered.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def send(self, payload: str) -> None:
+        """
+        Send a payload to every worker listening on the channel.
+
+        Args:
+            payload (str): The serialized events.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """
+        Stop listening and release the connection.
+        """
+        raise NotImplementedError
+
+
+class LoopbackTransport(InvalidationTransport):
+    """
+    In-process transport, every transport on the same channel name receives the payloads.
+    Used by tests and benchmarks in place of a second worker.
+    """
+
+    _channels: dict[str, set["LoopbackTransport"]] = {}
+
+    def __init__(self, channel: str):
+        """
+        Args:
+            channel (str): The channel name.
+        """
+        self.channel = channel
+        self._receive: Receiver | None = None
+
+    async def start(self, receive: Receiver, reconnected: Callable[[], None] | None = None) -> None:
+        self._receive = receive
+        self._channels.setdefault(self.channel, set()).add(self)
+
+    async def send(self, payload: str) -> None:
+        loop = asyncio.get_running_loop()
+        for transport in self._channels.get(self.channel, ()):
+            loop.call_soon(transport.deliver, payload)
+
+    async def stop(self) -> None:
+        self._channels.get(self.channel, set()).discard(self)
+        self._receive = None
+
+    def deliver(self, payload: str) -> None:
+        """
+        Hand a payload sent on the channel to this transport's receiver.
+
+        Args:
+            payload (str): The serialized events.
+        """
+        if self._receive is not None:
+            self._receive(payload)
+
+
+@dataclass(frozen=True)
+class Reconnect:
+    """
+    Connection waits of the Postgres transport.
+
+    Attributes:
+        retry_delay (float): Wait before the second connection attempt in seconds, doubled after each failure.
+        max_retry_delay (float): Longest wait between two connection attempts in seconds.
+        connect_timeout (float): Longest wait for the first connection in ``start`` in seconds.
+    """
+
+    retry_delay: float = 0.5
+    max_retry_delay: float = 30.0
+    connect_timeout: float = 5.0
+
+
+class PostgresTransport(InvalidationTransport):
+    """
+    Postgres ``LISTEN``/``NOTIFY`` transport on a dedicated connection.
+
+    Notifications are only delivered once the sending transaction commits, and
+    write events are published after the write committed, so a listener never
+    sees a write the database would not return yet. A lost connection is
+    re-established in the background with exponential backoff and listens
+    again; sends wait for it. ``start`` waits at most ``connect_timeout`` for
+    the first connection, the worker then serves requests while it is retried.
+    """
+
+    def __init__(self, dsn: str, channel: str, timing: Reconnect | None = None):
+        """
+        Args:
+            dsn (str): The Tortoise database URL, ``asyncpg://`` or ``postgres://``.
+            channel (str): The notification channel.
+            timing (Reconnect | None): Connection waits and retry delays, the defaults if omitted.
+        """
+        _, address = dsn.split("://", 1)
+        self._dsn = f"postgresql://{address}"
+        self.channel = channel
+        self.timing = timing or Reconnect()
+        self._connection: asyncpg.Connection | None = None
+        self._receive: Receiver | None = None
+        self._reconnected: Callable[[], None] | None = None
+        self._reconnecting: asyncio.Task | None = None
+
+    async def start(self, receive: Receiver, reconnected: Callable[[], None] | None = None) -> None:
+        self._receive = receive
+        # A first connection made in time has nothing to catch up on, a later one may have missed writes.
+        self._reconnected = None
+        connecting: asyncio.Task = self._lost()
+        await asyncio.wait({connecting}, timeout=self.timing.connect_timeout)
+        self._reconnected = reconnected
+        if connecting.done():
+            connecting.result()
+        else:
+            logger.warning(NOT_CONNECTED.format(self.timing.connect_timeout))
+
+    async def send(self, payload: str) -> None:
+        connection: asyncpg.Connection = await self._connected()
+        try:
+            await connection.execute(NOTIFY, self.channel, payload)
+        except CONNECTION_ERRORS:
+            logger.warning("Invalidation channel connection lost while sending, resending after reconnect")
+            connection.terminate()
+            connection = await self._connected()
+            await connection.execute(NOTIFY, self.channel, payload)
+
+    async def stop(self) -> None:
+        self._receive = None
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+            self._reconnecting = None
+        if self._connection is not None:
+            self._connection.remove_termination_listener(self._lost)
+            await self._connection.close()
+            self._connection = None
+
+    async def _connected(self) -> asyncpg.Connection:
+        if self._connection is None or self._connection.is_closed():
+            await asyncio.shield(self._lost())
+        if self._connection is None:
+            raise RuntimeError("Postgres transport is not started")
+        return self._connection
+
+    def _lost(self, _connection: asyncpg.Connection | None = None) -> asyncio.Task:
+        if self._receive is None:
+            raise RuntimeError("Postgres transport is not started")
+        if self._reconnecting is None:
+            self._reconnecting = asyncio.ensure_future(self._reconnect(self._receive))
+        return self._reconnecting
+
+    async def _reconnect(self, receive: Receiver) -> None:
+        delay: float = self.timing.retry_delay
+        connection: asyncpg.Connection | None = await _listening(self._dsn, self.channel, receive)
+        while connection is None:
+            logger.warning(UNAVAILABLE.format(delay))
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.timing.max_retry_delay)
+            connection = await _listening(self._dsn, self.channel, receive)
+        connection.add_termination_listener(self._lost)
+        self._connection = connection
+        self._reconnecting = None
+        if self._reconnected is not None:
+            logger.warning("Invalidation channel reconnected, writes of other workers may have been missed")
+            self._reconnected()
+
+
+async def _listening(dsn: str, channel: str, receive: Receiver) -> asyncpg.Connection | None:
+    """
+    Open a connection listening on the channel.
+
+    Args:
+        dsn (str): The Postgres URL.
+        channel (str): The notification channel.
+        receive (Receiver): Called with each notification payload.
+
+    Returns:
+        asyncpg.Connection | None: The listening connection, None when Postgres could not be reached.
+    """
+    try:
+        connection: asyncpg.Connection = await asyncpg.connect(dsn)
+    except CONNECTION_ERRORS:
+        logger.exception("Invalidation channel connection failed")
+        return None
+    try:
+        await connection.add_listener(channel, lambda _connection, _pid, _channel, payload: receive(payload))
+    except CONNECTION_ERRORS:
+        logger.exception("Listening on the invalidation channel failed")
+        connection.terminate()
+        return None
+    return connection
@@ -0,0 +1,60 @@
+import hashlib
+from datetime import datetime
+from enum import Enum
+from typing import Any, NamedTuple
+
+MICROSECONDS = 1000000
+# Bytes of the entity tag digest, 32 hexadecimal characters.
+DIGEST_SIZE = 16
+
+
+def _token(part: Any) -> str:
+    if isinstance(part, datetime):
+        # Microseconds since the epoch, so equal instants match whatever their timezone.
+        return str(round(part.timestamp() * MICROSECONDS))
+    if isinstance(part, Enum):
+        return str(part.value)
+    if part is None:
+        return "-"
+    return str(part)
+
+
+class RowVersion(NamedTuple):
+    """
+    Validator of a response, used for ``ETag`` and ``Last-Modified``.
+
+    Attributes:
+        etag (str): Quoted strong entity tag.
+        last_modified (datetime | None): Latest ``updated`` the response depends on.
+    """
+
+    etag: str
+    last_modified: datetime | None
+
+    @classmethod
+    def of(cls, *parts: Any) -> "RowVersion":
+        """
+        Build a version from the values a response depends on.
+
+        Args:
+            *parts (Any): Table names, ids, ``updated`` timestamps, counts or query parameters.
+
+        Returns:
+            RowVersion: The entity tag of the parts and the latest timestamp among them.
+        """
+        tokens: str = "|".join(map(_token, parts))
+        digest: str = hashlib.blake2b(tokens.encode(), digest_size=DIGEST_SIZE).hexdigest()
+        timestamps: list[datetime] = [part for part in parts if isinstance(part, datetime)]
+        return cls(f'"{digest}"', max(timestamps) if timestamps else None)
+
+    def derive(self, *parts: Any) -> "RowVersion":
+        """
+        Version of a response built from this one and extra values, e.g. the page requested.
+
+        Args:
+            *parts (Any): The extra values.
+
+        Returns:
+            RowVersion: A new entity tag with the same ``last_modified``.
+        """
+        return RowVersion(RowVersion.of(self.etag, *parts).etag, self.last_modified)
@@ -0,0 +1,23 @@
+import os
+import shutil
+
+# Read by prometheus_client when it is imported, the workers inherit it from the master.
+metrics_dir: str = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/dogs_walkers_metrics")
+
+bind = "0.0.0.0:8000"
+workers = 4
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server) -> None:
+    # Samples of a previous run would be summed with the new ones.
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def child_exit(server, worker) -> None:
+    # Not imported at the top: prometheus_client reads the variable when it is imported.
+    from prometheus_client import multiprocess  # noqa: WPS433
+
+    # Live gauges of an exited worker stop counting, its counters and histograms are kept.
+    multiprocess.mark_process_dead(worker.pid)
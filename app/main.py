@@ -1,27 +1,16 @@
-from fastapi import FastAPI, status
-from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
-from tortoise import Tortoise
-
-from core.logger import LOGGING
 from core.config import settings
-from logging import config as logging_config
+from core.lifespan import lifespan
+from core.middleware import MetricsMiddleware, QueryTimingMiddleware
+from api.stats import stats_router
 from api.v1.order.order import order_router
 from api.v1.dog.dog_router import dogs_router
 from api.v1.walker.walker import walker_router
-
-
-@asynccontextmanager
-async def lifespan(_):
-    logging_config.dictConfig(LOGGING)
-    await Tortoise.init(
-        db_url=settings.db.postgres_dsn,
-        modules={"models": ["database.models"]},
-    )
-    yield
-
-    await Tortoise.close_connections()
-
+from database.pool import PoolTimeoutError
+from database.queries import install as install_query_recorder
+from database.replicas import ReadRoutingMiddleware
 
 app = FastAPI(
     title=settings.fast_api.project_name,
@@ -32,12 +21,30 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+install_query_recorder()
+app.add_middleware(
+    QueryTimingMiddleware,
+    server_timing=settings.queries.server_timing,
+    n_plus_one_threshold=settings.queries.n_plus_one_threshold,
+)
+app.add_middleware(ReadRoutingMiddleware, read_your_writes_seconds=settings.db.read_your_writes_seconds)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(order_router)
 app.include_router(dogs_router)
 app.include_router(walker_router)
+app.include_router(stats_router)
 
 
 @app.get("/healthcheck", status_code=status.HTTP_200_OK, include_in_schema=False)
 async def health():
     return status.HTTP_200_OK
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout(_: Request, error: PoolTimeoutError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(error)},
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,45 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "dogs" (
+            "id" UUID NOT NULL  PRIMARY KEY,
+            "created" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "updated" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "apartment" INT NOT NULL,
+            "name" VARCHAR(50) NOT NULL,
+            "breed" VARCHAR(50) NOT NULL  DEFAULT '',
+            "active" BOOL NOT NULL  DEFAULT True
+        );
+        CREATE TABLE IF NOT EXISTS "dog_walkers" (
+            "id" UUID NOT NULL  PRIMARY KEY,
+            "created" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "updated" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "name" VARCHAR(50) NOT NULL,
+            "surname" VARCHAR(50) NOT NULL,
+            "active" BOOL NOT NULL  DEFAULT True
+        );
+        CREATE TABLE IF NOT EXISTS "orders" (
+            "id" UUID NOT NULL  PRIMARY KEY,
+            "created" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "updated" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+            "walk_at" TIMESTAMPTZ NOT NULL,
+            "status" VARCHAR(13) NOT NULL  DEFAULT 'Запланирована',
+            "dog_id" UUID REFERENCES "dogs" ("id") ON DELETE SET NULL,
+            "walker_id" UUID REFERENCES "dog_walkers" ("id") ON DELETE SET NULL,
+            CONSTRAINT "uid_orders_walk_at_940062" UNIQUE ("walk_at", "walker_id"),
+            CONSTRAINT "uid_orders_walk_at_000604" UNIQUE ("walk_at", "dog_id")
+        );
+        COMMENT ON COLUMN "orders"."status" IS 'planned: Запланирована\nin_progress: В процессе\nsuccess: Завершена\ncancel: Отменена';
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSONB NOT NULL
+        );"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
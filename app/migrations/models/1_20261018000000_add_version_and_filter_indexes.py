@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_dogs_updated_0b3a6b" ON "dogs" ("updated");
+        CREATE INDEX IF NOT EXISTS "idx_dogs_id_f09807" ON "dogs" ("id", "updated");
+        CREATE INDEX IF NOT EXISTS "idx_dog_walkers_updated_970530" ON "dog_walkers" ("updated");
+        CREATE INDEX IF NOT EXISTS "idx_dog_walkers_id_5f1a6c" ON "dog_walkers" ("id", "updated");
+        CREATE INDEX IF NOT EXISTS "idx_orders_updated_d19b2d" ON "orders" ("updated");
+        CREATE INDEX IF NOT EXISTS "idx_orders_id_dc9717" ON "orders" ("id", "updated");
+        CREATE INDEX IF NOT EXISTS "idx_orders_status_fdb3c9" ON "orders" ("status", "walk_at");
+        CREATE INDEX IF NOT EXISTS "idx_orders_dog_id_23553a" ON "orders" ("dog_id", "walk_at");
+        CREATE INDEX IF NOT EXISTS "idx_orders_walker__cffd9f" ON "orders" ("walker_id", "walk_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_orders_walker__cffd9f";
+        DROP INDEX IF EXISTS "idx_orders_dog_id_23553a";
+        DROP INDEX IF EXISTS "idx_orders_status_fdb3c9";
+        DROP INDEX IF EXISTS "idx_orders_id_dc9717";
+        DROP INDEX IF EXISTS "idx_orders_updated_d19b2d";
+        DROP INDEX IF EXISTS "idx_dog_walkers_id_5f1a6c";
+        DROP INDEX IF EXISTS "idx_dog_walkers_updated_970530";
+        DROP INDEX IF EXISTS "idx_dogs_id_f09807";
+        DROP INDEX IF EXISTS "idx_dogs_updated_0b3a6b";"""
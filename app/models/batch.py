@@ -0,0 +1,49 @@
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from fastapi import Query, status
+from fastapi.exceptions import HTTPException
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 1000
+
+TResult = TypeVar("TResult", bound=BaseModel)
+
+
+class BatchIdsParams:
+    def __init__(
+        self,
+        ids: list[str] = Query(
+            ...,
+            description=f"Ids to read, comma separated or repeated, at most {MAX_BATCH_IDS}",
+        ),
+    ):
+        raw_ids: list[str] = ",".join(ids).split(",")
+        try:
+            self.ids: list[UUID] = [UUID(raw_id) for raw_id in map(str.strip, raw_ids) if raw_id]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="ids must be UUIDs",
+            )
+        if len(self.ids) > MAX_BATCH_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"At most {MAX_BATCH_IDS} ids can be read at once",
+            )
+
+
+class BatchRequest(BaseModel):
+    ids: list[UUID] = Field(..., max_length=MAX_BATCH_IDS)
+
+
+class BatchItemResult(BaseModel, Generic[TResult]):
+    status: int
+    row: TResult | None = None
+    detail: Any = None
+
+
+class BatchResponse(BaseModel, Generic[TResult]):
+    found: int
+    missing: int
+    result: dict[UUID, BatchItemResult[TResult]]  # noqa: WPS110
@@ -0,0 +1,34 @@
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+MAX_BULK_ITEMS = 1000
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: int
+    id: UUID | None = None
+    detail: Any = None
+
+
+class BulkResponse(BaseModel):
+    created: int
+    failed: int
+    result: list[BulkItemResult]  # noqa: WPS110
+
+
+class RejectedRow(BaseModel):
+    line: int
+    status: int
+    detail: Any = None
+
+
+class ImportReport(BaseModel):
+    received: int
+    imported: int
+    rejected: int
+    seconds: float
+    rows_per_second: float
+    rejected_rows: list[RejectedRow]
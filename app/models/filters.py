@@ -0,0 +1,38 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Depends, Query
+from tortoise import timezone
+
+from database.models import OrderStatus
+
+
+class WalkTimeRange:
+    def __init__(
+        self,
+        walk_at_from: datetime | None = Query(None, description="Earliest walk start, inclusive"),
+        walk_at_to: datetime | None = Query(None, description="Latest walk start, inclusive"),
+    ):
+        self.start = _stored_time(walk_at_from)
+        self.end = _stored_time(walk_at_to)
+
+
+class OrderFilterParams:
+    def __init__(
+        self,
+        walker: UUID | None = Query(None, description="Only orders of this dog walker"),
+        dog: UUID | None = Query(None, description="Only orders of this dog"),
+        status: OrderStatus | None = Query(None, description="Only orders in this status"),
+        walk_at: WalkTimeRange = Depends(),
+    ):
+        self.walker = walker
+        self.dog = dog
+        self.status = status
+        self.walk_at = walk_at
+
+
+def _stored_time(walk_at: datetime | None) -> datetime | None:
+    # Walk times are naive local times like in WalkTime, the column holds aware values.
+    if walk_at is None:
+        return None
+    return timezone.make_aware(walk_at.replace(tzinfo=None))
@@ -1,12 +1,8 @@
-from typing import Union
+from typing import Generic, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel
-from api.v1.walker.models import (
-    DogWalkerReturnModel,
-)
-from api.v1.dog.models import DogReturnModel
-from api.v1.order.order import OrderReturnModel
+from database.counters import CountMode
 
 
 class PaginatedParams:
@@ -17,23 +13,30 @@ class PaginatedParams:
             10,
             description="Number of records per page",
         ),
+        cursor: str | None = Query(
+            None,
+            description="Opaque next_cursor/prev_cursor of a previous page, switches to keyset pagination",
+        ),
+        count: CountMode | None = Query(
+            None,
+            description="How total_result is computed, the endpoint default if omitted",
+        ),
     ):
         self.page = page
         self.size = size
+        self.cursor = cursor
+        self.count = count
 
 
-RESULT_TYPE = list[
-    Union[
-        DogReturnModel,
-        OrderReturnModel,
-        DogWalkerReturnModel,
-    ]
-]
+TResult = TypeVar("TResult", bound=BaseModel)
 
 
-class PaginationResponse(BaseModel):
-    page_number: int
+class PaginationResponse(BaseModel, Generic[TResult]):
+    page_number: int | None
     size: int
     total_pages: int
     total_result: int
-    result: RESULT_TYPE
+    count_mode: CountMode = CountMode.exact
+    result: list[TResult]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
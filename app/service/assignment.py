@@ -0,0 +1,151 @@
+import asyncio
+import random
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import date, datetime
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+from uuid import UUID
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+
+from service.availability import AvailabilityIndex, availability_index, slot_of
+
+
+class AssignmentPolicy(Enum):
+    least_loaded = "least_loaded"
+    round_robin = "round_robin"
+
+
+def _retryable(conflict: HTTPException) -> HTTPException:
+    # Only a taken slot is worth retrying with the next walker.
+    if conflict.status_code != status.HTTP_409_CONFLICT:
+        raise conflict
+    return conflict
+
+
+class WalkerAssigner:
+    """
+    Picks a free active walker for a new order and inserts it race-safely.
+
+    Candidates come from the availability index. Within a worker, choosing and
+    inserting run under a per-slot lock, single and bulk orders alike, so
+    concurrent orders for the same slot see each other's walkers as taken. Across workers the ``(walk_at, walker)``
+    unique constraint is the arbiter: a conflicting insert is retried with the
+    next candidate.
+
+    Attributes:
+        policy (AssignmentPolicy): How candidates are ranked.
+        max_attempts (int): Inserts tried before giving up on a slot.
+    """
+
+    def __init__(
+        self,
+        index: AvailabilityIndex = availability_index,
+        policy: AssignmentPolicy = AssignmentPolicy.least_loaded,
+        max_attempts: int = 3,
+    ):
+        """
+        Args:
+            index (AvailabilityIndex): The walker slot index, the process-wide one by default.
+            policy (AssignmentPolicy): How candidates are ranked.
+            max_attempts (int): Inserts tried before giving up on a slot.
+        """
+        self._index = index
+        self.policy = policy
+        self.max_attempts = max_attempts
+        self._turn: int = 0
+        self._locks: dict[tuple[date, int], asyncio.Lock] = {}
+        self._holders: dict[tuple[date, int], int] = defaultdict(int)
+
+    def candidates(self, walk_at: datetime, exclude: set[UUID] | None = None) -> list[UUID]:
+        """
+        Free active walkers for a slot, best candidate first.
+
+        ``least_loaded`` prefers walkers with the fewest orders that day, ties are
+        shuffled so workers do not all race for the same walker. ``round_robin``
+        rotates the starting walker on every call.
+
+        Args:
+            walk_at (datetime): The walk start.
+            exclude (set[UUID] | None): Walkers that must not be picked.
+
+        Returns:
+            list[UUID]: Ranked candidates.
+        """
+        free_walkers: set[UUID] = set(self._index.free_walkers(walk_at))
+        free: list[UUID] = sorted(free_walkers - (exclude or set()))
+        if not free:
+            return []
+        if self.policy == AssignmentPolicy.round_robin:
+            self._turn = (self._turn + 1) % len(free)
+            return free[self._turn:] + free[: self._turn]
+        day, _ = slot_of(walk_at)
+        random.shuffle(free)
+        return sorted(free, key=lambda walker_id: self._load(walker_id, day))
+
+    async def assign(
+        self,
+        walk_at: datetime,
+        insert: Callable[[UUID], Awaitable[UUID]],
+    ) -> tuple[UUID, UUID]:
+        """
+        Choose a walker for the slot and insert the order with it.
+
+        Args:
+            walk_at (datetime): The walk start, validated against the grid.
+            insert (Callable[[UUID], Awaitable[UUID]]): Inserts the order for a walker, returns its id.
+
+        Returns:
+            tuple[UUID, UUID]: The new order id and the assigned walker id.
+
+        Raises:
+            HTTPException: 409 when no walker could be assigned, or the error of the insert.
+        """
+        await self._index.ensure_loaded()
+        error: HTTPException | None = None
+        async with self._slot_lock(slot_of(walk_at)):
+            for walker_id in self.candidates(walk_at)[: self.max_attempts]:
+                try:
+                    order_id: UUID = await insert(walker_id)
+                except HTTPException as conflict:
+                    error = _retryable(conflict)
+                else:
+                    return order_id, walker_id
+        raise error or HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No dog walker is available at this time",
+        )
+
+    @asynccontextmanager
+    async def reserve(self, walk_times: Iterable[datetime]) -> AsyncIterator[None]:
+        """
+        Hold the slot locks of many walk times, e.g. while a bulk create picks walkers and inserts.
+
+        Locks are taken in slot order, so two batches never wait for each other crosswise.
+
+        Args:
+            walk_times (Iterable[datetime]): Walk starts of the orders, duplicates are fine.
+        """
+        await self._index.ensure_loaded()
+        async with AsyncExitStack() as stack:
+            for slot in sorted({slot_of(walk_at) for walk_at in walk_times}):
+                await stack.enter_async_context(self._slot_lock(slot))
+            yield
+
+    def _load(self, walker_id: UUID, day: date) -> int:
+        return self._index.busy_slots(walker_id, day).bit_count()
+
+    @asynccontextmanager
+    async def _slot_lock(self, slot: tuple[date, int]) -> AsyncIterator[None]:
+        lock: asyncio.Lock = self._locks.setdefault(slot, asyncio.Lock())
+        self._holders[slot] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._holders[slot] -= 1
+            if not self._holders[slot]:
+                del self._holders[slot]
+                del self._locks[slot]
@@ -0,0 +1,242 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Any, Callable
+from uuid import UUID
+
+from tortoise import timezone
+
+from api.v1.order.models import MAX_HOUR, MIN_HOUR
+from database.events import WriteAction, WriteEvent
+from database.models import DogWalkerTable, OrderTable
+
+logger = logging.getLogger(__name__)
+
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = (MAX_HOUR - MIN_HOUR + 1) * 60 // SLOT_MINUTES
+
+ORDERS_TABLE: str = OrderTable.Meta.table
+WALKERS_TABLE: str = DogWalkerTable.Meta.table
+LOADED = "Availability index loaded: {0} walkers, {1} orders"
+
+
+def slot_of(walk_at: datetime) -> tuple[date, int]:
+    """
+    Locate a walk on the half-hour grid used by ``WalkTime``.
+
+    Args:
+        walk_at (datetime): The walk start, already validated against the grid.
+
+    Returns:
+        tuple[date, int]: The day and the slot number within that day, 0 for 7:00.
+    """
+    minutes: int = (walk_at.hour - MIN_HOUR) * 60 + walk_at.minute
+    return walk_at.date(), minutes // SLOT_MINUTES
+
+
+async def _upcoming(since: date) -> tuple[list[UUID], list[Any]]:
+    """
+    Read the active walkers and the orders from the given day onward.
+
+    Args:
+        since (date): The first day to read orders of.
+
+    Returns:
+        tuple[list[UUID], list[Any]]: Walker identifiers and ``(id, walker_id, walk_at)`` of every order.
+    """
+    walkers: list[Any] = await DogWalkerTable.filter(active=True).values_list("id", flat=True)
+    orders: list[Any] = await OrderTable.filter(
+        walk_at__gte=timezone.make_aware(datetime.combine(since, time())),
+    ).values_list("id", "walker_id", "walk_at")
+    return walkers, orders
+
+
+class AvailabilityIndex:  # noqa: WPS214
+    """
+    In-memory per-walker, per-day slot bitmaps of upcoming orders.
+
+    Every order occupies its walker's slot whatever its status, exactly like the
+    ``(walk_at, walker)`` unique constraint. The index is loaded once from today's
+    orders onward and then kept current from repository write events, so free
+    walkers are found without querying ``orders``. Once the date changes the next
+    use drops the days that have passed.
+
+    Attributes:
+        _busy (dict[tuple[UUID, date], int]): Bitmap of taken slots per walker and day.
+        _orders (dict[UUID, tuple[UUID | None, date, int]]): Walker, day and slot of every indexed order.
+        _active (set[UUID]): Identifiers of active walkers.
+    """
+
+    def __init__(self) -> None:
+        self._busy: dict[tuple[UUID, date], int] = defaultdict(int)
+        self._orders: dict[UUID, tuple[UUID | None, date, int]] = {}
+        self._active: set[UUID] = set()
+        self._since: date | None = None
+        self._pending: list[WriteEvent] | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the index has been loaded from the database.
+
+        Returns:
+            bool: True once ``load`` has completed.
+        """
+        return self._since is not None and self._pending is None
+
+    async def load(self) -> None:
+        """
+        (Re)build the index from active walkers and orders from today onward.
+
+        Writes published while the rows are being read are replayed afterwards.
+        """
+        self._pending = []
+        since: date = datetime.now().date()
+        try:
+            walkers, orders = await _upcoming(since)
+        except Exception:
+            self._pending = None
+            raise
+        self._busy = defaultdict(int)
+        self._orders = {}
+        self._active = set(walkers)
+        self._since = since
+        for order in orders:
+            self._add_order(*order)
+        self._replay()
+        active: int = len(self._active)
+        logger.info(LOADED.format(active, len(self._orders)))
+
+    async def ensure_loaded(self) -> None:
+        """
+        Load the index on first use when it was not loaded at startup, or refresh it once the date changed.
+        """
+        if self._since is None and self._pending is None:
+            await self.load()
+        else:
+            self.refresh(datetime.now().date())
+
+    def refresh(self, today: date) -> None:
+        """
+        Drop the days before ``today`` and index from it onward.
+
+        Args:
+            today (date): The current day, earlier days are never asked for again.
+        """
+        if self._since is None or self._pending is not None or today <= self._since:
+            return
+        self._keep_busy(lambda _, day: day >= today)
+        self._orders = {
+            order_id: indexed for order_id, indexed in self._orders.items() if indexed[1] >= today
+        }
+        self._since = today
+
+    def clear(self) -> None:
+        """
+        Forget everything, the next ``ensure_loaded`` reloads from the database.
+        """
+        self._busy = defaultdict(int)
+        self._orders = {}
+        self._active = set()
+        self._since = None
+        self._pending = None
+
+    def free_walkers(self, walk_at: datetime) -> list[UUID]:
+        """
+        Active walkers without an order in the given slot.
+
+        Args:
+            walk_at (datetime): The walk start, validated against the grid.
+
+        Returns:
+            list[UUID]: Identifiers of the free walkers.
+        """
+        day, slot = slot_of(walk_at)
+        bit: int = 1 << slot
+        return [walker_id for walker_id in self._active if not self.busy_slots(walker_id, day) & bit]
+
+    def busy_slots(self, walker_id: UUID, day: date) -> int:
+        """
+        Bitmap of the slots a walker is booked for on a day.
+
+        Args:
+            walker_id (UUID): The walker.
+            day (date): The day.
+
+        Returns:
+            int: Bit ``n`` is set when slot ``n`` is taken.
+        """
+        return self._busy.get((walker_id, day), 0)
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Apply a repository write to the index.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        if self._pending is not None:
+            self._pending.append(event)
+            return
+        if self._since is None:
+            return
+        if event.table == ORDERS_TABLE:
+            self._handle_order(event)
+        elif event.table == WALKERS_TABLE:
+            self._handle_walker(event)
+
+    def _replay(self) -> None:
+        pending: list[WriteEvent] = self._pending or []
+        self._pending = None
+        for event in pending:
+            self.on_write(event)
+
+    def _handle_order(self, event: WriteEvent) -> None:
+        walker_id: UUID | None = event.columns.get("walker_id")
+        if event.action == WriteAction.insert:
+            self._add_order(event.row_id, walker_id, event.columns["walk_at"])
+            return
+        indexed = self._orders.pop(event.row_id, None)
+        if indexed is None:
+            return
+        indexed_walker, day, slot = indexed
+        self._release(indexed_walker, day, slot)
+        if event.action == WriteAction.update:
+            self._occupy(event.row_id, event.columns.get("walker_id", indexed_walker), day, slot)
+
+    def _handle_walker(self, event: WriteEvent) -> None:
+        if event.action == WriteAction.delete:
+            self._active.discard(event.row_id)
+            self._keep_busy(lambda walker_id, _: walker_id != event.row_id)
+        elif event.columns.get("active", True):
+            self._active.add(event.row_id)
+        else:
+            self._active.discard(event.row_id)
+
+    def _keep_busy(self, keep: Callable[[UUID, date], bool]) -> None:
+        self._busy = defaultdict(int, {
+            key: slots for key, slots in self._busy.items() if keep(*key)
+        })
+
+    def _add_order(self, order_id: UUID, walker_id: UUID | None, walk_at: datetime) -> None:
+        if timezone.is_aware(walk_at):
+            walk_at = timezone.make_naive(walk_at)
+        day, slot = slot_of(walk_at)
+        if self._since is None or day < self._since:
+            return
+        self._occupy(order_id, walker_id, day, slot)
+
+    def _occupy(self, order_id: UUID, walker_id: UUID | None, day: date, slot: int) -> None:
+        self._orders[order_id] = (walker_id, day, slot)
+        if walker_id is not None:
+            self._busy[(walker_id, day)] |= 1 << slot
+
+    def _release(self, walker_id: UUID | None, day: date, slot: int) -> None:
+        if walker_id is None or (walker_id, day) not in self._busy:
+            return
+        self._busy[(walker_id, day)] &= ~(1 << slot)
+        if not self._busy[(walker_id, day)]:
+            del self._busy[(walker_id, day)]
+
+
+availability_index = AvailabilityIndex()
@@ -0,0 +1,101 @@
+from typing import Any, Type
+from uuid import UUID
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from pydantic import BaseModel, ValidationError
+
+from models.bulk import BulkItemResult
+
+# Found and missing counters and the read of every identifier of a batch.
+BatchReads = dict[str, int | dict[UUID, dict]]
+RowsById = dict[UUID, dict]
+
+
+def validate_many(
+    create_model: Type[BaseModel],
+    raw_rows: list[dict[str, Any]],
+) -> tuple[dict[int, BaseModel], dict[int, BulkItemResult]]:
+    """
+    Validate the items of a bulk create one by one.
+
+    Args:
+        create_model (Type[BaseModel]): The model new records are validated against.
+        raw_rows (list[dict[str, Any]]): Raw data of the records to create.
+
+    Returns:
+        tuple[dict[int, BaseModel], dict[int, BulkItemResult]]: The valid instances and the
+        results of the invalid items, both keyed by item index.
+    """
+    valid: dict[int, BaseModel] = {}
+    rejected: dict[int, BulkItemResult] = {}
+    for index, raw in enumerate(raw_rows):
+        try:
+            valid[index] = create_model.model_validate(raw)
+        except ValidationError as error:
+            rejected[index] = BulkItemResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=error.errors(include_url=False, include_context=False),
+            )
+    return valid, rejected
+
+
+def bulk_result(index: int, outcome: UUID | HTTPException) -> BulkItemResult:
+    """
+    Report the insert of one item of a bulk create.
+
+    Args:
+        index (int): The position of the item in the request.
+        outcome (UUID | HTTPException): The identifier of the new record or the error of its insert.
+
+    Returns:
+        BulkItemResult: The result of the item.
+    """
+    if isinstance(outcome, UUID):
+        return BulkItemResult(index=index, status=status.HTTP_201_CREATED, id=outcome)
+    return BulkItemResult(index=index, status=outcome.status_code, detail=outcome.detail)
+
+
+def batch_reads(row_ids: list[UUID], rows: list[dict], missing: HTTPException) -> BatchReads:
+    """
+    Report the read of every identifier of a batch.
+
+    Args:
+        row_ids (list[UUID]): The identifiers read, without duplicates.
+        rows (list[dict]): The records found.
+        missing (HTTPException): The error a single read of a missing record raises.
+
+    Returns:
+        BatchReads: Found and missing counters and, for every identifier in ``row_ids``
+        order, the status and the record or the status and the error detail.
+    """
+    found: RowsById = {row["id"]: row for row in rows}
+    reads: dict[UUID, dict] = {row_id: _batch_read(row_id, found, missing) for row_id in row_ids}
+    missing_count: int = len(row_ids) - len(found)
+    return {"found": len(found), "missing": missing_count, "result": reads}
+
+
+def bulk_response(outcomes: dict[int, BulkItemResult]) -> dict[str, Any]:
+    """
+    Count the created and the failed items of a bulk create.
+
+    Args:
+        outcomes (dict[int, BulkItemResult]): The result of every item, keyed by item index.
+
+    Returns:
+        dict[str, Any]: The counters and the results in request order.
+    """
+    bulk_results: list[BulkItemResult] = [outcomes[index] for index in sorted(outcomes)]
+    created: int = sum(outcome.status == status.HTTP_201_CREATED for outcome in bulk_results)
+    return {
+        "created": created,
+        "failed": len(bulk_results) - created,
+        "result": bulk_results,
+    }
+
+
+def _batch_read(row_id: UUID, found: RowsById, missing: HTTPException) -> dict[str, Any]:
+    if row_id not in found:
+        return {"status": missing.status_code, "detail": missing.detail}
+    return {"status": status.HTTP_200_OK, "row": found[row_id]}
@@ -0,0 +1,222 @@
+import codecs
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Callable, NamedTuple
+
+from fastapi import status
+
+from api.v1.export import FileFormat
+from models.bulk import ImportReport, RejectedRow
+from service.services import BaseService
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_REJECTIONS = 1000
+FOREIGN_KEY_SUFFIX = "_id"
+INVALID_JSON = "Invalid JSON: {0}"
+NOT_AN_OBJECT = "Expected a JSON object"
+WRONG_COLUMNS = "Expected {0} columns, got {1}"
+
+
+class SourceRecord(NamedTuple):
+    """
+    One record of an import file.
+
+    Attributes:
+        line (int): Line number in the file, 1-based.
+        row (dict[str, Any] | None): The parsed fields, None when the line could not be parsed.
+        error (str | None): Why the line could not be parsed.
+    """
+
+    line: int
+    row: dict[str, Any] | None
+    error: str | None = None
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending: str = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _ndjson_record(line_number: int, line: str) -> SourceRecord:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as error:
+        return SourceRecord(line_number, None, INVALID_JSON.format(error.msg))
+    if not isinstance(row, dict):
+        return SourceRecord(line_number, None, NOT_AN_OBJECT)
+    return SourceRecord(line_number, row)
+
+
+class _CsvRecords:
+    """
+    Parser of the lines of a CSV file, the first one is the header.
+    """
+
+    def __init__(self) -> None:
+        self._header: list[str] = []
+
+    def __call__(self, line_number: int, line: str) -> SourceRecord | None:
+        cells: list[str] = next(csv.reader([line]))
+        if not self._header:
+            self._header = cells
+            return None
+        if len(cells) != len(self._header):
+            error: str = WRONG_COLUMNS.format(len(self._header), len(cells))
+            return SourceRecord(line_number, None, error)
+        # Empty values are dropped so model defaults apply.
+        row: dict[str, Any] = {name: cell for name, cell in zip(self._header, cells) if cell}
+        return SourceRecord(line_number, row)
+
+
+async def read_records(chunks: AsyncIterator[bytes], file_format: FileFormat) -> AsyncIterator[SourceRecord]:
+    """
+    Parse an NDJSON or CSV byte stream into records, one line at a time.
+
+    CSV files need a header line. Empty CSV values are dropped so model defaults
+    apply, quoted values spanning several lines are not supported.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The file content in arbitrary chunks.
+        file_format (FileFormat): NDJSON or CSV.
+
+    Returns:
+        AsyncIterator[SourceRecord]: The records in file order, blank lines skipped.
+    """
+    parse: Callable[[int, str], SourceRecord | None]
+    if file_format == FileFormat.csv:
+        parse = _CsvRecords()
+    else:
+        parse = _ndjson_record
+    line_number: int = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        record: SourceRecord | None = parse(line_number, line) if line.strip() else None
+        if record is not None:
+            yield record
+
+
+class _Importer:
+    """
+    Counters, rejected rows and pending batch of one import.
+    """
+
+    def __init__(self, service: BaseService, on_rejected: Callable[[RejectedRow], None] | None) -> None:
+        self._service = service
+        self._on_rejected = on_rejected
+        self._model_fields: set[str] = set(service.create_model.model_fields)
+        self._lines: list[int] = []
+        self._rows: list[dict[str, Any]] = []
+        self._rejected: list[RejectedRow] = []
+        self._rejected_count: int = 0
+        self._received: int = 0
+        self._imported: int = 0
+
+    async def add(self, record: SourceRecord, batch_size: int) -> None:
+        """
+        Queue a record, inserting the batch once it is full.
+
+        Args:
+            record (SourceRecord): The parsed record.
+            batch_size (int): Records validated and committed together.
+        """
+        self._received += 1
+        if record.row is None:
+            unparsed = RejectedRow(line=record.line, status=status.HTTP_400_BAD_REQUEST, detail=record.error)
+            self._reject(unparsed)
+            return
+        self._lines.append(record.line)
+        self._rows.append(self._normalized(record.row))
+        if len(self._rows) >= batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Insert the queued records through the bulk create path of the service.
+        """
+        if not self._rows:
+            return
+        lines: list[int] = self._lines
+        outcome: dict = await self._service.create_many(self._rows)
+        self._lines = []
+        self._rows = []
+        self._imported += outcome["created"]
+        for line, created in zip(lines, outcome["result"]):
+            if created.status != status.HTTP_201_CREATED:
+                self._reject(RejectedRow(line=line, status=created.status, detail=created.detail))
+
+    def report(self, seconds: float) -> ImportReport:
+        """
+        Summarize the import.
+
+        Args:
+            seconds (float): How long the import took.
+
+        Returns:
+            ImportReport: Counters, throughput and the first rejected rows.
+        """
+        return ImportReport(
+            received=self._received,
+            imported=self._imported,
+            rejected=self._rejected_count,
+            seconds=round(seconds, 3),
+            rows_per_second=round(self._imported / seconds, 1) if seconds else 0,
+            rejected_rows=self._rejected,
+        )
+
+    def _reject(self, row: RejectedRow) -> None:
+        self._rejected_count += 1
+        if len(self._rejected) < MAX_REPORTED_REJECTIONS:
+            self._rejected.append(row)
+        if self._on_rejected is not None:
+            self._on_rejected(row)
+
+    def _normalized(self, row: dict[str, Any]) -> dict[str, Any]:
+        return {self._field_name(name, row): cell for name, cell in row.items()}
+
+    def _field_name(self, name: str, row: dict[str, Any]) -> str:
+        # Exports name foreign keys ``<name>_id``, accept them so exported files load back.
+        relation: str = name.removesuffix(FOREIGN_KEY_SUFFIX)
+        if relation != name and relation in self._model_fields and relation not in row:
+            return relation
+        return name
+
+
+async def import_records(
+    service: BaseService,
+    records: AsyncIterator[SourceRecord],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    on_rejected: Callable[[RejectedRow], None] | None = None,
+) -> ImportReport:
+    """
+    Validate and insert records in bounded batches.
+
+    Every batch goes through the bulk create path of the service: the rows are
+    validated with the model of the entity, orders get their references and slots
+    checked and walkers assigned, and the valid rows are written and committed in
+    one transaction before the next batch is read.
+
+    Args:
+        service (BaseService): The service of the entity to import.
+        records (AsyncIterator[SourceRecord]): The parsed input.
+        batch_size (int): Records validated and committed together.
+        on_rejected (Callable[[RejectedRow], None] | None): Receives every rejected row,
+            the report itself keeps the first ``MAX_REPORTED_REJECTIONS``.
+
+    Returns:
+        ImportReport: Counters, throughput and the rejected rows.
+    """
+    started: float = time.perf_counter()
+    importer = _Importer(service, on_rejected)
+    async for record in records:
+        await importer.add(record, batch_size)
+    await importer.flush()
+    return importer.report(time.perf_counter() - started)
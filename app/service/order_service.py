@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi.exceptions import HTTPException
+from pydantic import BaseModel
+
+from api.v1.order.models import NewOrder, OrderReturnModel
+from core.config import settings
+from database.abstract_database import AbstractDatabase
+from database.models import OrderTable
+from models.filters import OrderFilterParams
+from service.assignment import WalkerAssigner
+from service.services import BaseService
+
+
+class OrderService(BaseService[OrderReturnModel, OrderTable]):
+    """
+    A service class for managing order-related operations.
+    Inherits standard CRUD operations from BaseService.
+    """
+
+    table = OrderTable
+    table_name = OrderTable.Meta.table
+    create_model = NewOrder
+    return_model = OrderReturnModel
+
+    def __init__(
+        self,
+        database: AbstractDatabase,
+        assigner: WalkerAssigner | None = None,
+    ):
+        """
+        Initializes the OrderService with a database and a walker assignment engine.
+
+        Args:
+            database (AbstractDatabase): The database instance to use for data operations.
+            assigner (WalkerAssigner | None): Picks walkers for orders created without one, built from the
+                assignment settings by default.
+        """
+        super().__init__(database)
+        self._assigner = assigner or WalkerAssigner(
+            policy=settings.assignment.policy,
+            max_attempts=settings.assignment.max_attempts,
+        )
+
+    async def create(self, instance: NewOrder) -> dict[str, UUID]:  # type: ignore[override]
+        """
+        Create a new order, assigning a free walker when none is given.
+
+        Args:
+            instance (NewOrder): The order data, ``walker`` may be omitted.
+
+        Returns:
+            Dict[str, UUID]: The identifier of the new order and, when assigned, of its walker.
+        """
+        if instance.walker is not None:
+            return {"id": await self._database.insert_row(instance)}
+        order_id, walker_id = await self._assigner.assign(
+            instance.walk_at,
+            lambda walker_id: self._database.insert_row(instance.model_copy(update={"walker": walker_id})),
+        )
+        return {"id": order_id, "walker": walker_id}
+
+    def filters(self, filter_params: OrderFilterParams) -> dict[str, Any]:
+        """
+        Translate the order filter parameters into ORM lookups.
+
+        Args:
+            filter_params (OrderFilterParams): The requested filters, unset ones are ignored.
+
+        Returns:
+            dict[str, Any]: Lookups for ``get_all``, ``get_list_version`` and ``export``.
+        """
+        filters: dict[str, Any] = {}
+        if filter_params.walker is not None:
+            filters["walker_id"] = filter_params.walker
+        if filter_params.dog is not None:
+            filters["dog_id"] = filter_params.dog
+        if filter_params.status is not None:
+            filters["status"] = filter_params.status
+        if filter_params.walk_at.start is not None:
+            filters["walk_at__gte"] = filter_params.walk_at.start
+        if filter_params.walk_at.end is not None:
+            filters["walk_at__lte"] = filter_params.walk_at.end
+        return filters
+
+    async def _insert_many(self, instances: list[NewOrder]) -> list[UUID | HTTPException]:  # type: ignore[override]
+        """
+        Insert the orders of a bulk create, assigning walkers to the ones that come without one.
+
+        Walkers are picked and the orders inserted under the slot locks of ``create``,
+        so a concurrent order for the same slot never gets a walker of the batch.
+
+        Args:
+            instances (list[NewOrder]): The validated orders.
+
+        Returns:
+            list[UUID | HTTPException]: The id of every inserted order or the error that rejected it.
+        """
+        unassigned: list[datetime] = [order.walk_at for order in instances if order.walker is None]
+        async with self._assigner.reserve(unassigned):
+            return await self._database.insert_rows(self._assign_many(instances))
+
+    def _assign_many(self, instances: list[NewOrder]) -> list[BaseModel]:
+        # Walkers already used in the same slot by earlier orders of the batch are skipped,
+        # orders left without a walker are reported as conflicts by the database.
+        taken: dict[datetime, set[UUID]] = {}
+        for given in instances:
+            if given.walker is not None:
+                taken.setdefault(given.walk_at, set()).add(given.walker)
+        prepared: list[BaseModel] = []
+        for order in instances:
+            slot_taken: set[UUID] = taken.setdefault(order.walk_at, set())
+            prepared.append(self._assign(order, slot_taken))
+        return prepared
+
+    def _assign(self, order: NewOrder, slot_taken: set[UUID]) -> NewOrder:
+        if order.walker is not None:
+            return order
+        candidates: list[UUID] = self._assigner.candidates(order.walk_at, exclude=slot_taken)
+        if not candidates:
+            return order
+        slot_taken.add(candidates[0])
+        return order.model_copy(update={"walker": candidates[0]})
@@ -0,0 +1,140 @@
+from typing import Type
+
+from tortoise import Model
+
+from database.abstract_database import AbstractDatabase
+from database.events import Listener, write_events
+from database.lru import CacheStats
+from service.availability import availability_index
+from service.repositories import Repositories, build_repositories
+from service.schedule import walker_schedules
+from service.order_service import OrderService
+from service.services import BaseService, DogService
+from service.single_flight import read_flights
+from service.walker_service import DogWalkerService
+
+
+class ServiceRegistry:  # noqa: WPS214
+    """
+    Process-wide container for repositories and services.
+
+    Building a repository runs ``pydantic_model_creator`` for its table, which is
+    far too expensive to repeat on every request. The registry builds every
+    repository and service once and hands out the same instances afterwards.
+
+    Attributes:
+        _repositories (Repositories): Repositories, row caches and row counters of every table.
+        _services (dict): Services keyed by their class.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty registry. Nothing is built until ``build`` is called.
+        """
+        self._repositories: Repositories = Repositories({}, {}, {})
+        self._services: dict[Type[BaseService], BaseService] = {}
+        self._listeners: list[Listener] = []
+
+    @property
+    def is_built(self) -> bool:
+        """
+        Whether repositories and services have already been created.
+
+        Returns:
+            bool: True once ``build`` has completed.
+        """
+        return bool(self._services)
+
+    def build(self) -> None:
+        """
+        Create every repository and service.
+
+        Must run after ``Tortoise.init`` so relations are resolved when the pydantic
+        models are generated. Repeated calls are no-ops.
+        """
+        if self.is_built:
+            return
+        self._repositories = build_repositories()
+        databases: dict[Type[Model], AbstractDatabase] = self._repositories.databases
+        self._services = {
+            DogService: DogService(databases[DogService.table]),
+            DogWalkerService: DogWalkerService(databases[DogWalkerService.table]),
+            OrderService: OrderService(databases[OrderService.table]),
+        }
+        self._listeners = [
+            availability_index.on_write,
+            walker_schedules.on_write,
+            read_flights.on_write,
+            *(counter.on_write for counter in self._repositories.counters.values()),
+            *(cache.on_write for cache in self._repositories.caches.values()),
+        ]
+        for listener in self._listeners:
+            write_events.subscribe(listener)
+
+    def clear(self) -> None:
+        """
+        Drop every built instance, e.g. after the ORM has been closed.
+        """
+        for listener in self._listeners:
+            write_events.unsubscribe(listener)
+        self._repositories = Repositories({}, {}, {})
+        self._services = {}
+        self._listeners = []
+        availability_index.clear()
+        walker_schedules.clear()
+        read_flights.clear()
+
+    def flush(self) -> None:
+        """
+        Drop everything derived from the tables while staying subscribed to the writes.
+
+        Used when writes of other workers may have been missed, e.g. after the
+        invalidation bus reconnected. The next reads go to the database.
+        """
+        for cache in self._repositories.caches.values():
+            cache.clear()
+        for counter in self._repositories.counters.values():
+            counter.invalidate()
+        availability_index.clear()
+        walker_schedules.clear()
+        read_flights.clear()
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Return the counters of every row cache and of the walker schedule cache.
+
+        Returns:
+            dict[str, CacheStats]: Cache counters keyed by table name, ``schedules`` for schedules.
+        """
+        stats: dict[str, CacheStats] = {name: cache.stats for name, cache in self._repositories.caches.items()}
+        stats["schedules"] = walker_schedules.stats
+        return stats
+
+    def database(self, table: Type[Model]) -> AbstractDatabase:
+        """
+        Return the repository serving the given table, building the registry on first use.
+
+        Args:
+            table (Type[Model]): The Tortoise ORM table class.
+
+        Returns:
+            AbstractDatabase: The shared repository instance.
+        """
+        self.build()
+        return self._repositories.databases[table]
+
+    def service(self, service_class: Type[BaseService]) -> BaseService:
+        """
+        Return the shared instance of the given service, building the registry on first use.
+
+        Args:
+            service_class (Type[BaseService]): The service class.
+
+        Returns:
+            BaseService: The shared service instance.
+        """
+        self.build()
+        return self._services[service_class]
+
+
+registry = ServiceRegistry()
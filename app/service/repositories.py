@@ -0,0 +1,99 @@
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Type
+
+from tortoise import Model
+
+from core.config import settings
+from database.abstract_database import AbstractDatabase
+from database.cache import CachedDatabase
+from database.lru import CacheLimits
+from database.counters import RowCounter
+from database.models import (
+    DogTable,
+    DogWalkerTable,
+    OrderTable,
+)
+from database.tables import FOREIGN_KEY, model_meta, related_model
+from database.tortoise_db import (
+    DogDatabase,
+    DogWalkerDatabase,
+    OrderDatabase,
+)
+
+DATABASES: Mapping[Type[Model], Type[DogDatabase]] = MappingProxyType({
+    DogTable: DogDatabase,
+    DogWalkerTable: DogWalkerDatabase,
+    OrderTable: OrderDatabase,
+})
+
+
+def _row_counter(table: Type[Model]) -> RowCounter:
+    pagination = settings.pagination
+    return RowCounter(
+        table,
+        default_mode=pagination.count_modes.get(model_meta(table).db_table, pagination.count_mode),
+        ttl=pagination.count_cache_ttl,
+    )
+
+
+def _repository(
+    table: Type[Model],
+    database_class: Type[DogDatabase],
+    counters: dict[Type[Model], RowCounter],
+) -> DogDatabase:
+    related_counters: dict[str, RowCounter] = {
+        name: counters[related_model(table, name)] for name in model_meta(table).fk_fields
+    }
+    return database_class(table, counter=counters[table], related_counters=related_counters)
+
+
+def _cached(table: Type[Model], database: AbstractDatabase) -> AbstractDatabase:
+    cache_settings = settings.cache
+    name: str = model_meta(table).db_table
+    if name not in cache_settings.tables:
+        return database
+    references: dict[str, str] = {
+        model_meta(related_model(table, field)).db_table: FOREIGN_KEY.format(field)
+        for field in model_meta(table).fk_fields
+    }
+    return CachedDatabase(
+        database,
+        name,
+        references=references,
+        limits=CacheLimits(cache_settings.max_size, cache_settings.ttl),
+    )
+
+
+class Repositories(NamedTuple):
+    """
+    Repositories of every table with the caches and row counters they use.
+
+    Attributes:
+        databases (dict[Type[Model], AbstractDatabase]): Repositories keyed by their Tortoise ORM table.
+        caches (dict[str, CachedDatabase]): Row caches in front of the repositories, keyed by table name.
+        counters (dict[str, RowCounter]): Row counters keyed by table name.
+    """
+
+    databases: dict[Type[Model], AbstractDatabase]
+    caches: dict[str, CachedDatabase]
+    counters: dict[str, RowCounter]
+
+
+def build_repositories() -> Repositories:
+    """
+    Create the repository of every table, cached where the settings ask for it.
+
+    Must run after ``Tortoise.init`` so relations are resolved when the pydantic
+    models are generated.
+
+    Returns:
+        Repositories: The new repositories, caches and counters.
+    """
+    counters: dict[Type[Model], RowCounter] = {table: _row_counter(table) for table in DATABASES}
+    built = Repositories({}, {}, {counter.table: counter for counter in counters.values()})
+    for table, database_class in DATABASES.items():
+        database: AbstractDatabase = _cached(table, _repository(table, database_class, counters))
+        if isinstance(database, CachedDatabase):
+            built.caches[database.table] = database
+        built.databases[table] = database
+    return built
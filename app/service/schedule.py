@@ -0,0 +1,218 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, NamedTuple, TypedDict
+from uuid import UUID
+
+from tortoise import timezone
+
+from api.v1.order.models import MIN_HOUR
+from core.config import settings
+from database.events import WriteAction, WriteEvent
+from database.lru import CacheStats, LRUCache
+from database.models import DogTable, DogWalkerTable, OrderTable
+from service.availability import SLOT_MINUTES, SLOTS_PER_DAY
+
+ORDERS_TABLE: str = OrderTable.Meta.table
+DOGS_TABLE: str = DogTable.Meta.table
+WALKERS_TABLE: str = DogWalkerTable.Meta.table
+
+ScheduleKey = tuple[UUID, date]
+# Orders of a schedule keyed by their aware walk start.
+BookedOrders = dict[datetime, dict[str, Any]]
+
+
+class _Entry(NamedTuple):
+    schedule: dict[str, Any]
+    orders: frozenset[UUID]
+    dogs: frozenset[UUID]
+
+
+class _Slot(TypedDict):
+    walk_at: datetime
+    order_id: UUID | None
+    status: str | None
+    dog: dict[str, Any] | None
+
+
+def _local(walk_at: datetime) -> datetime:
+    return timezone.make_naive(walk_at) if timezone.is_aware(walk_at) else walk_at
+
+
+def _slot(start: datetime, slot: int, booked: BookedOrders) -> _Slot:
+    walk_at: datetime = timezone.make_aware(start + timedelta(minutes=SLOT_MINUTES * slot))
+    order: dict[str, Any] | None = booked.get(walk_at)
+    if order is None:
+        return _Slot(walk_at=walk_at, order_id=None, status=None, dog=None)
+    dog: dict[str, Any] | None = None
+    if order["dog_id"] is not None:
+        dog = {
+            "id": order["dog_id"],
+            "apartment": order["apartment"],
+            "name": order["name"],
+            "breed": order["breed"],
+        }
+    return _Slot(
+        walk_at=walk_at,
+        order_id=order["order_id"],
+        status=order["status"],
+        dog=dog,
+    )
+
+
+async def _read(walker_id: UUID, day: date) -> _Entry:
+    start: datetime = datetime.combine(day, datetime.min.time()).replace(hour=MIN_HOUR)
+    end: datetime = start + timedelta(minutes=SLOT_MINUTES * (SLOTS_PER_DAY - 1))
+    orders: list[dict[str, Any]] = await OrderTable.filter(
+        walker_id=walker_id,
+        walk_at__gte=timezone.make_aware(start),
+        walk_at__lte=timezone.make_aware(end),
+    ).values(
+        "walk_at",
+        "status",
+        order_id="id",
+        dog_id="dog__id",
+        apartment="dog__apartment",
+        name="dog__name",
+        breed="dog__breed",
+    )
+    # Aware values compare by instant, whatever zone the column is read in.
+    booked: BookedOrders = {order["walk_at"]: order for order in orders}
+    slots: list[_Slot] = [_slot(start, slot, booked) for slot in range(SLOTS_PER_DAY)]
+    return _Entry(
+        schedule={"walker_id": walker_id, "date": day, "booked": len(orders), "slots": slots},
+        orders=frozenset(order["order_id"] for order in orders),
+        dogs=frozenset(filter(None, (order["dog_id"] for order in orders))),
+    )
+
+
+class WalkerSchedules:  # noqa: WPS214
+    """
+    LRU/TTL cache of walker day schedules.
+
+    A schedule is the full half-hour grid of a day with the order and dog booked
+    in every slot. It is built from one range query on ``(walker_id, walk_at)``
+    and kept until an order of that walker and day, or one of its dogs, is
+    written. Writes of other workers arrive through the invalidation bus when it
+    runs, ``ttl`` bounds the staleness of anything missed.
+
+    Attributes:
+        cache (LRUCache): The cached schedules keyed by walker and day.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        """
+        Args:
+            max_size (int): Maximum number of cached schedules.
+            ttl (float): Lifetime of a cached schedule in seconds.
+        """
+        self.cache: LRUCache[ScheduleKey, _Entry] = LRUCache(max_size, ttl, on_drop=self._dropped)
+        self._orders: dict[UUID, ScheduleKey] = {}
+        self._dogs: dict[UUID, set[ScheduleKey]] = defaultdict(set)
+        self._days: dict[UUID, set[date]] = defaultdict(set)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Hit, miss and eviction counters of the cache.
+
+        Returns:
+            CacheStats: The current counters.
+        """
+        return self.cache.stats
+
+    async def get(self, walker_id: UUID, day: date) -> dict[str, Any]:
+        """
+        Return the schedule of a walker, reading it from ``orders`` on a miss.
+
+        Args:
+            walker_id (UUID): The walker, its existence is not checked.
+            day (date): The day.
+
+        Returns:
+            dict[str, Any]: The walker, the day and every slot of the grid, free slots
+            without an order. Shared between callers, must not be modified.
+        """
+        key: ScheduleKey = (walker_id, day)
+        entry: _Entry | None = self.cache.get(key)
+        if entry is not None:
+            return entry.schedule
+        generation: int = self.cache.generation
+        entry = await _read(walker_id, day)
+        if generation == self.cache.generation:
+            self._store(key, entry)
+        return entry.schedule
+
+    def invalidate(self, walker_id: UUID | None, day: date | None = None) -> None:
+        """
+        Drop the schedule of a walker for one day, or for every day.
+
+        Args:
+            walker_id (UUID | None): The walker, None only outdates the reads in progress.
+            day (date | None): The day, all cached days of the walker if omitted.
+        """
+        if walker_id is None:
+            self.cache.invalidate()
+            return
+        days: tuple[date, ...] = (day,) if day else tuple(self._days.get(walker_id, ()))
+        self.cache.invalidate(*((walker_id, cached_day) for cached_day in days))
+
+    def clear(self) -> None:
+        """
+        Drop every cached schedule, the counters are kept.
+        """
+        self.cache.clear()
+        self._orders.clear()
+        self._dogs.clear()
+        self._days.clear()
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Drop the schedules affected by a repository write.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        if event.table == ORDERS_TABLE:
+            self._handle_order(event)
+        elif event.action != WriteAction.insert and event.table == DOGS_TABLE:
+            self.cache.invalidate(*self._dogs.get(event.row_id, ()))
+        elif event.action == WriteAction.delete and event.table == WALKERS_TABLE:
+            self.invalidate(event.row_id)
+
+    def _handle_order(self, event: WriteEvent) -> None:
+        key: ScheduleKey | None = self._orders.get(event.row_id)
+        if key is not None:
+            self.invalidate(*key)
+        walk_at: datetime | None = event.columns.get("walk_at")
+        # Updates do not carry walk_at, the order may have moved to any cached day of the walker.
+        self.invalidate(
+            event.columns.get("walker_id"),
+            _local(walk_at).date() if walk_at is not None else None,
+        )
+
+    def _store(self, key: ScheduleKey, entry: _Entry) -> None:
+        self.cache.put(key, entry)
+        if key not in self.cache:
+            return
+        self._days[key[0]].add(key[1])
+        for order_id in entry.orders:
+            self._orders[order_id] = key
+        for dog_id in entry.dogs:
+            self._dogs[dog_id].add(key)
+
+    def _dropped(self, key: ScheduleKey, entry: _Entry) -> None:
+        walker_id, day = key
+        self._days[walker_id].discard(day)
+        if not self._days[walker_id]:
+            del self._days[walker_id]
+        for order_id in entry.orders:
+            if self._orders.get(order_id) == key:
+                del self._orders[order_id]
+        for dog_id in entry.dogs:
+            keys: set[ScheduleKey] = self._dogs[dog_id]
+            keys.discard(key)
+            if not keys:
+                del self._dogs[dog_id]
+
+
+walker_schedules = WalkerSchedules(max_size=settings.cache.max_size, ttl=settings.cache.ttl)
@@ -1,61 +1,37 @@
-from fastapi import Depends
+from service.order_service import OrderService
 from service.services import (
     DogService,
-    DogWalkerService,
-    OrderService,
     BaseService,
 )
-from database.abstract_database import AbstractDatabase
-from database.tortoise_db import (
-    get_dog_database,
-    get_walker_database,
-    get_order_database,
-)
+from service.walker_service import DogWalkerService
+from service.registry import registry
 
 
-def get_dog_service(
-    db: AbstractDatabase = Depends(get_dog_database),
-) -> BaseService:
+def get_dog_service() -> BaseService:
     """
-    Provides an instance of DogService using the specified database dependency.
-
-    Args:
-        db (AbstractDatabase): The database instance for dog-related operations,
-        resolved via dependency injection.
+    Provides the shared DogService instance from the process-wide registry.
 
     Returns:
-        BaseService: An instance of DogService initialized with the provided database.
+        BaseService: The DogService built once at startup.
     """
-    return DogService(db)
+    return registry.service(DogService)
 
 
-def get_dog_walker_service(
-    db: AbstractDatabase = Depends(get_walker_database),
-) -> BaseService:
+def get_dog_walker_service() -> BaseService:
     """
-    Provides an instance of DogWalkerService using the specified database dependency.
-
-    Args:
-        db (AbstractDatabase): The database instance for dog walker-related operations,
-        resolved via dependency injection.
+    Provides the shared DogWalkerService instance from the process-wide registry.
 
     Returns:
-        BaseService: An instance of DogWalkerService initialized with the provided database.
+        BaseService: The DogWalkerService built once at startup.
     """
-    return DogWalkerService(db)
+    return registry.service(DogWalkerService)
 
 
-def get_order_service(
-    db: AbstractDatabase = Depends(get_order_database),
-) -> BaseService:
+def get_order_service() -> BaseService:
     """
-    Provides an instance of OrderService using the specified database dependency.
-
-    Args:
-        db (AbstractDatabase): The database instance for order-related operations,
-        resolved via dependency injection.
+    Provides the shared OrderService instance from the process-wide registry.
 
     Returns:
-        BaseService: An instance of OrderService initialized with the provided database.
+        BaseService: The OrderService built once at startup.
     """
-    return OrderService(db)
+    return registry.service(OrderService)
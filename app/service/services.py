@@ -1,20 +1,18 @@
 from uuid import UUID
 
-from api.v1.dog.models import DogModel
-from api.v1.order.models import OrderReturnModel
-from api.v1.walker.models import DogWalkerModel
-from typing import Generic, TypeVar
-from database.models import (
-    DogTable,
-    DogWalkerTable,
-    OrderTable,
-)
+from api.v1.dog.models import DogModel, DogReturnModel
+from typing import Any, AsyncIterator, Generic, Type, TypeVar
+from database.models import DogTable
 from database.abstract_database import (
     AbstractDatabase,
 )
+from database.tables import not_found
+from service.bulk import BatchReads, batch_reads, bulk_response, bulk_result, validate_many
+from database.versions import RowVersion
 from models.paginated_params import (
     PaginatedParams,
 )
+from fastapi.exceptions import HTTPException
 from tortoise import Model
 from pydantic import BaseModel
 
@@ -23,14 +21,23 @@ TModel = TypeVar("TModel", bound=BaseModel)
 TTable = TypeVar("TTable", bound=Model)
 
 
-class BaseService(Generic[TModel, TTable]):
+class BaseService(Generic[TModel, TTable]):  # noqa: WPS214
     """
     A base service class that provides standard CRUD operations for a given model and database.
 
     Attributes:
         _database (AbstractDatabase): The database instance used for data operations.
+        table (Type[Model]): The table of the records.
+        table_name (str): The name of the table, a label of the metrics.
+        create_model (Type[BaseModel]): The model new records are validated against.
+        return_model (Type[BaseModel]): The model records are returned as.
     """
 
+    table: Type[Model]
+    table_name: str
+    create_model: Type[BaseModel]
+    return_model: Type[BaseModel]
+
     def __init__(self, database: AbstractDatabase):
         """
         Initializes the BaseService with a specific database instance.
@@ -43,19 +50,32 @@ class BaseService(Generic[TModel, TTable]):
     async def get_all(
         self,
         query_params: PaginatedParams,
-    ) -> dict[str, list[TTable] | int]:
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Retrieve all records with pagination.
 
+        Keyset pagination is used when a cursor is given, offset pagination otherwise.
+
         Args:
-            query_params (PaginatedParams): The pagination parameters (page number and size).
+            query_params (PaginatedParams): The pagination parameters (page number or cursor, and size).
+            filters (dict[str, Any] | None): ORM lookups the records must match.
 
         Returns:
-            Dict[str, List[TTable] | int]: A dictionary containing the paginated results and metadata.
+            dict[str, Any]: A dictionary containing the paginated results and metadata.
         """
+        if query_params.cursor:
+            return await self._database.fetch_data_by_cursor(
+                cursor=query_params.cursor,
+                size=query_params.size,
+                count_mode=query_params.count,
+                filters=filters,
+            )
         return await self._database.fetch_all_data(
             page=query_params.page,
             size=query_params.size,
+            count_mode=query_params.count,
+            filters=filters,
         )
 
     async def get_single(self, row_id: UUID) -> TTable:
@@ -70,6 +90,126 @@ class BaseService(Generic[TModel, TTable]):
         """
         return await self._database.fetch_single_row(row_id=row_id)
 
+    async def get_many(self, row_ids: list[UUID]) -> BatchReads:
+        """
+        Retrieve many records by their unique identifiers with a single query.
+
+        Args:
+            row_ids (list[UUID]): The unique identifiers, duplicates are reported once.
+
+        Returns:
+            BatchReads: Found and missing counters and, for every identifier in request
+            order, the record or the error a single read would have returned.
+        """
+        unique: list[UUID] = list(dict.fromkeys(row_ids))
+        rows: list[dict] = await self._database.fetch_rows(unique)
+        return batch_reads(unique, rows, not_found(self.table))
+
+    def export(
+        self,
+        chunk_size: int,
+        filters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream every matching record in chunks for an export.
+
+        Args:
+            chunk_size (int): The number of records read per statement.
+            filters (dict[str, Any] | None): ORM lookups the records must match.
+
+        Returns:
+            AsyncIterator[list[dict]]: Chunks of plain column values.
+        """
+        lookups: dict[str, Any] = filters or {}
+        return self._database.stream_rows(chunk_size, **lookups)
+
+    async def get_version(self, row_id: UUID) -> RowVersion:
+        """
+        Read the validator of a record without fetching the record.
+
+        Args:
+            row_id (UUID): The unique identifier of the record.
+
+        Returns:
+            RowVersion: The current version of the record.
+        """
+        return await self._database.fetch_row_version(row_id)
+
+    def version_of(self, row: TTable) -> RowVersion:
+        """
+        Compute the validator of a record returned by ``get_single``.
+
+        Args:
+            row (TTable): The record.
+
+        Returns:
+            RowVersion: The version of the record.
+        """
+        return self._database.row_version(row)
+
+    async def get_table_version(self) -> RowVersion:
+        """
+        Read the validator of the table and of the tables joined into its records.
+
+        Returns:
+            RowVersion: The version ``list_version`` builds page versions from.
+        """
+        return await self._database.fetch_table_version()
+
+    async def get_list_version(
+        self,
+        query_params: PaginatedParams,
+        filters: dict[str, Any] | None = None,
+    ) -> RowVersion:
+        """
+        Read the validator of a page of records.
+
+        The page is not read, its records are counted with the same strategy as the
+        page would count them: a cached or approximate count costs no table scan.
+
+        Args:
+            query_params (PaginatedParams): The pagination parameters.
+            filters (dict[str, Any] | None): ORM lookups the records must match.
+
+        Returns:
+            RowVersion: The version of the page.
+        """
+        current: RowVersion = await self.get_table_version()
+        total: int = (await self._database.count_rows(query_params.count, filters)).total
+        return self.list_version(current, total, query_params, filters)
+
+    def list_version(
+        self,
+        table_version: RowVersion,
+        total: int,
+        query_params: PaginatedParams,
+        filters: dict[str, Any] | None = None,
+    ) -> RowVersion:
+        """
+        Build the validator of a page of records.
+
+        The version changes with any write to the table or to the tables joined into
+        its records, with the number of matching records, and with the pagination
+        parameters and filters.
+
+        Args:
+            table_version (RowVersion): The version read by ``get_table_version``.
+            total (int): The number of matching records, e.g. ``total_result`` of the page.
+            query_params (PaginatedParams): The pagination parameters.
+            filters (dict[str, Any] | None): ORM lookups the records must match.
+
+        Returns:
+            RowVersion: The version of the page.
+        """
+        return table_version.derive(
+            total,
+            query_params.page,
+            query_params.size,
+            query_params.cursor,
+            query_params.count,
+            *(part for lookup in sorted((filters or {}).items()) for part in lookup),
+        )
+
     async def create(self, instance: TModel) -> dict[str, UUID]:
         """
         Create a new record in the database.
@@ -83,6 +223,25 @@ class BaseService(Generic[TModel, TTable]):
         instance_id: UUID = await self._database.insert_row(instance)
         return {"id": instance_id}
 
+    async def create_many(self, raw_rows: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Create many records at once, reporting the outcome of every item.
+
+        Items are validated one by one so a single invalid item does not reject the
+        whole batch; the valid ones are inserted together in one transaction.
+
+        Args:
+            raw_rows (list[dict[str, Any]]): Raw data of the records to create.
+
+        Returns:
+            dict[str, Any]: Created and failed counters and a result per item.
+        """
+        valid, outcomes = validate_many(self.create_model, raw_rows)
+        inserted: list[UUID | HTTPException] = await self._insert_many(list(valid.values()))
+        for index, outcome in zip(valid, inserted):
+            outcomes[index] = bulk_result(index, outcome)
+        return bulk_response(outcomes)
+
     async def update(self, row_id: UUID, new_instance: TModel) -> None:
         """
         Update an existing record in the database.
@@ -108,29 +267,26 @@ class BaseService(Generic[TModel, TTable]):
         """
         await self._database.delete_row(row_id=row_id)
 
+    async def _insert_many(self, instances: list[BaseModel]) -> list[UUID | HTTPException]:
+        """
+        Insert the validated instances of a bulk create.
 
-class DogService(BaseService[DogModel, DogTable]):
-    """
-    A service class for managing dog-related operations.
-    Inherits standard CRUD operations from BaseService.
-    """
-
-    pass
-
-
-class DogWalkerService(BaseService[DogWalkerModel, DogWalkerTable]):
-    """
-    A service class for managing dog walker-related operations.
-    Inherits standard CRUD operations from BaseService.
-    """
+        Args:
+            instances (list[BaseModel]): The validated instances.
 
-    pass
+        Returns:
+            list[UUID | HTTPException]: The id of every inserted row or the error that rejected it, in the same order.
+        """
+        return await self._database.insert_rows(instances)
 
 
-class OrderService(BaseService[OrderReturnModel, OrderTable]):
+class DogService(BaseService[DogModel, DogTable]):
     """
-    A service class for managing order-related operations.
+    A service class for managing dog-related operations.
     Inherits standard CRUD operations from BaseService.
     """
 
-    pass
+    table = DogTable
+    table_name = DogTable.Meta.table
+    create_model = DogModel
+    return_model = DogReturnModel
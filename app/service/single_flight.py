@@ -0,0 +1,104 @@
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Hashable, NamedTuple, TypeVar
+
+from core.metrics import SINGLE_FLIGHT_CALLS, SINGLE_FLIGHT_COALESCED
+from database.events import WriteEvent
+
+ResultType = TypeVar("ResultType")
+# Starts the read of a flight.
+Call = Callable[[], Awaitable[ResultType]]
+
+
+class FlightStats(NamedTuple):
+    """
+    Counters of a single-flight group since it was created.
+
+    Attributes:
+        calls (int): Reads that ran their call.
+        coalesced (int): Reads that joined a call already in flight instead.
+        in_flight (int): Calls running now.
+    """
+
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """
+    Concurrent identical reads of this worker share one call and its result.
+
+    The first read of a key starts the call, every read of the same key arriving
+    while it runs awaits the same result, or the same exception. The call runs as
+    its own task, so a client going away does not cancel it for the others. A
+    repository write drops every flight in progress: a read arriving after a write
+    always starts a call of its own and sees it. Orders embed dogs and walkers, so
+    writes to any table drop the flights of all of them.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Task] = {}
+        self._calls: int = 0
+        self._coalesced: int = 0
+
+    @property
+    def stats(self) -> FlightStats:
+        """
+        Call and coalescing counters of the group.
+
+        Returns:
+            FlightStats: The current counters.
+        """
+        return FlightStats(calls=self._calls, coalesced=self._coalesced, in_flight=len(self._flights))
+
+    async def run(self, table: str, read: str, key: Hashable, call: Call[ResultType]) -> ResultType:
+        """
+        Run the call, or join the identical one already in flight.
+
+        Args:
+            table (str): The table read, a label of the metrics.
+            read (str): The kind of read, e.g. ``list`` or ``single``, a label of the metrics.
+            key (Hashable): Everything the result depends on besides ``table`` and ``read``.
+            call (Call[ResultType]): Starts the read.
+
+        Returns:
+            ResultType: The result of the call, shared with the reads that joined it.
+        """
+        flight_key: tuple = (table, read, key)
+        flight: asyncio.Task | None = self._flights.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(call())
+            self._flights[flight_key] = flight
+            flight.add_done_callback(partial(self._land, flight_key))
+            self._calls += 1
+            SINGLE_FLIGHT_CALLS.labels(table, read).inc()
+        else:
+            self._coalesced += 1
+            SINGLE_FLIGHT_COALESCED.labels(table, read).inc()
+        return await asyncio.shield(flight)
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Drop the flights in progress after a repository write.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        self._flights.clear()
+
+    def clear(self) -> None:
+        """
+        Forget the flights in progress, their readers still get their results.
+        """
+        self._flights.clear()
+
+    def _land(self, key: tuple, flight: asyncio.Task) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # Retrieved here, a failed call whose readers all went away is not reported as unhandled.
+            flight.exception()
+
+
+read_flights = SingleFlight()
@@ -0,0 +1,250 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from tortoise import timezone
+
+from core.config import settings
+from database.events import WriteAction, WriteEvent, write_events
+from database.locks import LeaderLock, create_lock
+from database.models import OrderStatus, OrderTable
+from service.availability import SLOT_MINUTES
+
+logger = logging.getLogger(__name__)
+
+ORDERS_TABLE: str = OrderTable.Meta.table
+WALK_DURATION = timedelta(minutes=SLOT_MINUTES)
+MOVED = "Order status transitions: {0} orders moved to {1}"
+LEADING = "Order status scheduler leading, {0} boundaries queued"
+
+# Applied in this order, an order whose walk is over but never started moves through both in one run.
+TRANSITIONS: tuple[tuple[OrderStatus, OrderStatus, timedelta], ...] = (
+    (OrderStatus.planned, OrderStatus.in_progress, timedelta()),
+    (OrderStatus.in_progress, OrderStatus.success, WALK_DURATION),
+)
+
+
+class StatusScheduler:  # noqa: WPS214
+    """
+    Background job moving orders along ``planned -> in_progress -> success``.
+
+    An order starts at ``walk_at`` and ends one slot later. The scheduler keeps a
+    heap of the upcoming start and end boundaries of open orders, sleeps until
+    the earliest one and then applies every due transition with batched bulk
+    ``UPDATE`` statements. Only the worker holding the leader lock runs it, the
+    others retry the lock periodically and take over when the leader goes away.
+
+    Attributes:
+        batch_size (int): Orders moved per ``UPDATE`` statement.
+        horizon (timedelta): How far ahead boundaries are loaded into the heap.
+        max_sleep (float): Longest wait between two runs in seconds, also the lock retry interval.
+    """
+
+    def __init__(self, batch_size: int = 500, horizon: timedelta = timedelta(days=1), max_sleep: float = 60.0):
+        """
+        Args:
+            batch_size (int): Orders moved per ``UPDATE`` statement.
+            horizon (timedelta): How far ahead boundaries are loaded into the heap.
+            max_sleep (float): Longest wait between two runs in seconds.
+        """
+        self.batch_size = batch_size
+        self.horizon = horizon
+        self.max_sleep = max_sleep
+        self._boundaries: list[datetime] = []
+        self._queued: set[datetime] = set()
+        self._loaded_until: datetime | None = None
+        self._lock: LeaderLock | None = None
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event = asyncio.Event()
+
+    @property
+    def is_leader(self) -> bool:
+        """
+        Whether this worker currently runs the transitions.
+
+        Returns:
+            bool: True while the scheduler is started and holds the leader lock.
+        """
+        return self._task is not None and self._loaded_until is not None
+
+    async def start(self, lock: LeaderLock) -> None:
+        """
+        Start competing for the leader lock and run the transitions once elected.
+
+        Args:
+            lock (LeaderLock): The lock shared by the workers of the deployment.
+        """
+        if self._task is not None:
+            return
+        self._lock = lock
+        self._wakeup = asyncio.Event()
+        write_events.subscribe(self.on_write)
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the job and give the leader lock up.
+        """
+        write_events.unsubscribe(self.on_write)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock is not None:
+            await self._lock.release()
+            self._lock = None
+        self._boundaries = []
+        self._queued = set()
+        self._loaded_until = None
+
+    def on_write(self, event: WriteEvent) -> None:
+        """
+        Queue the boundaries of a new order so the scheduler wakes up for it.
+
+        Args:
+            event (WriteEvent): The committed write.
+        """
+        walk_at: datetime | None = event.columns.get("walk_at")
+        if event.table != ORDERS_TABLE or event.action != WriteAction.insert or walk_at is None:
+            return
+        if timezone.is_naive(walk_at):
+            walk_at = timezone.make_aware(walk_at)
+        if self._push(walk_at) | self._push(walk_at + WALK_DURATION):
+            self._wakeup.set()
+
+    async def run_due(self, now: datetime | None = None) -> dict[OrderStatus, int]:
+        """
+        Apply every transition that is due.
+
+        Args:
+            now (datetime | None): The current time, ``timezone.now()`` if omitted.
+
+        Returns:
+            dict[OrderStatus, int]: Number of orders moved into each status.
+        """
+        now = now or timezone.now()
+        moved: dict[OrderStatus, int] = {}
+        for source, target, delay in TRANSITIONS:
+            moved[target] = await self._transition(source, target, now - delay)
+            if moved[target]:
+                logger.info(MOVED.format(moved[target], target.name))
+        return moved
+
+    async def _transition(self, source: OrderStatus, target: OrderStatus, walk_before: datetime) -> int:
+        moved: int = 0
+        while True:
+            updated_at: datetime = timezone.now()
+            selected: list[Any] = await self._select_batch(source, walk_before)
+            order_ids: list[Any] = await self._move_batch(selected, source, target, updated_at)
+            for order_id in order_ids:
+                write_events.publish(
+                    WriteEvent(ORDERS_TABLE, WriteAction.update, order_id, {"status": target, "updated": updated_at}),
+                )
+            moved += len(order_ids)
+            # A batch with orders changed since the SELECT moves fewer, only a short SELECT means none are left.
+            if len(selected) < self.batch_size:
+                return moved
+
+    async def _select_batch(self, source: OrderStatus, walk_before: datetime) -> list[Any]:
+        return await OrderTable.filter(
+            status=source,
+            walk_at__lte=walk_before,
+        ).limit(self.batch_size).values_list("id", flat=True)
+
+    async def _move_batch(
+        self,
+        selected: list[Any],
+        source: OrderStatus,
+        target: OrderStatus,
+        updated_at: datetime,
+    ) -> list[Any]:
+        if not selected:
+            return selected
+        # The status is checked again, an order changed since the SELECT is left alone.
+        batch = OrderTable.filter(id__in=selected)
+        moved: int = await batch.filter(status=source).update(status=target, updated=updated_at)
+        if moved == len(selected):
+            return selected
+        # Only the orders this UPDATE moved get an event, the writer of the others published its own.
+        return await batch.filter(updated=updated_at).values_list("id", flat=True)
+
+    async def _load(self, now: datetime) -> None:
+        until: datetime = now + self.horizon
+        walks: list[Any] = await OrderTable.filter(
+            status__in=[source for source, _, _ in TRANSITIONS],
+            walk_at__gt=now - WALK_DURATION,
+            walk_at__lte=until,
+        ).distinct().values_list("walk_at", flat=True)
+        self._boundaries = []
+        self._queued = set()
+        self._loaded_until = until
+        for walk_at in walks:
+            self._push(walk_at)
+            self._push(walk_at + WALK_DURATION)
+
+    def _push(self, boundary: datetime) -> bool:
+        if self._loaded_until is None or boundary > self._loaded_until or boundary in self._queued:
+            return False
+        heapq.heappush(self._boundaries, boundary)
+        self._queued.add(boundary)
+        return True
+
+    def _pop_due(self, now: datetime) -> None:
+        while self._boundaries and self._boundaries[0] <= now:
+            self._queued.discard(heapq.heappop(self._boundaries))
+
+    async def _run_forever(self) -> None:
+        while True:
+            # Cleared before the run, a boundary queued meanwhile wakes the next wait at once.
+            self._wakeup.clear()
+            try:
+                delay: float = await self._step()
+            except Exception:
+                logger.exception("Order status transitions failed")
+                delay = self.max_sleep
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _step(self) -> float:
+        if self._lock is None or not await self._lock.try_acquire():
+            self._loaded_until = None
+            return self.max_sleep
+        now: datetime = timezone.now()
+        if self._loaded_until is None or self._loaded_until <= now:
+            await self._load(now)
+            logger.info(LEADING.format(len(self._boundaries)))
+        await self.run_due(now)
+        self._pop_due(now)
+        if not self._boundaries:
+            return self.max_sleep
+        wait: timedelta = self._boundaries[0] - timezone.now()
+        return min(self.max_sleep, max(wait.total_seconds(), 0))
+
+
+status_scheduler = StatusScheduler(
+    batch_size=settings.transitions.batch_size,
+    horizon=timedelta(hours=settings.transitions.horizon_hours),
+    max_sleep=settings.transitions.max_sleep,
+)
+
+
+async def start_status_scheduler() -> None:
+    """
+    Start the status scheduler with the leader lock of the configured database.
+
+    Without a lock shared by the workers each of them would elect itself and move
+    every order once per worker, the scheduler is then left stopped.
+    """
+    transitions = settings.transitions
+    lock: LeaderLock | None = create_lock(settings.db.postgres_dsn, transitions.lock_key, transitions.single_process)
+    if lock is None:
+        logger.warning("Order status transitions disabled: no lock shared by the workers of this database")
+        return
+    await status_scheduler.start(lock)
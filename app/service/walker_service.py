@@ -0,0 +1,54 @@
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from api.v1.walker.models import DogWalkerModel, DogWalkerReturnModel
+from database.models import DogWalkerTable
+from service.availability import availability_index
+from service.schedule import walker_schedules
+from service.services import BaseService
+
+
+class DogWalkerService(BaseService[DogWalkerModel, DogWalkerTable]):
+    """
+    A service class for managing dog walker-related operations.
+    Inherits standard CRUD operations from BaseService.
+    """
+
+    table = DogWalkerTable
+    table_name = DogWalkerTable.Meta.table
+    create_model = DogWalkerModel
+    return_model = DogWalkerReturnModel
+
+    async def get_available(self, walk_at: datetime) -> list[dict]:
+        """
+        Retrieve active dog walkers without an order in the given slot.
+
+        Free walkers are found in the in-memory availability index, only their
+        rows are read from the database.
+
+        Args:
+            walk_at (datetime): The walk start, validated against the half-hour grid.
+
+        Returns:
+            list[dict]: The free dog walkers.
+        """
+        await availability_index.ensure_loaded()
+        return await self._database.fetch_rows(availability_index.free_walkers(walk_at))
+
+    async def get_schedule(self, walker_id: UUID, day: date) -> dict[str, Any]:
+        """
+        Retrieve the slots of a dog walker for one day with the order and dog of each.
+
+        Args:
+            walker_id (UUID): The unique identifier of the dog walker.
+            day (date): The day.
+
+        Returns:
+            dict[str, Any]: The day schedule, served from the schedule cache when possible.
+
+        Raises:
+            HTTPException: If the dog walker does not exist.
+        """
+        await self._database.fetch_single_row(walker_id)
+        return await walker_schedules.get(walker_id, day)
@@ -11,7 +11,10 @@ basic_response = {
     "size": 10,
     "total_pages": 0,
     "total_result": 0,
+    "count_mode": "exact",
     "result": [],
+    "next_cursor": None,
+    "prev_cursor": None,
 }
 fake_incorrect_dog_data = {
     "1": {
@@ -12,7 +12,10 @@ basic_response = {
     "size": 10,
     "total_pages": 0,
     "total_result": 0,
+    "count_mode": "exact",
     "result": [],
+    "next_cursor": None,
+    "prev_cursor": None,
 }
 fake_incorrect_order_data: dict = {
     "1": {
@@ -10,7 +10,10 @@ basic_response = {
     "size": 10,
     "total_pages": 0,
     "total_result": 0,
+    "count_mode": "exact",
     "result": [],
+    "next_cursor": None,
+    "prev_cursor": None,
 }
 fake_incorrect_walker_data = {
     "1": {
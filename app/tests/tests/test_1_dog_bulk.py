@@ -0,0 +1,33 @@
+import pytest
+from fastapi import status
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_incorrect_dog_data
+
+BULK_DOGS: tuple = (
+    {"apartment": 101, "name": "Bulk", "breed": "Beagle"},
+    fake_incorrect_dog_data["1"],
+    {"apartment": 102, "name": "Bulk", "breed": "Pug"},
+)
+
+
+async def assert_stored(client, dog_id: str, sent: dict) -> None:
+    response = await client.get(f"{test_settings.dogs_url}{dog_id}/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json().items() >= sent.items()
+
+
+@pytest.mark.asyncio
+async def test_create_dogs_bulk(client):
+    response = await client.post(
+        f"{test_settings.dogs_url}bulk/",
+        json=list(BULK_DOGS),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    created: list = body["result"][::2]
+    assert (body["created"], body["failed"]) == (2, 1)
+    rejected: dict = body["result"][1]
+    assert rejected["status"] == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert rejected["detail"][0]["loc"] == ["apartment"]
+    await assert_stored(client, created[0]["id"], BULK_DOGS[0])
+    await assert_stored(client, created[1]["id"], BULK_DOGS[2])
@@ -0,0 +1,35 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from database.bus import InvalidationBus
+from database.events import WriteAction, WriteEvent, WriteEvents
+from database.transports import LoopbackTransport, PostgresTransport, Reconnect
+from tests.test_data.test_data_dog import fake_dog_data
+
+SHORT_WAIT = 0.01
+
+
+@pytest.mark.asyncio
+async def test_bus_starts_without_database(monkeypatch):
+    monkeypatch.setattr("database.transports.asyncpg.connect", AsyncMock(side_effect=ConnectionRefusedError))
+    transport = PostgresTransport("asyncpg://app@localhost/app", "test", Reconnect(connect_timeout=SHORT_WAIT))
+
+    # Startup goes on while the connection is retried in the background.
+    await asyncio.wait_for(transport.start(lambda _: None), timeout=1)
+    await asyncio.wait_for(transport.stop(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_bus_stop_drops_unsent_writes():
+    blocked_events = WriteEvents()
+    bus = InvalidationBus(blocked_events)
+    transport = LoopbackTransport("blocked")
+    transport.send = AsyncMock(side_effect=asyncio.Event().wait)  # type: ignore[method-assign]
+    await bus.start(transport)
+    dog_id = UUID(fake_dog_data[0]["id"])
+    blocked_events.publish(WriteEvent("dogs", WriteAction.delete, dog_id, {}))
+
+    await asyncio.wait_for(bus.stop(timeout=SHORT_WAIT), timeout=1)
+    assert not bus.is_running
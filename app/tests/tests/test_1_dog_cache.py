@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import UUID
+
+import pytest
+from tortoise import timezone
+from core.config import test_settings
+from database.bus import InvalidationBus, invalidation_bus
+from database.events import WriteAction, WriteEvent, WriteEvents, write_events
+from database.transports import LoopbackTransport
+from service.registry import registry
+from tests.test_data.test_data_dog import fake_dog_data
+
+
+class Received:
+    """Listener keeping the write events published in this worker while subscribed"""
+
+    def __init__(self) -> None:
+        self.events: list[WriteEvent] = []
+        self.delivered = asyncio.Event()
+
+    def __call__(self, event: WriteEvent) -> None:
+        self.events.append(event)
+        self.delivered.set()
+
+    def __enter__(self) -> "Received":
+        write_events.subscribe(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        write_events.unsubscribe(self)
+
+
+@asynccontextmanager
+async def other_worker() -> AsyncIterator[WriteEvents]:
+    """Join this worker and a second one by a loopback channel, yield the write events of the second one"""
+    other_worker_events = WriteEvents()
+    other_bus = InvalidationBus(other_worker_events)
+    await invalidation_bus.start(LoopbackTransport("test"))
+    await other_bus.start(LoopbackTransport("test"))
+    try:
+        yield other_worker_events
+    finally:
+        await other_bus.stop()
+        await invalidation_bus.stop()
+
+
+async def publish_remotely(event: WriteEvent) -> WriteEvent:
+    async with other_worker() as other_worker_events:
+        with Received() as received:
+            other_worker_events.publish(event)
+            await asyncio.wait_for(received.delivered.wait(), timeout=1)
+            return received.events[0]
+
+
+async def assert_cached(client, query_budget, dog_url: str) -> None:
+    await client.get(dog_url)
+    with query_budget(statements=0):
+        await client.get(dog_url)
+
+
+@pytest.mark.asyncio
+async def test_remote_write_invalidates_cache(
+    client,
+    query_budget,
+):
+    dog_id: str = fake_dog_data[0]["id"]
+    dog_url: str = f"{test_settings.dogs_url}{dog_id}/"
+    await assert_cached(client, query_budget, dog_url)
+
+    columns: dict = {"name": "Remote", "updated": timezone.now()}
+    remote: WriteEvent = await publish_remotely(WriteEvent("dogs", WriteAction.update, UUID(dog_id), columns))
+    assert remote.remote
+    assert remote.row_id == UUID(dog_id)
+    assert remote.columns["updated"].tzinfo is not None
+
+    with query_budget(statements=1) as stats:
+        await client.get(dog_url)
+        assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_resync_drops_cached_rows(
+    client,
+    query_budget,
+):
+    dog_id: str = fake_dog_data[0]["id"]
+    dog_url: str = f"{test_settings.dogs_url}{dog_id}/"
+    await assert_cached(client, query_budget, dog_url)
+
+    # What the invalidation bus calls once it reconnected.
+    registry.flush()
+    with query_budget(statements=1) as stats:
+        await client.get(dog_url)
+        assert stats.statements == 1
@@ -0,0 +1,89 @@
+import pytest
+from fastapi import status
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+
+# Columns a dog is written with.
+DOG_FIELDS = ("apartment", "name", "breed")
+DOG_URL = "{0}{1}/"
+ETAG = "etag"
+IF_NONE_MATCH = "If-None-Match"
+
+
+def _row_ids(body: dict) -> list[str]:
+    return [row["id"] for row in body["result"]]
+
+
+async def _page(client, **query) -> dict:
+    response = await client.get(test_settings.dogs_url, params=query)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_get_dogs_by_cursor(client):
+    body: dict = await _page(client, size=1)
+    by_offset: list = _row_ids(body)
+    while body["next_cursor"]:
+        body = await _page(client, size=1, cursor=body["next_cursor"])
+        assert body["page_number"] is None
+        by_offset.extend(_row_ids(body))
+    assert len(by_offset) == body["total_result"]
+    previous: dict = await _page(client, size=1, cursor=body["prev_cursor"])
+    assert _row_ids(previous) == by_offset[-2:-1]
+
+    assert _row_ids(await _page(client)) == by_offset
+
+
+@pytest.mark.asyncio
+async def test_get_dogs_invalid_cursor(client):
+    response = await client.get(test_settings.dogs_url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_dog(
+    client,
+    query_budget,
+):
+    dog_url: str = DOG_URL.format(test_settings.dogs_url, fake_dog_data[1]["id"])
+    response = await client.get(dog_url)
+    etag: str = response.headers[ETAG]
+    last_modified: str = response.headers["last-modified"]
+
+    # Only the validator is read, never the row.
+    with query_budget(statements=1) as stats:
+        response = await client.get(dog_url, headers={IF_NONE_MATCH: etag})
+        assert all('"name"' not in shape for shape in stats.shapes)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers[ETAG] == etag
+    response = await client.get(dog_url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_updated_dog(client):
+    dog_url: str = DOG_URL.format(test_settings.dogs_url, fake_dog_data[1]["id"])
+    response = await client.get(dog_url)
+    etag: str = response.headers[ETAG]
+    unchanged: dict = {key: response.json()[key] for key in DOG_FIELDS}
+
+    await client.put(dog_url, json=unchanged)
+    response = await client.get(dog_url, headers={IF_NONE_MATCH: etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[ETAG] != etag
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_dogs(client):
+    response = await client.get(test_settings.dogs_url)
+    etag: str = response.headers[ETAG]
+    response = await client.get(test_settings.dogs_url, headers={IF_NONE_MATCH: etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    response = await client.get(
+        test_settings.dogs_url,
+        params={"size": 1},
+        headers={IF_NONE_MATCH: etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
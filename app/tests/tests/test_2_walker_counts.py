@@ -0,0 +1,89 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from database.events import WriteAction, WriteEvent, write_events
+
+CACHED = "cached"
+EXACT = "exact"
+ETAG = "etag"
+IF_NONE_MATCH = "If-None-Match"
+
+
+async def _counted(client, count: str) -> tuple[str, int]:
+    response = await client.get(test_settings.walkers_url, params={"count": count})
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    return body["count_mode"], body["total_result"]
+
+
+async def _walker_url(client, surname: str) -> str:
+    response = await client.post(test_settings.walkers_url, json={"name": "List", "surname": surname})
+    walker_id: str = response.json()["id"]
+    return f"{test_settings.walkers_url}{walker_id}/"
+
+
+@pytest.mark.asyncio
+async def test_get_walkers_count_modes(client):
+    _, total = await _counted(client, CACHED)
+    assert await _counted(client, CACHED) == (CACHED, total)
+
+    await client.post(
+        test_settings.walkers_url,
+        json={"name": "Count", "surname": "Invalidation", "active": False},
+    )
+    assert await _counted(client, CACHED) == (EXACT, total + 1)
+
+
+@pytest.mark.asyncio
+async def test_get_walkers_cached_count_remote_write(client):
+    await _counted(client, CACHED)
+    count_mode, _ = await _counted(client, CACHED)
+    assert count_mode == CACHED
+
+    # An insert made by another worker, relayed by the invalidation bus.
+    write_events.publish(WriteEvent("dog_walkers", WriteAction.insert, uuid4(), {}, remote=True))
+    count_mode, _ = await _counted(client, CACHED)
+    assert count_mode == EXACT
+
+
+@pytest.mark.asyncio
+async def test_walkers_list_validator_counts_once(client, query_budget):
+    query_data: dict = {"count": CACHED}
+    await client.get(test_settings.walkers_url, params=query_data)
+    # The latest update and the page, the cached count serves both the page and the validator.
+    with query_budget(statements=2):
+        response = await client.get(test_settings.walkers_url, params=query_data)
+    etag: str = response.headers[ETAG]
+    with query_budget(statements=1):
+        response = await client.get(
+            test_settings.walkers_url,
+            params=query_data,
+            headers={IF_NONE_MATCH: etag},
+        )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_walkers_list_validator_counts_deletes(client):
+    query_data: dict = {"count": CACHED}
+    deleted_url, latest_url = [await _walker_url(client, surname) for surname in ("Deleted", "Latest")]
+    etag: str = (await client.get(test_settings.walkers_url, params=query_data)).headers[ETAG]
+    # The latest update stays the same, only the count tells the delete apart.
+    await client.delete(deleted_url)
+    response = await client.get(
+        test_settings.walkers_url,
+        params=query_data,
+        headers={IF_NONE_MATCH: etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    await client.delete(latest_url)
+
+
+@pytest.mark.asyncio
+async def test_get_walkers_approximate_count(client):
+    _, total = await _counted(client, EXACT)
+    # Only Postgres keeps the planner statistics estimates are read from, elsewhere the count stays exact.
+    assert await _counted(client, "approximate") == (EXACT, total)
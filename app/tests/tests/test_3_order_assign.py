@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import status
+from fastapi.exceptions import HTTPException
+
+from core.config import test_settings
+from service.assignment import WalkerAssigner
+from service.availability import availability_index
+
+WALK_AT = "2038-04-04 12:00"
+NEXT_WALK_AT = "2038-04-04 12:30"
+NO_WALKER = "No dog walker is available at this time"
+
+
+def _ids(rows: list) -> list:
+    return [row["id"] for row in rows]
+
+
+async def _free_walkers(client, walk_at: str) -> set:
+    response = await client.get(
+        f"{test_settings.walkers_url}available/",
+        params={"walk_at": walk_at},
+    )
+    return set(_ids(response.json()))
+
+
+async def _dog_ids(client, count: int) -> list:
+    response = await client.post(
+        f"{test_settings.dogs_url}bulk/",
+        json=[{"apartment": num, "name": "Assigned", "breed": "Any"} for num in range(count)],
+    )
+    return _ids(response.json()["result"])
+
+
+def _unassigned(dog_id: str, walk_at: str) -> dict:
+    return {"dog": dog_id, "status": "Запланирована", "walk_at": walk_at}
+
+
+@pytest.mark.asyncio
+async def test_create_orders_with_assigned_walker(client):
+    free: set = await _free_walkers(client, WALK_AT)
+    assert free
+    dog_ids: list = await _dog_ids(client, len(free) + 1)
+
+    responses = await asyncio.gather(
+        *(client.post(test_settings.orders_url, json=_unassigned(dog_id, WALK_AT)) for dog_id in dog_ids),
+    )
+    created: list = [resp.json() for resp in responses if resp.status_code == status.HTTP_201_CREATED]
+    conflicts: list = [resp.json() for resp in responses if resp.status_code == status.HTTP_409_CONFLICT]
+    assert free == {order["walker"] for order in created}
+    assert [conflict["detail"] for conflict in conflicts] == [NO_WALKER]
+
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk_with_assigned_walkers(client):
+    dog_ids: list = await _dog_ids(client, 2)
+    response = await client.post(
+        f"{test_settings.orders_url}bulk/",
+        json=[_unassigned(dog_id, NEXT_WALK_AT) for dog_id in dog_ids],
+    )
+    body: dict = response.json()
+    assert body["created"] == 2
+    walkers: set = set()
+    for order_id in _ids(body["result"]):
+        response = await client.get(f"{test_settings.orders_url}{order_id}/")
+        walkers.add(
+            response.json()["walker"]["id"],
+        )
+    assert len(walkers) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_assignment_holds_slot_lock():
+    assigner = WalkerAssigner(availability_index)
+    walk_at = datetime.fromisoformat("2038-04-05 12:00")
+    insert = AsyncMock(side_effect=HTTPException(status_code=status.HTTP_409_CONFLICT, detail="taken"))
+    async with assigner.reserve([walk_at, walk_at]):
+        single = asyncio.ensure_future(assigner.assign(walk_at, insert))
+        await asyncio.sleep(0)
+        # A single order for the slot waits until the bulk create is done.
+        assert not insert.await_count
+    with pytest.raises(HTTPException):
+        await single
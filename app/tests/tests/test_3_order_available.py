@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from service.availability import availability_index, slot_of
+from tests.test_data.test_data_dog import fake_dog_data
+
+WALK_AT = "2037-03-03 10:30"
+LATER_WALK_AT = "2037-03-03 11:00"
+RELEASED_WALK_AT = "2037-03-03 12:00"
+DAY_CHANGE_WALK_AT = "2037-05-05 09:00"
+AVAILABLE_URL = f"{test_settings.walkers_url}available/"
+FREE_WALKER = MappingProxyType({"name": "Free", "surname": "Walker", "active": True})
+
+
+async def _available(client, walk_at: str) -> set:
+    response = await client.get(AVAILABLE_URL, params={"walk_at": walk_at})
+    assert response.status_code == status.HTTP_200_OK
+    return {walker["id"] for walker in response.json()}
+
+
+async def _create(client, url: str, row: dict) -> str:
+    response = await client.post(url, json=row)
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+def _booking(walker_id: str, walk_at: str) -> dict:
+    return {
+        "dog": fake_dog_data[0]["id"],
+        "walker": walker_id,
+        "status": "Запланирована",
+        "walk_at": walk_at,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_available_walkers(
+    client,
+    query_budget,
+):
+    # The first call loads the index, as lifespan does at startup.
+    await _available(client, WALK_AT)
+    busy, free, inactive = [
+        await _create(client, test_settings.walkers_url, {**FREE_WALKER, "active": active})
+        for active in (True, True, False)
+    ]
+    await _create(client, test_settings.orders_url, _booking(busy, WALK_AT))
+
+    with query_budget(statements=1) as stats:
+        available: set = await _available(client, WALK_AT)
+        assert all("orders" not in shape for shape in stats.shapes)
+    assert available.isdisjoint({busy, inactive})
+    assert free in available
+    assert busy in await _available(client, LATER_WALK_AT)
+
+
+@pytest.mark.asyncio
+async def test_available_walkers_after_writes(client):
+    released, deactivated = [
+        await _create(client, test_settings.walkers_url, dict(FREE_WALKER))
+        for _ in range(2)
+    ]
+    order_id: str = await _create(client, test_settings.orders_url, _booking(released, RELEASED_WALK_AT))
+
+    await client.delete(f"{test_settings.orders_url}{order_id}/")
+    await client.put(
+        f"{test_settings.walkers_url}{deactivated}/",
+        json={**FREE_WALKER, "active": False},
+    )
+    available: set = await _available(client, RELEASED_WALK_AT)
+    assert released in available
+    assert deactivated not in available
+
+
+@pytest.mark.asyncio
+async def test_available_walkers_invalid_time(client):
+    response = await client.get(AVAILABLE_URL, params={"walk_at": "2037-03-03 10:15"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["msg"] == "Value error, Minutes should be 30 or 00"
+
+
+@pytest.mark.asyncio
+async def test_available_walkers_after_day_change(client):
+    walker_id: str = await _create(client, test_settings.walkers_url, dict(FREE_WALKER))
+    await _create(client, test_settings.orders_url, _booking(walker_id, DAY_CHANGE_WALK_AT))
+    walker = uuid.UUID(walker_id)
+    day, _ = slot_of(datetime.fromisoformat(DAY_CHANGE_WALK_AT))
+    assert availability_index.busy_slots(walker, day)
+
+    # Days before the new date are dropped, later ones are kept.
+    availability_index.refresh(day + timedelta(days=1))
+    assert availability_index.busy_slots(walker, day) == 0
+    availability_index.refresh(day)
+    assert availability_index.busy_slots(walker, day) == 0
+
+    await availability_index.load()
+    assert availability_index.busy_slots(walker, day)
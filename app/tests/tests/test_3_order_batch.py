@@ -0,0 +1,96 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_order import fake_order_data
+
+BATCH_URL = f"{test_settings.orders_url}batch/"
+IDS = "ids"
+ROWS = "result"
+# Most ids a batch read accepts.
+MAX_IDS = 1000
+
+
+def _order_ids() -> list[str]:
+    return [str(order["id"]) for order in fake_order_data]
+
+
+async def _batch(client, *ids: str):
+    return await client.get(BATCH_URL, params={IDS: ",".join(ids)})
+
+
+@pytest.mark.asyncio
+async def test_get_orders_batch(
+    client,
+    query_budget,
+):
+    order_ids: list[str] = _order_ids()
+    missing: str = str(uuid4())
+    # One SELECT ... WHERE id IN (...) joining dogs and walkers, whatever the number of ids.
+    with query_budget(statements=1):
+        response = await _batch(client, *order_ids, missing, order_ids[0])
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    rows: dict = body[ROWS]
+    assert (body["found"], body["missing"]) == (len(order_ids), 1)
+    assert list(rows) == [*order_ids, missing]
+    assert rows[missing] == {
+        "status": status.HTTP_404_NOT_FOUND,
+        "row": None,
+        "detail": "Order with such id does not exist",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_orders_batch_rows(client):
+    order_ids: list[str] = _order_ids()
+    response = await _batch(client, *order_ids)
+    rows: dict = response.json()[ROWS]
+    for order_id in order_ids:
+        response = await client.get(f"{test_settings.orders_url}{order_id}/")
+        assert rows[order_id] == {
+            "status": status.HTTP_200_OK,
+            "row": response.json(),
+            "detail": None,
+        }
+
+
+@pytest.mark.asyncio
+async def test_post_orders_batch(client):
+    order_ids: list[str] = _order_ids()
+    missing: str = str(uuid4())
+    response = await _batch(client, *order_ids, missing, order_ids[0])
+    body: dict = response.json()
+    response = await client.post(BATCH_URL, json={IDS: [*order_ids, missing]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == body
+
+    response = await client.get(
+        BATCH_URL,
+        params=[(IDS, order_ids[0]), (IDS, missing)],
+    )
+    assert list(response.json()[ROWS]) == [order_ids[0], missing]
+
+
+@pytest.mark.asyncio
+async def test_orders_batch_invalid_ids(client):
+    response = await _batch(client, "not-a-uuid")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    missing: str = str(uuid4())
+    too_many: list = [missing for _ in range(MAX_IDS + 1)]
+    response = await client.post(BATCH_URL, json={IDS: too_many})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_get_dogs_batch(client):
+    dog_id: str = fake_dog_data[0]["id"]
+    response = await client.get(
+        f"{test_settings.dogs_url}batch/",
+        params={IDS: dog_id},
+    )
+    row: dict = response.json()[ROWS][dog_id]["row"]
+    assert row["id"] == dog_id
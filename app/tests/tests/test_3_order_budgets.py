@@ -0,0 +1,85 @@
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+WALK_DAY = "2038-05-05"
+WALK_AT = "2038-05-05 10:00"
+BULK_WALK_AT = "2038-05-06 1{0}:00"
+BULK_ORDERS = 5
+ROW_URL = "{0}{1}/"
+# The list validator with its counts of dogs and walkers, the count of orders and one SELECT
+# joining dogs and walkers, whatever the page size.
+LIST_STATEMENTS = 5
+
+
+def _row_url(url: str, row: dict) -> str:
+    return ROW_URL.format(url, row["id"])
+
+
+def _new_order(walk_at: str) -> dict:
+    return {
+        "dog": fake_dog_data[0]["id"],
+        "walker": fake_walker_data[0]["id"],
+        "status": "Запланирована",
+        "walk_at": walk_at,
+    }
+
+
+@pytest.mark.asyncio
+async def test_order_list_query_budget(
+    client,
+    query_budget,
+):
+    with query_budget(statements=LIST_STATEMENTS):
+        response = await client.get(test_settings.orders_url, params={"size": 100, "count": "exact"})
+    server_timing: str = response.headers["server-timing"]
+    assert server_timing.startswith("db;dur=")
+    assert f'desc="{LIST_STATEMENTS} statements, 0 repeated"' in server_timing
+
+
+@pytest.mark.asyncio
+async def test_order_write_query_budgets(
+    client,
+    query_budget,
+):
+    with query_budget(statements=1):
+        response = await client.post(test_settings.orders_url, json=_new_order(WALK_AT))
+    assert response.status_code == status.HTTP_201_CREATED
+    order_url: str = _row_url(test_settings.orders_url, response.json())
+    with query_budget(statements=1):
+        assert (await client.get(order_url)).status_code == status.HTTP_200_OK
+    with query_budget(statements=1):
+        response = await client.put(order_url, json={**_new_order(WALK_AT), "status": "Отменена"})
+    assert response.status_code == status.HTTP_200_OK
+    with query_budget(statements=1):
+        assert (await client.delete(order_url)).status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_walker_schedule_query_budget(
+    client,
+    query_budget,
+):
+    schedule_url: str = "{0}schedule/".format(_row_url(test_settings.walkers_url, fake_walker_data[0]))
+    with query_budget(statements=2):
+        response = await client.get(schedule_url, params={"date": WALK_DAY})
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_bulk_order_query_budgets(
+    client,
+    query_budget,
+):
+    orders: list = [_new_order(BULK_WALK_AT.format(hour)) for hour in range(BULK_ORDERS)]
+    with query_budget(statements=4):
+        response = await client.post(f"{test_settings.orders_url}bulk/", json=orders)
+    body: dict = response.json()
+    assert body["created"] == BULK_ORDERS
+    for row in body["result"]:
+        with query_budget(statements=1):
+            response = await client.delete(_row_url(test_settings.orders_url, row))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -0,0 +1,91 @@
+import uuid
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_order import fake_order_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+BULK_URL = f"{test_settings.orders_url}bulk/"
+ID = "id"
+ROWS = "result"
+WALK_AT = "2035-05-01 10:00"
+
+
+def _planned(walk_at: str, dog_id: str | None = None) -> dict:
+    return {
+        "dog": dog_id or fake_dog_data[1][ID],
+        "walker": fake_walker_data[1][ID],
+        "status": "Запланирована",
+        "walk_at": walk_at,
+    }
+
+
+def _inserts(stats) -> int:
+    shapes: dict = stats.shapes
+    return sum(
+        count for shape, count in shapes.items() if shape.startswith("INSERT")
+    )
+
+
+def _statuses(rows: list) -> list:
+    return [row["status"] for row in rows]
+
+
+async def _assert_stored(client, order_id: str) -> None:
+    response = await client.get(f"{test_settings.orders_url}{order_id}/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["dog"][ID] == fake_dog_data[1][ID]
+
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk(
+    client,
+    query_budget,
+):
+    # No statement repeated per order.
+    with query_budget() as stats:
+        response = await client.post(
+            BULK_URL,
+            json=[
+                _planned(WALK_AT),
+                _planned("2035-05-01 10:30"),
+                _planned("2035-05-01 05:00"),
+                _planned("2035-05-01 11:00", dog_id=str(uuid.uuid4())),
+                _planned(WALK_AT),
+            ],
+        )
+        # One INSERT for the whole batch.
+        assert _inserts(stats) == 1
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    rows: list = body[ROWS]
+    assert (body["created"], body["failed"]) == (2, 3)
+    assert _statuses(rows) == [
+        status.HTTP_201_CREATED,
+        status.HTTP_201_CREATED,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        status.HTTP_404_NOT_FOUND,
+        status.HTTP_409_CONFLICT,
+    ]
+    assert rows[3]["detail"] == "Dog with such id does not exist"
+    for row in rows[:2]:
+        await _assert_stored(client, row[ID])
+
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk_existing_order(client):
+    response = await client.get(
+        "{0}{1}/".format(test_settings.orders_url, fake_order_data[0][ID]),
+    )
+    order: dict = response.json()
+    response = await client.post(
+        BULK_URL,
+        json=[_planned(order["walk_at"], dog_id=order["dog"][ID])],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    rows: list = response.json()[ROWS]
+    assert _statuses(rows) == [status.HTTP_409_CONFLICT]
+    assert rows[0]["detail"] == "Dog already has an order at this time"
@@ -0,0 +1,76 @@
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+BULK_URL = f"{test_settings.orders_url}bulk/"
+BUSY_SLOTS = "database.order_checks._busy_slots"
+ID = "id"
+ROWS = "result"
+# Taken by ``test_create_orders_bulk``.
+WALK_AT = "2035-05-01 10:00"
+
+
+def _planned(walk_at: str) -> dict:
+    return {
+        "dog": fake_dog_data[1][ID],
+        "walker": fake_walker_data[1][ID],
+        "status": "Запланирована",
+        "walk_at": walk_at,
+    }
+
+
+def _statuses(rows: list) -> list:
+    return [row["status"] for row in rows]
+
+
+async def _assert_stored(client, order_id: str) -> None:
+    response = await client.get(f"{test_settings.orders_url}{order_id}/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["dog"][ID] == fake_dog_data[1][ID]
+
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk_concurrent_write(
+    client,
+    monkeypatch,
+):
+    # The slot is free when checked and taken by the time the batch is inserted.
+    monkeypatch.setattr(BUSY_SLOTS, AsyncMock(return_value=set()))
+    response = await client.post(
+        BULK_URL,
+        json=[_planned(WALK_AT), _planned("2035-05-01 12:00")],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    rows: list = response.json()[ROWS]
+    assert _statuses(rows) == [status.HTTP_409_CONFLICT, status.HTTP_201_CREATED]
+    await _assert_stored(client, rows[1][ID])
+
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk_copy_conflict(
+    client,
+    monkeypatch,
+):
+    orders: list = [_planned("2036-05-01 10:00"), _planned("2036-05-01 12:00")]
+    response = await client.post(test_settings.orders_url, json=orders[0])
+    assert response.status_code == status.HTTP_201_CREATED
+    # A Postgres transaction whose COPY hits the order taken after the checks.
+    monkeypatch.setattr(BUSY_SLOTS, AsyncMock(return_value=set()))
+    copy = AsyncMock(side_effect=asyncpg.UniqueViolationError("duplicate"))
+    connection = MagicMock(
+        capabilities=MagicMock(dialect="postgres"),
+        _connection=MagicMock(copy_records_to_table=copy),
+    )
+    monkeypatch.setattr("database.tortoise_db.in_transaction", MagicMock(return_value=nullcontext(connection)))
+
+    response = await client.post(BULK_URL, json=orders)
+    assert response.status_code == status.HTTP_200_OK
+    assert _statuses(response.json()[ROWS]) == [status.HTTP_409_CONFLICT, status.HTTP_201_CREATED]
+    copy.assert_awaited_once()
@@ -0,0 +1,51 @@
+import dataclasses
+from datetime import date, datetime
+
+from tortoise import timezone
+
+from commands.dataset import ORDER_COLUMNS, Dataset, DatasetSpec
+from database.models import OrderStatus
+from service.availability import SLOTS_PER_DAY, slot_of
+
+DOGS = 50
+WALKERS = 20
+ORDERS = 3000
+BATCH_SIZE = 256
+TODAY = date.fromisoformat("2030-01-07")
+SPEC = DatasetSpec(dogs=DOGS, walkers=WALKERS, orders=ORDERS, seed=7, today=TODAY)
+WALK_MINUTES = frozenset((0, 30))
+
+
+def _orders(spec: DatasetSpec, **batching) -> list:
+    return [row for batch in Dataset(spec).orders(**batching) for row in batch]
+
+
+def _column(orders: list, name: str) -> list:
+    index: int = ORDER_COLUMNS.index(name)
+    return [row[index] for row in orders]
+
+
+def test_generated_dataset_batches():
+    orders: list = _orders(SPEC, batch_size=BATCH_SIZE)
+    assert orders == _orders(SPEC)
+    assert len(orders) == ORDERS
+    assert set(_column(orders, "status")) >= {OrderStatus.success, OrderStatus.planned}
+    reseeded = Dataset(dataclasses.replace(SPEC, seed=8))
+    assert reseeded.dogs != Dataset(SPEC).dogs
+
+
+def test_generated_dataset_unique_slots():
+    orders: list = _orders(SPEC)
+    walks: list = _column(orders, "walk_at")
+    assert walks == sorted(walks)
+    for column in ("walker_id", "dog_id"):
+        booked: set = set(zip(walks, _column(orders, column)))
+        assert len(booked) == len(orders)
+
+
+def test_generated_dataset_walk_times():
+    for walk_at in set(_column(_orders(SPEC), "walk_at")):
+        local: datetime = timezone.make_naive(walk_at)
+        assert 0 <= slot_of(local)[1] < SLOTS_PER_DAY
+        assert local.minute in WALK_MINUTES
+        assert not local.second
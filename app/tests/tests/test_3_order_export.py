@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+EXPORT_URL = f"{test_settings.orders_url}export/"
+ID = "id"
+PLANNED = "Запланирована"
+STATUS = "status"
+# Characters of an ISO datetime up to its minutes.
+MINUTE_PRECISION = 16
+
+
+def _ndjson(response) -> list:
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _order_line(order_status: str, walk_at: str, **references: str) -> str:
+    return json.dumps({**references, STATUS: order_status, "walk_at": walk_at})
+
+
+def _rejected(report: dict) -> list:
+    return [(row["line"], row[STATUS]) for row in report["rejected_rows"]]
+
+
+@pytest.mark.asyncio
+async def test_export_orders(
+    client,
+    query_budget,
+    monkeypatch,
+):
+    monkeypatch.setattr("api.v1.order.order_batch.EXPORT_CHUNK_SIZE", 2)
+    response = await client.get(test_settings.orders_url, params={"count": "exact"})
+    total: int = response.json()["total_result"]
+    # One keyset statement per chunk of two rows, all of the same shape.
+    with query_budget(statements=total // 2 + 1, repeated=total // 2) as stats:
+        response = await client.get(EXPORT_URL)
+        assert stats.statements == total // 2 + 1
+    rows: list = _ndjson(response)
+    walks: list = [row["walk_at"] for row in rows]
+    assert len(rows) == total
+    assert len({row[ID] for row in rows}) == total
+    assert walks == sorted(walks)
+
+
+@pytest.mark.asyncio
+async def test_export_orders_csv(client):
+    response = await client.get(
+        EXPORT_URL,
+        params={"format": "csv", "walk_at_from": "2035-05-01 10:00", "walk_at_to": "2035-05-01 10:30"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    rows: list = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["walk_at"][:MINUTE_PRECISION] for row in rows] == ["2035-05-01T10:00", "2035-05-01T10:30"]
+    assert {row["dog_id"] for row in rows} == {fake_dog_data[1][ID]}
+    assert {row[STATUS] for row in rows} == {PLANNED}
+
+    response = await client.get(EXPORT_URL, params={STATUS: "Отменена"})
+    assert not response.text
+
+
+@pytest.mark.asyncio
+async def test_import_orders(client):
+    dog_id: str = fake_dog_data[1][ID]
+    planned: str = _order_line(PLANNED, "2036-06-01 10:00", dog=dog_id, walker=fake_walker_data[1][ID])
+    done: str = _order_line("Завершена", "2036-06-01 10:30", dog_id=dog_id, walker_id=fake_walker_data[1][ID])
+    response = await client.post(
+        f"{test_settings.orders_url}import/",
+        content="\n".join([planned, "", "{not json", planned, done]).encode(),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    report: dict = response.json()
+    assert (
+        report["received"],
+        report["imported"],
+        report["rejected"],
+    ) == (4, 2, 2)
+    assert _rejected(report) == [
+        (3, status.HTTP_400_BAD_REQUEST),
+        (4, status.HTTP_409_CONFLICT),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_walkers_csv(client):
+    response = await client.post(
+        f"{test_settings.walkers_url}import/",
+        params={"format": "csv"},
+        content="name,surname,active\r\nImported,Walker,false\r\nNo surname,,\r\n".encode(),
+    )
+    report: dict = response.json()
+    assert report["imported"] == 1
+    assert _rejected(report)[0] == (3, status.HTTP_422_UNPROCESSABLE_ENTITY)
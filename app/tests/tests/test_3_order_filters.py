@@ -0,0 +1,64 @@
+import pytest
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+ID = "id"
+ROWS = "result"
+DAY_START = "2036-06-01 00:00"
+DAY_END = "2036-06-01 23:30"
+# Walks booked on that day by the import, in order.
+BOOKED = ("2036-06-01T10:00", "2036-06-01T10:30")
+# Characters of an ISO datetime up to its minutes.
+MINUTE_PRECISION = 16
+
+
+async def _orders(client, **query) -> dict:
+    response = await client.get(
+        test_settings.orders_url,
+        params={"walk_at_from": DAY_START, "walk_at_to": DAY_END, "count": "exact", **query},
+    )
+    return response.json()
+
+
+def _walks(body: dict) -> tuple:
+    return tuple(row["walk_at"][:MINUTE_PRECISION] for row in body[ROWS])
+
+
+@pytest.mark.asyncio
+async def test_get_orders_by_walker(client):
+    walker_id: str = fake_walker_data[1][ID]
+    body: dict = await _orders(client, walker=walker_id)
+    assert body["total_result"] == 2
+    assert _walks(body) == BOOKED
+    assert {row["walker"][ID] for row in body[ROWS]} == {walker_id}
+
+
+@pytest.mark.asyncio
+async def test_get_orders_by_status_and_dog(client):
+    body: dict = await _orders(client, status="Завершена")
+    assert [row["status"] for row in body[ROWS]] == ["Завершена"]
+    body = await _orders(client, dog=fake_dog_data[0][ID])
+    assert not body[ROWS]
+
+
+@pytest.mark.asyncio
+async def test_get_orders_filtered_pages(client):
+    dog_id: str = fake_dog_data[1][ID]
+    first: dict = await _orders(client, dog=dog_id, size=1)
+    assert first["total_result"] == 2
+    second: dict = await _orders(client, dog=dog_id, size=1, cursor=first["next_cursor"])
+    assert _walks(first) + _walks(second) == BOOKED
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_orders_filter_validators(client):
+    # Every filter has its own validator.
+    unfiltered = await client.get(test_settings.orders_url)
+    filtered = await client.get(
+        test_settings.orders_url,
+        params={"walker": fake_walker_data[1][ID]},
+    )
+    assert unfiltered.headers["etag"] != filtered.headers["etag"]
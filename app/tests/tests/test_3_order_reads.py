@@ -0,0 +1,70 @@
+import pytest
+from fastapi import status
+
+from api.v1.dog.models import DogReturnModel
+from api.v1.order.models import OrderReturnModel
+from api.v1.walker.models import DogWalkerReturnModel
+from core.config import test_settings
+from database.models import OrderTable
+from database.queries import record_queries
+from models.paginated_params import PaginationResponse
+from tests.test_data.test_data_order import fake_order_data
+
+# The latest updates, the counts of dogs and dog walkers for the list validator,
+# one COUNT of orders and one SELECT joining dogs and dog walkers, whatever the page size.
+LIST_STATEMENTS = 5
+
+
+@pytest.mark.parametrize("size", [1, 10, 100])
+@pytest.mark.asyncio
+async def test_get_orders_statement_count(
+    client,
+    query_budget,
+    size: int,
+):
+    query: dict = {"size": size, "count": "exact"}
+    with query_budget(statements=LIST_STATEMENTS):
+        response = await client.get(test_settings.orders_url, params=query)
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    assert len(body["result"]) == min(size, body["total_result"])
+
+    next_cursor = body["next_cursor"] or body["prev_cursor"]
+    if next_cursor:
+        with query_budget(statements=LIST_STATEMENTS):
+            await client.get(test_settings.orders_url, params={**query, "cursor": next_cursor})
+
+
+@pytest.mark.parametrize(
+    "url, model",
+    [
+        (test_settings.dogs_url, DogReturnModel),
+        (test_settings.walkers_url, DogWalkerReturnModel),
+        (test_settings.orders_url, OrderReturnModel),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_body_matches_response_model(
+    client,
+    url: str,
+    model,
+):
+    response = await client.get(url, params={"size": 100})
+    assert response.headers["content-type"] == "application/json"
+    # The rows are serialized without the response model, the bytes must be the ones it would produce.
+    page = PaginationResponse[model].model_validate_json(response.content)
+    assert page.result
+    assert response.content == page.model_dump_json().encode()
+
+
+@pytest.mark.asyncio
+async def test_query_recorder_repeated_shapes(init_db):
+    order_ids: list = [order["id"] for order in fake_order_data]
+    with record_queries() as stats:
+        for order_id in order_ids:
+            await OrderTable.get(id=order_id)
+        assert stats.statements == len(order_ids)
+        assert stats.repeated == len(order_ids) - 1
+        repeated: dict[str, int] = stats.repeated_shapes()
+    assert list(repeated.values()) == [len(order_ids)]
+    assert all('WHERE "id"=?' in shape for shape in repeated)
@@ -0,0 +1,97 @@
+import uuid
+
+import pytest
+from fastapi import status
+
+from api.v1.walker.models import WalkerScheduleModel
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+SCHEDULE_DAY = "2036-06-01"
+ID = "id"
+SLOTS = "slots"
+# Half hour slots from 7:00 to 22:30.
+DAY_SLOTS = 32
+# The slot of the walk at 10:00.
+BOOKED_SLOT = 6
+CANCELLED = "Отменена"
+
+
+async def _schedule(client, walker_id: str):
+    return await client.get(
+        f"{test_settings.walkers_url}{walker_id}/schedule/",
+        params={"date": SCHEDULE_DAY},
+    )
+
+
+def _booked(schedule: dict) -> list:
+    return [slot for slot in schedule[SLOTS] if slot["order_id"]]
+
+
+@pytest.mark.asyncio
+async def test_walker_schedule(client):
+    response = await _schedule(client, fake_walker_data[1][ID])
+    assert response.status_code == status.HTTP_200_OK
+    schedule: dict = response.json()
+    walks: list = [slot["walk_at"] for slot in schedule[SLOTS]]
+    assert (schedule["booked"], len(walks)) == (2, DAY_SLOTS)
+    assert (walks[0], walks[-1]) == (
+        "2036-06-01T07:00:00Z",
+        "2036-06-01T22:30:00Z",
+    )
+    booked: list = _booked(schedule)
+    assert [slot["walk_at"] for slot in booked] == [
+        "2036-06-01T10:00:00Z",
+        "2036-06-01T10:30:00Z",
+    ]
+    assert {slot["dog"][ID] for slot in booked} == {
+        fake_dog_data[1][ID],
+    }
+
+
+@pytest.mark.asyncio
+async def test_walker_schedule_cached(
+    client,
+    query_budget,
+):
+    walker_id: str = fake_walker_data[1][ID]
+    response = await _schedule(client, walker_id)
+    # Sent without the response model, the body must still be the one the model renders.
+    schedule: dict = WalkerScheduleModel.model_validate_json(response.content).model_dump(mode="json")
+    with query_budget(statements=0):
+        assert (await _schedule(client, walker_id)).json() == schedule
+
+
+@pytest.mark.asyncio
+async def test_walker_schedule_order_write(client):
+    walker_id: str = fake_walker_data[1][ID]
+    response = await _schedule(client, walker_id)
+    order_id: str = _booked(response.json())[0]["order_id"]
+    # Writes to the orders of a cached schedule drop it.
+    response = await client.put(
+        f"{test_settings.orders_url}{order_id}/",
+        json={"dog": fake_dog_data[1][ID], "walker": walker_id, "status": CANCELLED},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    slots: list = (await _schedule(client, walker_id)).json()[SLOTS]
+    assert slots[BOOKED_SLOT]["status"] == CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_walker_schedule_dog_write(client):
+    walker_id: str = fake_walker_data[1][ID]
+    dog_url: str = "{0}{1}/".format(test_settings.dogs_url, fake_dog_data[1][ID])
+    dog: dict = (await client.get(dog_url)).json()
+    await _schedule(client, walker_id)
+    # Writes to the dogs of a cached schedule drop it.
+    await client.put(dog_url, json={**dog, "name": "Renamed"})
+    slots: list = (await _schedule(client, walker_id)).json()[SLOTS]
+    assert slots[BOOKED_SLOT]["dog"]["name"] == "Renamed"
+    await client.put(dog_url, json=dog)
+
+
+@pytest.mark.asyncio
+async def test_missing_walker_schedule(client):
+    response = await _schedule(client, str(uuid.uuid4()))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,91 @@
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_order import fake_order_data
+
+ID = "id"
+ROW_URL = "{0}{1}/"
+# Columns a dog is written with.
+DOG_FIELDS = ("apartment", "name", "breed")
+# Columns of an order holding the rows it references.
+REFERENCES = ("dog", "walker")
+ETAG = "etag"
+IF_NONE_MATCH = "If-None-Match"
+
+
+def _row_url(url: str, row: dict) -> str:
+    return ROW_URL.format(url, row[ID])
+
+
+def _dog(response) -> dict:
+    return response.json()["dog"]
+
+
+async def _cache_stats(client) -> dict:
+    response = await client.get("/cache-stats")
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()["orders"]
+
+
+@pytest.mark.asyncio
+async def test_get_single_order(
+    client,
+    query_budget,
+):
+    order: dict = fake_order_data[0]
+    with query_budget(statements=1):
+        response = await client.get(_row_url(test_settings.orders_url, order))
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = response.json()
+    referenced: dict = {key: body[key][ID] for key in REFERENCES}
+    assert referenced == {key: order[key] for key in REFERENCES}
+
+
+@pytest.mark.asyncio
+async def test_single_order_cache(
+    client,
+    query_budget,
+):
+    order_url: str = _row_url(test_settings.orders_url, fake_order_data[1])
+    await client.get(order_url)
+    with query_budget(statements=0):
+        response = await client.get(order_url)
+    assert response.status_code == status.HTTP_200_OK
+    assert (await _cache_stats(client))["hits"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_single_order_cache_invalidation(
+    client,
+    query_budget,
+):
+    order_url: str = _row_url(test_settings.orders_url, fake_order_data[1])
+    dog: dict = _dog(await client.get(order_url))
+    response = await client.put(
+        _row_url(test_settings.dogs_url, dog),
+        json={"apartment": 3, "name": "Renamed", "breed": dog["breed"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    with query_budget(statements=1):
+        response = await client.get(order_url)
+    assert _dog(response)["name"] == "Renamed"
+    assert (await _cache_stats(client))["invalidations"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_order_etag_follows_dog(client):
+    order_url: str = _row_url(test_settings.orders_url, fake_order_data[1])
+    response = await client.get(order_url)
+    etag: str = response.headers[ETAG]
+    dog: dict = _dog(response)
+    response = await client.get(order_url, headers={IF_NONE_MATCH: etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client.put(
+        _row_url(test_settings.dogs_url, dog),
+        json={key: dog[key] for key in DOG_FIELDS},
+    )
+    response = await client.get(order_url, headers={IF_NONE_MATCH: etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[ETAG] != etag
@@ -0,0 +1,84 @@
+from datetime import datetime
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+import pytest
+from fastapi import status
+from tortoise import timezone
+
+from core.config import test_settings
+from database.models import OrderStatus
+from service.transitions import StatusScheduler
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+ID = "id"
+STATUS = "status"
+WALKER = "walker"
+PLANNED = "Запланирована"
+CANCELLED = "Отменена"
+# More due orders than the batch size of the scheduler.
+RACED_WALKS = ("2037-07-07 10:00", "2037-07-07 10:30", "2037-07-07 11:00")
+# A run once every raced walk has started.
+RACED_RUN = timezone.make_aware(datetime.fromisoformat("2037-07-07 11:10"))
+
+
+class _RacedScheduler(StatusScheduler):
+    """
+    Scheduler whose first batch has an order changed between its SELECT and its UPDATE.
+    """
+
+    def __init__(self, change: Callable[[Any], Awaitable[None]], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.changed: list = []
+        self._change = change
+
+    async def _select_batch(self, source: OrderStatus, walk_before: datetime) -> list[Any]:
+        selected: list[Any] = await super()._select_batch(source, walk_before)
+        if selected and not self.changed:
+            self.changed.append(selected[0])
+            await self._change(selected[0])
+        return selected
+
+
+async def _create_order(client, walk_at: str) -> str:
+    response = await client.post(
+        test_settings.orders_url,
+        json={
+            "dog": fake_dog_data[0][ID],
+            WALKER: fake_walker_data[0][ID],
+            STATUS: PLANNED,
+            "walk_at": walk_at,
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()[ID]
+
+
+async def _status(client, order_id: str) -> str:
+    response = await client.get(f"{test_settings.orders_url}{order_id}/")
+    return response.json()[STATUS]
+
+
+async def _set_status(client, order_id: Any, order_status: str) -> None:
+    order_url: str = f"{test_settings.orders_url}{order_id}/"
+    order: dict = (await client.get(order_url)).json()
+    written: dict = {"dog": order["dog"][ID], STATUS: order_status}
+    if order[WALKER] is not None:
+        written[WALKER] = order[WALKER][ID]
+    response = await client.put(order_url, json=written)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_concurrent_change(client):
+    raced: list = [await _create_order(client, walk_at) for walk_at in RACED_WALKS]
+    scheduler = _RacedScheduler(partial(_set_status, client, order_status=CANCELLED), batch_size=2)
+    await scheduler.run_due(RACED_RUN)
+    changed: str = str(scheduler.changed[0])
+    # The order changed after the SELECT keeps the status its writer gave it.
+    assert await _status(client, changed) == CANCELLED
+    # Its batch moved one order less than it selected, the run still went on to the later batches.
+    statuses: set = {await _status(client, order_id) for order_id in raced if order_id != changed}
+    assert PLANNED not in statuses
+    await _set_status(client, changed, PLANNED)
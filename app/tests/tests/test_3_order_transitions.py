@@ -0,0 +1,112 @@
+import asyncio
+import math
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from tortoise import timezone
+
+from core.config import test_settings
+from database.events import write_events
+from database.locks import LocalLock, PostgresAdvisoryLock, create_lock
+from database.models import OrderStatus
+from service.transitions import StatusScheduler
+
+WALK_DAY = "2038-04-04 12:00"
+STARTED_WALK = "2038-04-04T12:00"
+UPCOMING_WALK = "2038-04-04T12:30"
+# Runs of the scheduler during the first walk and at the end of it.
+START_RUN = timezone.make_aware(datetime.fromisoformat("2038-04-04 12:10"))
+END_RUN = timezone.make_aware(datetime.fromisoformat("2038-04-04 12:30"))
+POLL_INTERVAL = 0.01
+# Long enough for schedulers polling every 10 ms to elect a leader.
+ELECTION_WAIT = 0.05
+
+
+async def _order_ids(client, walk_at: str) -> list:
+    response = await client.get(test_settings.orders_url, params={"walk_at_from": WALK_DAY})
+    orders: list = response.json()["result"]
+    return [order["id"] for order in orders if order["walk_at"].startswith(walk_at)]
+
+
+async def _statuses(client, order_ids: list) -> set:
+    statuses: set = set()
+    for order_id in order_ids:
+        response = await client.get(f"{test_settings.orders_url}{order_id}/")
+        statuses.add(response.json()["status"])
+    return statuses
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_start(
+    client,
+    query_budget,
+):
+    started: list = await _order_ids(client, STARTED_WALK)
+    upcoming: list = await _order_ids(client, UPCOMING_WALK)
+    events: list = []
+    write_events.subscribe(events.append)
+    # The number of moved orders is only known after the run, the bound is checked then.
+    with query_budget(repeated=math.inf) as stats:
+        moved: dict = await StatusScheduler(batch_size=2).run_due(START_RUN)
+        # A SELECT and an UPDATE per batch of two orders, plus the last batch of each transition.
+        assert stats.statements <= len(events) + 2 * len(moved)
+    write_events.unsubscribe(events.append)
+    assert moved[OrderStatus.in_progress] >= len(started)
+    # One event per moved order, none for a selected order that was not updated.
+    assert len(events) == sum(moved.values())
+    assert await _statuses(client, started) == {"В процессе"}
+    assert await _statuses(client, upcoming) == {"Запланирована"}
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_end(client):
+    started: list = await _order_ids(client, STARTED_WALK)
+    upcoming: list = await _order_ids(client, UPCOMING_WALK)
+    scheduler = StatusScheduler()
+    moved: dict = await scheduler.run_due(END_RUN)
+    assert moved[OrderStatus.success] >= len(started)
+    assert await _statuses(client, started) == {"Завершена"}
+    assert await _statuses(client, upcoming) == {"В процессе"}
+
+
+@pytest.mark.asyncio
+async def test_status_scheduler_leader():
+    schedulers: list = [StatusScheduler(max_sleep=POLL_INTERVAL) for _ in range(3)]
+    for started in schedulers:
+        await started.start(LocalLock(1))
+    await asyncio.sleep(ELECTION_WAIT)
+    leaders: list = [leader for leader in schedulers if leader.is_leader]
+    assert len(leaders) == 1
+
+    await leaders[0].stop()
+    await asyncio.sleep(ELECTION_WAIT)
+    assert len([leader for leader in schedulers if leader.is_leader]) == 1
+    for stopped in schedulers:
+        await stopped.stop()
+
+
+@pytest.mark.asyncio
+async def test_advisory_lock(monkeypatch):
+    connection = MagicMock(is_closed=MagicMock(return_value=False), close=AsyncMock())
+    connection.fetchval = AsyncMock(side_effect=[True, False])
+    connect = AsyncMock(return_value=connection)
+    monkeypatch.setattr("database.locks.asyncpg.connect", connect)
+    lock = create_lock("asyncpg://app:secret@db:5432/dogs", 1)
+    assert isinstance(lock, PostgresAdvisoryLock)
+
+    assert await lock.try_acquire()
+    # Held locks are not asked for again.
+    assert await lock.try_acquire()
+    connect.assert_awaited_once_with("postgresql://app:secret@db:5432/dogs")
+    connection.fetchval.assert_awaited_once_with("SELECT pg_try_advisory_lock($1)", 1)
+
+    await lock.release()
+    connection.close.assert_awaited_once()
+    assert not await lock.try_acquire()
+    assert connect.await_count == 2
+
+
+def test_leader_lock_needs_shared_database():
+    assert create_lock("sqlite://db.sqlite3", 1) is None
+    assert isinstance(create_lock("sqlite://db.sqlite3", 1, single_process=True), LocalLock)
@@ -0,0 +1,76 @@
+import uuid
+
+import pytest
+from fastapi import status
+
+from core.config import test_settings
+from tests.test_data.test_data_dog import fake_dog_data
+from tests.test_data.test_data_order import fake_order_data
+from tests.test_data.test_data_walker import fake_walker_data
+
+ID = "id"
+ROW_URL = "{0}{1}/"
+IN_PROGRESS = "В процессе"
+
+
+def _dog(apartment: int) -> dict:
+    return {"apartment": apartment, "name": "Single", "breed": "Statement"}
+
+
+def _in_progress(walker_id: str) -> dict:
+    return {"dog": fake_dog_data[2][ID], "walker": walker_id, "status": IN_PROGRESS}
+
+
+@pytest.mark.asyncio
+async def test_dog_writes_single_statement(
+    client,
+    query_budget,
+):
+    # One INSERT, one UPDATE and one DELETE.
+    with query_budget(statements=3) as stats:
+        response = await client.post(test_settings.dogs_url, json=_dog(7))
+        dog_url: str = ROW_URL.format(test_settings.dogs_url, response.json()[ID])
+        response = await client.put(dog_url, json=_dog(8))
+        assert response.status_code == status.HTTP_200_OK
+        response = await client.delete(dog_url)
+        assert stats.statements == 3
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_missing_dog_writes(client):
+    dog_url: str = ROW_URL.format(test_settings.dogs_url, uuid.uuid4())
+    response = await client.put(dog_url, json=_dog(8))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await client.delete(dog_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_order_missing_reference(client):
+    response = await client.post(
+        test_settings.orders_url,
+        json={
+            "dog": str(uuid.uuid4()),
+            "walker": fake_walker_data[0][ID],
+            "status": "Запланирована",
+            "walk_at": "2036-01-01 10:00",
+        },
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Dog with such id does not exist"
+
+
+@pytest.mark.asyncio
+async def test_update_order_missing_reference(client):
+    order_url: str = ROW_URL.format(test_settings.orders_url, fake_order_data[2][ID])
+    walker_id: str = fake_walker_data[1][ID]
+    response = await client.put(
+        order_url,
+        json=_in_progress(str(uuid.uuid4())),
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await client.put(order_url, json=_in_progress(walker_id))
+    assert response.status_code == status.HTTP_200_OK
+    body: dict = (await client.get(order_url)).json()
+    assert (body["status"], body["walker"][ID]) == (IN_PROGRESS, walker_id)
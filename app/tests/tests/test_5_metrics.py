@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import uuid
+
+from fastapi import status
+from prometheus_client import multiprocess
+from prometheus_client.parser import text_string_to_metric_families
+import pytest
+
+from core.config import test_settings
+
+GET = "GET"
+METRICS_URL = "/metrics"
+RESPONSES = "http_responses_total"
+NOT_FOUND = "404"
+WORKER_QUERIES = ("db_query_duration_seconds_count", (("method", "fetch_rows"), ("repository", "orders")))
+WORKER_IN_PROGRESS = ("http_requests_in_progress", (("method", GET), ("route", "/")))
+# Run in separate processes sharing the multiprocess directory.
+WORKER = """
+from core.metrics import QUERY_DURATION, REQUESTS_IN_PROGRESS
+QUERY_DURATION.labels('orders', 'fetch_rows').observe(0.01)
+REQUESTS_IN_PROGRESS.labels('GET', '/').inc()
+"""
+SCRAPER = """
+from core.metrics import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+
+def samples(exposition: str) -> dict:
+    return {
+        sample_key(sample.name, **sample.labels): sample.value
+        for family in text_string_to_metric_families(exposition)
+        for sample in family.samples
+    }
+
+
+def sample_key(name: str, **labels: str) -> tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+async def scrape(client) -> str:
+    response = await client.get(METRICS_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    return response.text
+
+
+def scrape_processes(environment: dict) -> dict:
+    command: list[str] = [sys.executable, "-c", SCRAPER]
+    scraper = subprocess.run(command, env=environment, check=True, capture_output=True)
+    return samples(scraper.stdout.decode())
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    dog_id: uuid.UUID = uuid.uuid4()
+    await client.get(test_settings.dogs_url)
+    await client.get(f"{test_settings.dogs_url}{dog_id}/")
+    await client.get("/missing")
+
+    exposition: str = await scrape(client)
+    scraped: dict = samples(exposition)
+    single: str = f"{test_settings.dogs_url}{{dog_id}}/"
+    assert scraped[sample_key(RESPONSES, method=GET, route=single, status=NOT_FOUND)] >= 1
+    assert scraped[sample_key(RESPONSES, method=GET, route="unmatched", status=NOT_FOUND)] >= 1
+    assert str(dog_id) not in exposition
+
+
+@pytest.mark.asyncio
+async def test_metrics_durations(client):
+    await client.get(test_settings.dogs_url)
+    await client.get(f"{test_settings.dogs_url}{uuid.uuid4()}/")
+
+    scraped: dict = samples(await scrape(client))
+    durations: tuple = sample_key("http_request_duration_seconds_count", method=GET, route=test_settings.dogs_url)
+    queries: tuple = sample_key("db_query_duration_seconds_count", method="fetch_single_row", repository="dogs")
+    assert scraped[durations] >= 1
+    assert scraped[sample_key("http_requests_in_progress", method=GET, route=METRICS_URL)] == 1
+    assert scraped[queries] >= 1
+
+
+def test_metrics_multiprocess(tmp_path):
+    environment: dict = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    workers: list[subprocess.Popen] = [
+        subprocess.Popen([sys.executable, "-c", WORKER], env=environment) for _ in range(2)
+    ]
+    assert [process.wait() for process in workers] == [0, 0]
+
+    scraped: dict = scrape_processes(environment)
+    assert scraped[WORKER_QUERIES] == 2
+    assert scraped[WORKER_IN_PROGRESS] == 2
+
+    # What the gunicorn child_exit hook does, live gauges stop counting the exited workers.
+    for worker in workers:
+        multiprocess.mark_process_dead(worker.pid, str(tmp_path))
+    scraped = scrape_processes(environment)
+    assert scraped[WORKER_QUERIES] == 2
+    assert WORKER_IN_PROGRESS not in scraped
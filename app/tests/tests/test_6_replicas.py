@@ -0,0 +1,96 @@
+import uuid
+
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from pytest_asyncio import fixture
+import pytest
+
+from core.config import test_settings
+from database.cache import CachedDatabase
+from database.models import DogTable
+from database.replicas import READ_PRIMARY_COOKIE, ReplicaRouter, read_replicas
+from database.tortoise_db import DogDatabase
+from tests.test_data.test_data_dog import fake
+
+FIRST_REPLICA = "replica_0"
+SECOND_REPLICA = "replica_1"
+# Enough for every dog of the session on one page.
+PAGE_SIZE = 100
+NOT_FOUND = str(status.HTTP_404_NOT_FOUND)
+
+
+async def create_dog(client) -> str:
+    dog: dict = {"apartment": 7, "name": fake.first_name(), "breed": fake.last_name()}
+    response = await client.post(test_settings.dogs_url, json=dog)
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+async def listed_dogs(client, **kwargs) -> set:
+    response = await client.get(test_settings.dogs_url, params={"size": PAGE_SIZE}, **kwargs)
+    return {row["id"] for row in response.json()["result"]}
+
+
+@fixture
+async def replica_reads(init_db):
+    """Route reads to the second session database, which never receives the writes of the primary"""
+    read_replicas.configure(["replica"])
+    yield
+    read_replicas.configure(())
+
+
+def test_replica_round_robin():
+    router = ReplicaRouter()
+    assert router.pick() is None
+    assert router.connection() is None
+
+    router.configure([FIRST_REPLICA, SECOND_REPLICA])
+    picked: list = [router.pick() for _ in range(4)]
+    assert picked == [FIRST_REPLICA, SECOND_REPLICA, FIRST_REPLICA, SECOND_REPLICA]
+    with router.pinned() as name:
+        assert name == FIRST_REPLICA
+        with router.primary():
+            assert router.connection() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("replica_reads")
+async def test_reads_go_to_replica(client):
+    dog_id: str = await create_dog(client)
+    assert READ_PRIMARY_COOKIE in client.cookies
+
+    # The cookie of the write sends the next reads of this client to the primary.
+    assert dog_id in await listed_dogs(client)
+    client.cookies.clear()
+    assert dog_id not in await listed_dogs(client)
+    assert dog_id in await listed_dogs(client, headers={"X-Read-Primary": "1"})
+
+    response = await client.delete(f"{test_settings.dogs_url}{dog_id}/")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("replica_reads")
+async def test_single_row_reads(client):
+    dog_id = uuid.UUID(await create_dog(client))
+    database = DogDatabase(DogTable)
+    with read_replicas.pinned():
+        with pytest.raises(HTTPException, match=NOT_FOUND):
+            await database.fetch_single_row(dog_id)
+        assert not await database.fetch_rows([dog_id])
+    with read_replicas.primary():
+        rows: list = await database.fetch_rows([dog_id])
+        assert [row["id"] for row in rows] == [dog_id]
+    await database.delete_row(dog_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("replica_reads")
+async def test_cached_reads_from_primary(client):
+    dog_id = uuid.UUID(await create_dog(client))
+    database = DogDatabase(DogTable)
+    with read_replicas.pinned():
+        # The row cache fills from the primary, a lagging replica must not bring back an old row.
+        row = await CachedDatabase(database, "dogs").fetch_single_row(dog_id)
+        assert row.id == dog_id
+    await database.delete_row(dog_id)
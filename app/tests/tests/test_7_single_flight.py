@@ -0,0 +1,98 @@
+import asyncio
+import uuid
+
+from fastapi import status
+import pytest
+
+from core.config import test_settings
+from database.events import WriteAction, WriteEvent
+from service.single_flight import FlightStats, SingleFlight, read_flights
+
+TABLE = "dogs"
+READ = "list"
+CONCURRENT_READS = 10
+
+
+class GatedCall:
+    """Read waiting for its gate, then returning the numbers of its calls or raising its error"""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.gate = asyncio.Event()
+        self.calls: list[int] = []
+        self.error = error
+
+    async def __call__(self) -> list[int]:
+        self.calls.append(len(self.calls))
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+def start(flights: SingleFlight, call: GatedCall, key: int = 1) -> asyncio.Future:
+    return asyncio.ensure_future(flights.run(TABLE, READ, key, call))
+
+
+async def read_walkers(client) -> set:
+    reads = (client.get(test_settings.walkers_url) for _ in range(CONCURRENT_READS))
+    responses: list = await asyncio.gather(*reads)
+    distinct: set = set()
+    for response in responses:
+        distinct.add((response.status_code, response.headers["etag"], response.content))
+    return distinct
+
+
+def reads_since(before: FlightStats) -> tuple[int, int]:
+    after: FlightStats = read_flights.stats
+    coalesced: int = after.coalesced - before.coalesced
+    return after.calls - before.calls + coalesced, coalesced
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_calls():
+    flights = SingleFlight()
+    call = GatedCall()
+    readers: list[asyncio.Future] = [start(flights, call) for _ in range(5)]
+    other = start(flights, call, key=2)
+    await asyncio.sleep(0)
+    assert flights.stats == (2, 4, 2)
+
+    # The reader that started the call goes away, the others still get its result.
+    readers[0].cancel()
+    call.gate.set()
+    shared: list = await asyncio.gather(*readers[1:], other)
+    assert all(calls is call.calls for calls in shared)
+    assert call.calls == [0, 1]
+    assert flights.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_write_and_error():
+    flights = SingleFlight()
+    call = GatedCall(LookupError("missing"))
+    first = start(flights, call)
+    await asyncio.sleep(0)
+    # A read after a write never joins a call started before it.
+    flights.on_write(WriteEvent("dogs", WriteAction.update, uuid.uuid4(), {}))
+    later: list[asyncio.Future] = [start(flights, call) for _ in range(2)]
+    await asyncio.sleep(0)
+    call.gate.set()
+    for reader in (first, *later):
+        with pytest.raises(LookupError):
+            await reader
+    assert flights.stats == (2, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_list_reads_coalesced(client):
+    before: FlightStats = read_flights.stats
+    # Every reader gets the same status, ETag and body.
+    distinct: set = await read_walkers(client)
+    assert len(distinct) == 1
+    assert distinct.pop()[0] == status.HTTP_200_OK
+    reads, coalesced = reads_since(before)
+    assert reads == CONCURRENT_READS
+    assert coalesced >= 1
+
+    response = await client.get("/metrics")
+    assert 'single_flight_coalesced_total{read="list",table="dog_walkers"}' in response.text
@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.exceptions import ResponseValidationError
+import pytest
+
+from api.v1.dog.models import DogReturnModel
+from api.v1.order.models import OrderReturnModel
+from api.v1.projection import model_shape, project
+from api.v1.walker.models import DogWalkerReturnModel, ScheduleSlotModel
+
+WALK_AT = datetime.fromisoformat("2024-01-01T07:00")
+DOG = DogReturnModel(id=uuid4(), apartment=1, name="Rex", breed="Mutt")
+WALKER = DogWalkerReturnModel(id=uuid4(), name="Ann", surname="Lee").model_dump()
+
+
+def test_projection_nullable_nested_model():
+    slot: dict = ScheduleSlotModel(walk_at=WALK_AT).model_dump()
+    assert project(slot, model_shape(ScheduleSlotModel)) == slot
+
+    # Nested rows are restricted to their model fields too.
+    booked: dict = {**slot, "dog": {**DOG.model_dump(), "updated": WALK_AT}}
+    assert project(booked, model_shape(ScheduleSlotModel)) == {**slot, "dog": DOG.model_dump()}
+
+
+def test_projection_missing_required_nested_model():
+    order: dict = {"id": uuid4(), "walk_at": WALK_AT, "dog": None, "walker": WALKER, "status": "new"}
+    with pytest.raises(ResponseValidationError):
+        project(order, model_shape(OrderReturnModel))